@@ -1,7 +1,9 @@
 """ Processes Assmembly data."""
 import csv
 import os
-from tkinter import messagebox
+
+# The assembly file, in the working folder.
+ASSEMBLY_FILE = 'assembly.csv'
 
 class AssemblyInfo:
     """ 
@@ -15,7 +17,7 @@ class AssemblyInfo:
 
     def load_assembly(self):
         """Load assembly data from CSV file"""
-        csv_file = 'assembly.csv'
+        csv_file = ASSEMBLY_FILE
         if os.path.exists(csv_file):
             with open(csv_file, 'r') as f:
                 reader = csv.DictReader(f)
@@ -28,7 +30,7 @@ class AssemblyInfo:
     
     def create_default_assembly_csv(self):
         """Create default assembly.csv"""
-        with open('assembly.csv', 'w', newline='') as f:
+        with open(ASSEMBLY_FILE, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['Field', 'Value'])
             writer.writerow(['Assembly Name', 'Add Name'])
@@ -36,15 +38,8 @@ class AssemblyInfo:
     
     def save_assembly(self):
         """Save current assembly data back to CSV"""
-        with open('assembly.csv', 'w', newline='') as f:
+        with open(ASSEMBLY_FILE, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['Field', 'Value'])
             for field, value in self.assembly_info.items():
                 writer.writerow([field, value])
-    
-    def revise_assembly(self):
-        """Reload assembly info from CSV"""
-        messagebox.showinfo("Revise Assembly Info", "Revise the assembly information in the assembly.csv file and click OK. Close and reload Minutes Editor.")
-        self.load_assembly()
-        print("Assembly info reloaded from CSV")
-
@@ -0,0 +1,242 @@
+"""
+    Attendance across the whole archive.
+    The officers' attendance is in the Roll Call of each meeting and the
+    members are listed one per line in Other Attendees, so a question like
+    "who has missed the most meetings" means opening every meeting file.
+
+    AttendanceStore reads the meeting files once, in parallel, into a
+    meetings x people NumPy array of attendance codes. Each name is kept
+    once, however many meetings it appears in. The rates, streaks and
+    trends are worked out from the array, and report() describes them as
+    a MinutesDocument so they can be written as Word, HTML, Markdown or
+    text like the minutes (see document_ir.py).
+
+    numpy is only needed here, not by the editor.
+"""
+import collections
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import catalog
+import document_ir
+import schema
+import serializer
+
+# The attendance codes in the array.
+NOT_RECORDED, PRESENT, ABSENT, EXCUSED = range(4)
+CODES = {'Present': PRESENT, 'Absent': ABSENT, 'Excused': EXCUSED}
+
+# The trend compares the rate over the last meetings with the rate over all meetings.
+TREND_MEETINGS = 12
+
+# Meeting files read by a worker process at a time.
+CHUNK_SIZE = 32
+
+# Rates, streaks and trend of one person, see AttendanceStore.summaries.
+PersonSummary = collections.namedtuple(
+    'PersonSummary', 'name office meetings present excused rate longest_streak current_streak recent_rate')
+
+
+def clean_name(name):
+    """Tidy a name as typed so that the same person is found in every meeting."""
+    return ' '.join(name.lstrip('-*• \t').split())
+
+
+def read_meeting(path):
+    """
+    Read the attendance of one meeting. Runs inside a worker process.
+    Input: the meeting file path
+    Output: (ISO date or None, list of (name, code, office or '')); the members come first
+    """
+    editor_data = serializer.load_file(path)
+    meeting_day = catalog.parse_meeting_date(editor_data.get('Meeting Info', {}).get('Meeting Date', ''))
+    people = []
+    for line in editor_data.get('attendees', '').split('\n'):
+        name = clean_name(line)
+        if name:
+            people.append((name, PRESENT, ''))
+    for office in schema.OFFICES:
+        officer = editor_data.get('officers', {}).get(office, {})
+        name = clean_name(officer.get('name', ''))
+        if name:
+            people.append((name, CODES.get(officer.get('attendance', ''), NOT_RECORDED), office))
+    return meeting_day, people
+
+
+def read_meeting_or_error(path):
+    """
+    read_meeting for the worker processes, which must not stop the report for one bad file.
+    Output: (ISO date or None, people, None), or (None, [], the error as text) if the file cannot be read as a meeting
+    """
+    try:
+        meeting_day, people = read_meeting(path)
+    except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+        # the text, as an error from a parser may not survive the trip back from the worker
+        return None, [], str(e) or type(e).__name__
+    return meeting_day, people, None
+
+
+class AttendanceStore:
+    """
+    The attendance of every person at every meeting.
+        meeting_days        the ISO date of each meeting, in order
+        names               each person once
+        offices[person]     the last office the person held, '' for members
+        codes[meeting, person]  NOT_RECORDED, PRESENT, ABSENT or EXCUSED
+    """
+
+    def __init__(self, meetings):
+        """
+        Input: list of (ISO date, list of (name, code, office)) in meeting order, as read by read_meeting
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ValueError("Attendance reports need the numpy package.")
+        self.numpy = numpy
+        self.meeting_days = [meeting_day for meeting_day, people in meetings]
+        self.names = []
+        self.offices = []
+        self.failures = []          # (path, error) of the meeting files that could not be read, see from_files
+        columns = {}
+        rows, people_columns, values = [], [], []
+        for row, (meeting_day, people) in enumerate(meetings):
+            for name, code, office in people:
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = len(self.names)
+                    self.names.append(sys.intern(name))
+                    self.offices.append('')
+                if office:
+                    self.offices[column] = office
+                rows.append(row)
+                people_columns.append(column)
+                values.append(code)
+        self.codes = numpy.zeros((len(meetings), len(self.names)), dtype=numpy.uint8)
+        # the officers follow the members in each meeting, so the Roll Call wins when a name is in both
+        self.codes[rows, people_columns] = values
+
+    @classmethod
+    def from_files(cls, paths, jobs=None):
+        """
+        Read the meeting files with worker processes, ordered by Meeting Date.
+        The files that cannot be read as meetings are left out and listed in failures.
+        Output: (the AttendanceStore, the number of meetings left out because their date cannot be read)
+        """
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1:
+            read = list(map(read_meeting_or_error, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                read = list(executor.map(read_meeting_or_error, paths, chunksize=CHUNK_SIZE))
+        failures = [(path, error) for path, (meeting_day, people, error) in zip(paths, read) if error is not None]
+        meetings = sorted(((meeting_day, people) for meeting_day, people, error in read if meeting_day),
+                          key=lambda meeting: meeting[0])
+        store = cls(meetings)
+        store.failures = failures
+        return store, len(read) - len(meetings) - len(failures)
+
+    def nbytes(self):
+        """The memory used by the array and the names."""
+        return self.codes.nbytes + sum(sys.getsizeof(name) for name in self.names)
+
+    def first_meetings(self):
+        """The row of the first meeting each person appears in."""
+        return (self.codes != NOT_RECORDED).argmax(axis=0)
+
+    def streaks(self):
+        """
+        The runs of meetings attended in a row. Needs at least one meeting.
+        Output: (the longest run of each person, the run that ends at the last meeting)
+        """
+        numpy = self.numpy
+        present = (self.codes == PRESENT).astype(numpy.int32)
+        attended = present.cumsum(axis=0)
+        # the count at the last meeting missed, carried down the column
+        missed = numpy.maximum.accumulate(numpy.where(present == 0, attended, 0), axis=0)
+        runs = attended - missed
+        return runs.max(axis=0), runs[-1]
+
+    def summaries(self):
+        """
+        The rates, streaks and trend of every person. A person's rate counts
+        the meetings from the first one they appear in.
+        Output: list of PersonSummary, officers first, then by name
+        """
+        numpy = self.numpy
+        if not self.names:
+            return []
+        meetings = len(self.meeting_days) - self.first_meetings()
+        present = (self.codes == PRESENT).sum(axis=0)
+        excused = (self.codes == EXCUSED).sum(axis=0)
+        recent_meetings = numpy.minimum(meetings, TREND_MEETINGS)
+        recent_present = (self.codes[-TREND_MEETINGS:] == PRESENT).sum(axis=0)
+        longest, current = self.streaks()
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            rates = numpy.where(meetings > 0, present / meetings, 0.0)
+            recent_rates = numpy.where(recent_meetings > 0, recent_present / recent_meetings, 0.0)
+
+        summaries = [PersonSummary(name, office, int(meetings[column]), int(present[column]), int(excused[column]),
+                                   float(rates[column]), int(longest[column]), int(current[column]),
+                                   float(recent_rates[column]))
+                     for column, (name, office) in enumerate(zip(self.names, self.offices))]
+        office_order = {office: number for number, office in enumerate(schema.OFFICES)}
+        summaries.sort(key=lambda summary: (summary.office == '', office_order.get(summary.office, 0), summary.name))
+        return summaries
+
+    def yearly(self):
+        """
+        Attendance by year.
+        Output: list of (year, meetings, officer attendance rate, average members present)
+        """
+        numpy = self.numpy
+        years = numpy.array([int(meeting_day[:4]) for meeting_day in self.meeting_days], dtype=numpy.int32)
+        officers = numpy.array([office != '' for office in self.offices], dtype=bool)
+        officer_codes = self.codes[:, officers]
+        member_present = (self.codes[:, ~officers] == PRESENT).sum(axis=1)
+        rows = []
+        for year in numpy.unique(years):
+            in_year = years == year
+            recorded = (officer_codes[in_year] != NOT_RECORDED).sum()
+            attended = (officer_codes[in_year] == PRESENT).sum()
+            rows.append((int(year), int(in_year.sum()), attended / recorded if recorded else 0.0,
+                         float(member_present[in_year].mean())))
+        return rows
+
+    def report(self, assembly_info):
+        """Describe the attendance as a MinutesDocument, see document_ir.py."""
+        title = f"Knights of Columbus {assembly_info['Assembly Name']} {assembly_info['Assembly Number']} Attendance"
+        minutes = document_ir.MinutesDocument(title)
+        minutes.start_section('Title')
+        minutes.heading(title, 1, centered=True)
+        if self.meeting_days:
+            minutes.paragraph(f"{len(self.meeting_days)} meetings from {self.meeting_days[0]} to {self.meeting_days[-1]}",
+                              centered=True)
+
+        summaries = self.summaries()
+        header = ('Name', 'Office', 'Meetings', 'Present', 'Excused', 'Rate', 'Longest Streak', 'Current Streak',
+                  f'Last {TREND_MEETINGS}', 'Trend')
+        for section_name, people in (('Officers', [s for s in summaries if s.office]),
+                                     ('Members', [s for s in summaries if not s.office])):
+            minutes.start_section(section_name)
+            minutes.heading(section_name, 2)
+            if not people:
+                minutes.paragraph(f"No {section_name.lower()} recorded.")
+                continue
+            minutes.table([header] + [(s.name, s.office, str(s.meetings), str(s.present), str(s.excused),
+                                       f"{s.rate:.0%}", str(s.longest_streak), str(s.current_streak),
+                                       f"{s.recent_rate:.0%}", _trend(s.recent_rate - s.rate)) for s in people])
+
+        minutes.start_section('Years')
+        minutes.heading("By Year", 2)
+        minutes.table([('Year', 'Meetings', 'Officers Present', 'Members Present')] +
+                      [(str(year), str(meetings), f"{officer_rate:.0%}", f"{members:.1f}")
+                       for year, meetings, officer_rate, members in self.yearly()])
+        return minutes
+
+
+def _trend(change):
+    """Show a change of rate, e.g. 0.15 -> '+15%'. Changes under 5 points are shown as steady."""
+    if abs(change) < 0.05:
+        return 'steady'
+    return f"{change:+.0%}"
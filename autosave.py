@@ -0,0 +1,120 @@
+"""
+    Background autosave for the Minutes Editor.
+    After the editor has been idle for a while the meeting is copied and
+    written by a background thread, so a slow disk or network folder
+    never freezes the window. A burst of edits produces one write.
+"""
+import copy
+import queue
+import threading
+
+# Save after the editor has been idle this long.
+AUTOSAVE_IDLE_MS = 2000
+
+# How often the window checks for finished saves.
+POLL_MS = 100
+
+
+class AutoSaver:
+    """ Saves a snapshot of editor_data on a background thread."""
+
+    def __init__(self, root, file_mgr, get_snapshot, on_saved, on_status, idle_ms=AUTOSAVE_IDLE_MS):
+        """
+        Input: the Tk root, the FileManager, a function returning (editor_data, edit marker),
+        a function called with (file, marker) after a save, a function showing a status message,
+        the idle time in milliseconds
+        """
+        self.root = root
+        self.file_mgr = file_mgr
+        self.get_snapshot = get_snapshot
+        self.on_saved = on_saved
+        self.on_status = on_status
+        self.idle_ms = idle_ms
+
+        self._after_id = None
+        self._poll_id = None
+        self._pending = None                # the newest snapshot waiting to be written
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._results = queue.Queue()
+        self._in_flight = 0
+        self._thread = threading.Thread(target=self._run, name='autosave', daemon=True)
+        self._thread.start()
+
+    def touch(self):
+        """Restart the idle timer. Called after every edit."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(self.idle_ms, self.save_now)
+
+    def save_now(self):
+        """Snapshot the meeting now and hand it to the background thread."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+        file_path = self.file_mgr.current_file
+        if not file_path:
+            self.on_status("Not autosaved: the meeting has no file yet. Use Save As.")
+            return
+
+        editor_data, marker = self.get_snapshot()
+        snapshot = copy.deepcopy(editor_data)
+        with self._lock:
+            # a snapshot that has not been written yet is replaced, not queued
+            if self._pending is None:
+                self._in_flight += 1
+            self._pending = (file_path, snapshot, marker)
+        self._wakeup.set()
+        self.on_status(f"Autosaving {file_path}...")
+        if self._poll_id is None:
+            self._poll_id = self.root.after(POLL_MS, self._poll)
+
+    def cancel(self):
+        """
+        Forget the idle timer and any snapshot not yet being written.
+        Called before a manual save, so an older autosave cannot overwrite it.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        with self._lock:
+            if self._pending is not None:
+                self._pending = None
+                self._in_flight -= 1
+
+    def _run(self):
+        """The background thread: write the newest snapshot, then wait."""
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                job = self._pending
+                self._pending = None
+                self._wakeup.clear()
+            if job is None:
+                continue
+            file_path, snapshot, marker = job
+            try:
+                self.file_mgr.autosave_meeting(snapshot, file_path)
+                self._results.put((file_path, marker, None))
+            except Exception as e:
+                self._results.put((file_path, marker, e))
+
+    def _poll(self):
+        """Report finished saves on the Tk thread."""
+        self._poll_id = None
+        while True:
+            try:
+                file_path, marker, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._in_flight -= 1
+            if error is None:
+                self.on_saved(file_path, marker)
+                self.on_status(f"Autosaved {file_path}")
+            else:
+                print(f"Error autosaving {file_path}: {error}")
+                self.on_status(f"Autosave failed: {error}")
+        if self._in_flight > 0:
+            self._poll_id = self.root.after(POLL_MS, self._poll)
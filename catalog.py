@@ -0,0 +1,230 @@
+"""
+    Catalog of the meeting files.
+    Keeps the main fields of every saved meeting in an SQLite database
+    so questions about the whole archive can be answered without
+    opening each JSON file.
+"""
+import glob
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import schema
+import serializer
+
+CATALOG_FILE = 'catalog.db'
+
+# Date formats the scribes have used for the Meeting Date.
+DATE_FORMATS = ('%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d', '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%m-%d-%Y')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL,
+    meeting_date TEXT,
+    meeting_day TEXT,
+    start_time TEXT,
+    adjourned_at TEXT,
+    next_business_meeting TEXT
+);
+CREATE INDEX IF NOT EXISTS meetings_by_day ON meetings(meeting_day);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    meeting_id INTEGER NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+    office TEXT NOT NULL,
+    name TEXT,
+    attendance TEXT,
+    PRIMARY KEY (meeting_id, office)
+);
+CREATE INDEX IF NOT EXISTS attendance_by_name ON attendance(name);
+
+CREATE TABLE IF NOT EXISTS motions (
+    meeting_id INTEGER PRIMARY KEY REFERENCES meetings(id) ON DELETE CASCADE,
+    corrections TEXT,
+    motion_by TEXT,
+    seconded_by TEXT,
+    approval TEXT
+);
+CREATE INDEX IF NOT EXISTS motions_by_motion ON motions(motion_by);
+CREATE INDEX IF NOT EXISTS motions_by_second ON motions(seconded_by);
+
+CREATE TABLE IF NOT EXISTS balances (
+    meeting_id INTEGER NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+    fund TEXT NOT NULL,
+    start_balance TEXT,
+    receipts TEXT,
+    deposits TEXT,
+    disbursements TEXT,
+    end_balance TEXT,
+    PRIMARY KEY (meeting_id, fund)
+);
+CREATE INDEX IF NOT EXISTS balances_by_fund ON balances(fund, meeting_id);
+"""
+
+
+def parse_meeting_date(text):
+    """
+    Convert a Meeting Date as typed into an ISO date.
+    Input: the Meeting Date text
+    Output: 'YYYY-MM-DD', or None if the date cannot be read
+    """
+    text = (text or '').strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _year_range(year):
+    """Return the ISO date bounds of a year, for index friendly comparisons."""
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+
+
+class MeetingCatalog:
+    """ An SQLite index of the meeting files."""
+
+    def __init__(self, db_file=CATALOG_FILE):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('PRAGMA foreign_keys=ON')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    # Updating the catalog
+    def update(self, file_path, editor_data):
+        """
+        Add or replace one meeting in the catalog.
+        Input: the meeting file path, the editor data dictionary
+        """
+        with self._lock, self.connection:
+            self._store(os.path.abspath(file_path), editor_data)
+
+    def rebuild(self, directory):
+        """
+        Index every meeting file in a folder in one transaction.
+        Meetings from that folder that no longer exist are removed; its subfolders are left alone.
+        Input: the folder
+        Output: (number indexed, list of (path, error) for unreadable files)
+        """
+        directory = os.path.abspath(directory)
+        paths = sorted(path for path in glob.glob(os.path.join(directory, '*'))
+                       if serializer.is_meeting_file(path))
+        failures = []
+        indexed = 0
+        prefix = os.path.join(directory, '')
+        with self._lock, self.connection:
+            # the paths that start with the folder, without the ones in its subfolders
+            self.connection.execute("DELETE FROM meetings WHERE path >= ? AND path < ? AND instr(substr(path, ?), ?) = 0",
+                                    (prefix, directory + chr(ord(os.sep) + 1), len(prefix) + 1, os.sep))
+            for path in paths:
+                try:
+                    editor_data = serializer.load_file(path)
+                    self._store(path, editor_data)
+                    indexed += 1
+                except (OSError, ValueError, KeyError, AttributeError) as e:
+                    failures.append((path, e))
+        return indexed, failures
+
+    def _store(self, path, editor_data):
+        """Write one meeting. The caller holds the lock and the transaction."""
+        meeting_info = editor_data.get('Meeting Info', {})
+        closing = editor_data.get('Closing Ceremony', {})
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        cursor = self.connection.execute(
+            "INSERT INTO meetings (path, mtime, meeting_date, meeting_day, start_time, adjourned_at, next_business_meeting) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET mtime=excluded.mtime, meeting_date=excluded.meeting_date, "
+            "meeting_day=excluded.meeting_day, start_time=excluded.start_time, "
+            "adjourned_at=excluded.adjourned_at, next_business_meeting=excluded.next_business_meeting "
+            "RETURNING id",
+            (path, mtime,
+             meeting_info.get('Meeting Date', ''),
+             parse_meeting_date(meeting_info.get('Meeting Date', '')),
+             meeting_info.get('Start Time', ''),
+             closing.get('Adjurned At', ''),
+             closing.get('Next Business Meeting', '')))
+        meeting_id = cursor.fetchone()[0]
+
+        self.connection.execute("DELETE FROM attendance WHERE meeting_id = ?", (meeting_id,))
+        self.connection.executemany(
+            "INSERT INTO attendance (meeting_id, office, name, attendance) VALUES (?, ?, ?, ?)",
+            [(meeting_id, office, info.get('name', ''), info.get('attendance', ''))
+             for office, info in editor_data.get('officers', {}).items()])
+
+        minutes = editor_data.get('Minutes', {})
+        self.connection.execute(
+            "INSERT OR REPLACE INTO motions (meeting_id, corrections, motion_by, seconded_by, approval) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (meeting_id, minutes.get('Corrections', ''), minutes.get('Motion to Approve', ''),
+             minutes.get('Seconded by', ''), minutes.get('Approval', '')))
+
+        financials = editor_data.get('Financials', {})
+        self.connection.execute("DELETE FROM balances WHERE meeting_id = ?", (meeting_id,))
+        self.connection.executemany(
+            "INSERT INTO balances (meeting_id, fund, start_balance, receipts, deposits, disbursements, end_balance) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(meeting_id, fund, account.get('Start Balance', ''), account.get('Receipts', ''),
+              account.get('Deposits', ''), account.get('Disbursements', ''), account.get('End Balance', ''))
+             for fund, account in ((fund, financials.get(fund, {})) for fund in schema.FUNDS)])
+
+    # Querying the catalog
+    def query(self, sql, params=()):
+        """Run a read-only query and return the rows as dictionaries."""
+        with self._lock:
+            return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def meetings(self, year=None):
+        """List the meetings in date order, optionally for one year."""
+        if year is None:
+            return self.query("SELECT * FROM meetings ORDER BY meeting_day")
+        return self.query("SELECT * FROM meetings WHERE meeting_day >= ? AND meeting_day < ? "
+                          "ORDER BY meeting_day", _year_range(year))
+
+    def latest_meetings(self, limit=5):
+        """List the most recent meetings by Meeting Date, newest first, for starting the next meeting."""
+        return self.query("SELECT path, meeting_day FROM meetings WHERE meeting_day IS NOT NULL "
+                          "ORDER BY meeting_day DESC LIMIT ?", (limit,))
+
+    def motions(self, year=None):
+        """List who moved and seconded the approval of the minutes."""
+        sql = ("SELECT m.meeting_day, m.meeting_date, n.motion_by, n.seconded_by, n.approval, m.path "
+               "FROM motions n JOIN meetings m ON m.id = n.meeting_id")
+        if year is None:
+            return self.query(sql + " ORDER BY m.meeting_day")
+        return self.query(sql + " WHERE m.meeting_day >= ? AND m.meeting_day < ? ORDER BY m.meeting_day",
+                          _year_range(year))
+
+    def balances(self, fund, year=None):
+        """List the balances of one fund, meeting by meeting."""
+        sql = ("SELECT m.meeting_day, m.meeting_date, b.start_balance, b.receipts, b.deposits, "
+               "b.disbursements, b.end_balance, m.path "
+               "FROM balances b JOIN meetings m ON m.id = b.meeting_id WHERE b.fund = ?")
+        if year is None:
+            return self.query(sql + " ORDER BY m.meeting_day", (fund,))
+        return self.query(sql + " AND m.meeting_day >= ? AND m.meeting_day < ? ORDER BY m.meeting_day",
+                          (fund,) + _year_range(year))
+
+    def ledger_rows(self, year=None):
+        """List the balances of every fund of the dated meetings, in meeting order, see ledger.py."""
+        sql = ("SELECT m.meeting_day, m.path, b.fund, b.start_balance, b.receipts, b.deposits, "
+               "b.disbursements, b.end_balance "
+               "FROM balances b JOIN meetings m ON m.id = b.meeting_id WHERE m.meeting_day IS NOT NULL")
+        if year is None:
+            return self.query(sql + " ORDER BY m.meeting_day, m.path")
+        return self.query(sql + " AND m.meeting_day >= ? AND m.meeting_day < ? ORDER BY m.meeting_day, m.path",
+                          _year_range(year))
+
+    def attendance(self, name):
+        """List the meetings an officer was recorded at, with their attendance."""
+        return self.query("SELECT m.meeting_day, m.meeting_date, a.office, a.attendance, m.path "
+                          "FROM attendance a JOIN meetings m ON m.id = a.meeting_id "
+                          "WHERE a.name = ? ORDER BY m.meeting_day", (name,))
@@ -0,0 +1,110 @@
+"""
+    The assembly and officer csv files, read once per process.
+    AssemblyInfo and OfficerDatabase read their csv file every time they
+    are created. The ConfigService keeps the last one read and hands it out
+    again for as long as the file has the same size and modification time,
+    so an export or a command line tool does not parse the files again.
+
+    check() reads the files again that have changed on disk, whether
+    they were edited by hand or saved by the Assembly and Officer dialogs,
+    and tells the listeners. The editor calls it every few seconds and
+    after each dialog, so the changes reach the open window without a restart.
+"""
+import os
+import threading
+import assembly
+import officers
+
+# How often the editor checks the csv files for changes.
+WATCH_MS = 2000
+
+# name -> (csv file, class that reads it)
+CONFIG_FILES = {
+    'assembly': (assembly.ASSEMBLY_FILE, assembly.AssemblyInfo),
+    'officers': (officers.OFFICERS_FILE, officers.OfficerDatabase),
+}
+
+
+def _file_state(path):
+    """Return (size, modification time) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ConfigService:
+    """ The assembly and officer data of the process. Safe to share between threads."""
+
+    def __init__(self):
+        self._cached = {}           # name -> (file state when read, AssemblyInfo or OfficerDatabase)
+        self._listeners = []
+        self._lock = threading.Lock()
+        self.stats = {'reads': 0, 'hits': 0}
+
+    def get(self, name):
+        """
+        Return the data of a csv file, reading it only if it changed since it was last read.
+        Input: 'assembly' or 'officers'
+        """
+        csv_file, loader = CONFIG_FILES[name]
+        with self._lock:
+            cached = self._cached.get(name)
+            state = _file_state(csv_file)
+            if cached is not None and state is not None and cached[0] == state:
+                self.stats['hits'] += 1
+                return cached[1]
+            data = loader()
+            # the loader writes a default file if there was none
+            self._cached[name] = (_file_state(csv_file), data)
+            self.stats['reads'] += 1
+            return data
+
+    def assembly(self):
+        """The AssemblyInfo of assembly.csv."""
+        return self.get('assembly')
+
+    def officers(self):
+        """The OfficerDatabase of officers.csv."""
+        return self.get('officers')
+
+    def add_listener(self, listener):
+        """listener(name, data) is called by check() when a csv file has been read again."""
+        self._listeners.append(listener)
+
+    def check(self):
+        """
+        Read again the csv files that changed since they were read, and tell the listeners.
+        Output: list of the names that were read again
+        """
+        with self._lock:
+            names = list(self._cached)
+        changed = []
+        for name in names:
+            previous = self._cached[name][1]
+            data = self.get(name)
+            if data is not previous:
+                changed.append((name, data))
+        for name, data in changed:
+            for listener in self._listeners:
+                listener(name, data)
+        return [name for name, data in changed]
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service():
+    """Return the ConfigService of this process."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+        return _service
+
+
+def assembly_info():
+    """The assembly info dictionary, for the exports and the command line tools."""
+    return get_service().assembly().assembly_info
@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
+import schema
+import sharing
 
 class AssemblyInfoDialog:
     """Dialog for editing Assembly information"""
@@ -124,87 +126,18 @@ class OfficerInfoDialog:
         main_frame = ttk.Frame(self.dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Faithful Navigator 
-        ttk.Label(main_frame, text="Faithful Navigator:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.navigator_entry = ttk.Entry(main_frame, width=30)
-        self.navigator_entry.grid(row=0, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.navigator_entry.insert(0, self.officer_info.officers['Faithful Navigator'].get('name', ''))
-
-        # Faithful Friar
-        ttk.Label(main_frame, text="Faithful Friar:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.friar_entry = ttk.Entry(main_frame, width=30)
-        self.friar_entry.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.friar_entry.insert(0, self.officer_info.officers['Faithful Friar'].get('name', ''))
-
-        # Faithful Admiral
-        ttk.Label(main_frame, text="Faithful Admiral:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.admiral_entry = ttk.Entry(main_frame, width=30)
-        self.admiral_entry.grid(row=2, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.admiral_entry.insert(0, self.officer_info.officers['Faithful Admiral'].get('name', ''))
-
-        # Faithful Captain
-        ttk.Label(main_frame, text="Faithful Captain:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.captain_entry = ttk.Entry(main_frame, width=30)
-        self.captain_entry.grid(row=3, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.captain_entry.insert(0, self.officer_info.officers['Faithful Captain'].get('name', ''))
-
-        # Faithful Pilot
-        ttk.Label(main_frame, text="Faithful Pilot:").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.pilot_entry = ttk.Entry(main_frame, width=30)
-        self.pilot_entry.grid(row=4, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.pilot_entry.insert(0, self.officer_info.officers['Faithful Pilot'].get('name', ''))
-
-        # Faithful Comptroller
-        ttk.Label(main_frame, text="Faithful Comptroller:").grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.comptroller_entry = ttk.Entry(main_frame, width=30)
-        self.comptroller_entry.grid(row=5, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.comptroller_entry.insert(0, self.officer_info.officers['Faithful Comptroller'].get('name', ''))
-
-        # Failthful Scribe
-        ttk.Label(main_frame, text="Faithful Scribe:").grid(row=6, column=0, sticky=tk.W, pady=5)
-        self.scribe_entry = ttk.Entry(main_frame, width=30)
-        self.scribe_entry.grid(row=6, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.scribe_entry.insert(0, self.officer_info.officers['Faithful Scribe'].get('name', ''))
-
-        # Faithful Purser
-        ttk.Label(main_frame, text="Faithful Purser:").grid(row=7, column=0, sticky=tk.W, pady=5)
-        self.purser_entry = ttk.Entry(main_frame, width=30)
-        self.purser_entry.grid(row=7, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.purser_entry.insert(0, self.officer_info.officers['Faithful Purser'].get('name', ''))
-
-        # Faithful Inner Sentinel
-        ttk.Label(main_frame, text="Faithful Inner Sentinel:").grid(row=8, column=0, sticky=tk.W, pady=5)
-        self.inner_entry = ttk.Entry(main_frame, width=30)
-        self.inner_entry.grid(row=8, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.inner_entry.insert(0, self.officer_info.officers['Faithful Inner Sentinel'].get('name', ''))
-
-        # Faithful Outer Sentinel
-        ttk.Label(main_frame, text="Faithful Outer Sentinel:").grid(row=9, column=0, sticky=tk.W, pady=5)
-        self.outer_entry = ttk.Entry(main_frame, width=30)
-        self.outer_entry.grid(row=9, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.outer_entry.insert(0, self.officer_info.officers['Faithful Outer Sentinel'].get('name', ''))
-
-        # Faithful Trustee (1 Yr)
-        ttk.Label(main_frame, text="Faithful Trustee (1 yr):").grid(row=10, column=0, sticky=tk.W, pady=5)
-        self.trustee1_entry = ttk.Entry(main_frame, width=30)
-        self.trustee1_entry.grid(row=10, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.trustee1_entry.insert(0, self.officer_info.officers['Faithful Trustee (1 Yr)'].get('name', ''))
-
-        # Faithful Trustee (2 Yr)
-        ttk.Label(main_frame, text="Faithful Trustee (2 Yr):").grid(row=11, column=0, sticky=tk.W, pady=5)
-        self.trustee2_entry = ttk.Entry(main_frame, width=30)
-        self.trustee2_entry.grid(row=11, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.trustee2_entry.insert(0, self.officer_info.officers['Faithful Trustee (2 Yr)'].get('name', ''))
-
-        # Faithful Trustee (3 Yr)
-        ttk.Label(main_frame, text="Faithful Trustee (3 Yr):").grid(row=12, column=0, sticky=tk.W, pady=5)
-        self.trustee3_entry = ttk.Entry(main_frame, width=30)
-        self.trustee3_entry.grid(row=12, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.trustee3_entry.insert(0, self.officer_info.officers['Faithful Trustee (3 Yr)'].get('name', ''))
+        # One entry for each office
+        self.name_entries = {}
+        for row, office in enumerate(schema.OFFICES):
+            ttk.Label(main_frame, text=f"{office}:").grid(row=row, column=0, sticky=tk.W, pady=5)
+            entry = ttk.Entry(main_frame, width=30)
+            entry.grid(row=row, column=1, sticky=tk.EW, padx=5, pady=5)
+            entry.insert(0, self.officer_info.officers.get(office, {}).get('name', ''))
+            self.name_entries[office] = entry
 
         # Button Frame
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=13, column=0, columnspan=2, pady=(20, 0))
+        button_frame.grid(row=len(schema.OFFICES), column=0, columnspan=2, pady=(20, 0))
 
         # Save Button
         save_button = ttk.Button(button_frame, text='Save', command=self.save)
@@ -222,24 +155,13 @@ class OfficerInfoDialog:
         self.dialog.bind('<Escape>', lambda e: self.cancel())
 
         # Focus on first entry
-        self.navigator_entry.focus()
+        self.name_entries[schema.OFFICES[0]].focus()
 
     def save(self):
         """Save changes to officer info."""
         # Update the officer_info dictionary
-        self.officer_info.officers['Faithful Navigator']['name'] = self.navigator_entry.get().strip()
-        self.officer_info.officers['Faithful Friar']['name'] = self.friar_entry.get().strip()
-        self.officer_info.officers['Faithful Admiral']['name'] = self.admiral_entry.get().strip()
-        self.officer_info.officers['Faithful Captain']['name'] = self.captain_entry.get().strip()
-        self.officer_info.officers['Faithful Pilot']['name'] = self.pilot_entry.get().strip()
-        self.officer_info.officers['Faithful Comptroller']['name'] = self.comptroller_entry.get().strip()
-        self.officer_info.officers['Faithful Scribe']['name'] = self.scribe_entry.get().strip()
-        self.officer_info.officers['Faithful Purser']['name'] = self.purser_entry.get().strip()
-        self.officer_info.officers['Faithful Inner Sentinel']['name'] = self.inner_entry.get().strip()
-        self.officer_info.officers['Faithful Outer Sentinel']['name'] = self.outer_entry.get().strip()
-        self.officer_info.officers['Faithful Trustee (1 Yr)']['name'] = self.trustee1_entry.get().strip()
-        self.officer_info.officers['Faithful Trustee (2 Yr)']['name'] = self.trustee2_entry.get().strip()
-        self.officer_info.officers['Faithful Trustee (3 Yr)']['name'] = self.trustee3_entry.get().strip()
+        for office, entry in self.name_entries.items():
+            self.officer_info.officers.setdefault(office, {'name': '', 'attendance': ''})['name'] = entry.get().strip()
 
         # Save to CSV
         self.officer_info.save_officers()
@@ -255,4 +177,86 @@ class OfficerInfoDialog:
         """Show dialog and wait for it to close."""
         self.dialog.wait_window()
         return self.result
-    
\ No newline at end of file
+    
+class MergeConflictDialog:
+    """Lets the user choose, for each field changed by both users, which value to keep."""
+
+    # Longest value shown in the dialog, the rest is cut off.
+    SHOWN_CHARACTERS = 60
+
+    def __init__(self, parent, conflicts):
+        self.conflicts = conflicts
+        self.result = None # Will be {path: value} if saved, None if cancelled
+
+        # Create the dialog window
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Merge Changes")
+        self.dialog.resizable(False, False)
+
+        # Make dialog modal
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+
+        # Create widgets
+        self.create_widgets()
+
+        # Center dialog on the parent window
+        self.dialog.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.dialog.winfo_width() // 2)
+        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.dialog.winfo_height() // 2)
+        self.dialog.geometry(f"+{x}+{y}")
+
+    def create_widgets(self):
+        """Create a row for each conflict with the two values to choose from."""
+        main_frame = ttk.Frame(self.dialog, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(main_frame, text="These fields were also changed and saved by someone else. Choose the values to keep.",
+                  wraplength=600).grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
+        ttk.Label(main_frame, text="Field").grid(row=1, column=0, sticky=tk.W, padx=5)
+        ttk.Label(main_frame, text="Yours").grid(row=1, column=1, sticky=tk.W, padx=5)
+        ttk.Label(main_frame, text="Saved by someone else").grid(row=1, column=2, sticky=tk.W, padx=5)
+
+        # One pair of radio buttons for each field, yours is chosen at first
+        self.choices = []
+        for row, conflict in enumerate(self.conflicts, start=2):
+            choice = tk.StringVar(value='mine')
+            self.choices.append(choice)
+            ttk.Label(main_frame, text=sharing.field_label(conflict.path)).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+            ttk.Radiobutton(main_frame, text=self._shown(conflict.mine), value='mine',
+                            variable=choice).grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
+            ttk.Radiobutton(main_frame, text=self._shown(conflict.theirs), value='theirs',
+                            variable=choice).grid(row=row, column=2, sticky=tk.W, padx=5, pady=5)
+
+        # Button Frame
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=len(self.conflicts) + 2, column=0, columnspan=3, pady=(20, 0))
+        ttk.Button(button_frame, text='Save', command=self.save).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text='Cancel', command=self.cancel).pack(side=tk.LEFT, padx=5)
+
+        # Bind Enter and escape keys
+        self.dialog.bind('<Return>', lambda e: self.save())
+        self.dialog.bind('<Escape>', lambda e: self.cancel())
+
+    def _shown(self, value):
+        """One line of a value for a radio button."""
+        text = ' '.join(str(value).split()) or '(blank)'
+        if len(text) > self.SHOWN_CHARACTERS:
+            text = text[:self.SHOWN_CHARACTERS - 3] + '...'
+        return text
+
+    def save(self):
+        """Keep the chosen values."""
+        self.result = {conflict.path: conflict.mine if choice.get() == 'mine' else conflict.theirs
+                       for conflict, choice in zip(self.conflicts, self.choices)}
+        self.dialog.destroy()
+
+    def cancel(self):
+        """Close dialog without saving."""
+        self.result = None
+        self.dialog.destroy()
+
+    def show(self):
+        """Show dialog and wait for it to close."""
+        self.dialog.wait_window()
+        return self.result
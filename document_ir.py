@@ -0,0 +1,224 @@
+"""
+    The minutes in a form that does not depend on the output format.
+    The FileManager section printers describe the minutes once as a
+    MinutesDocument of headings, paragraphs, bullet lists, tables and
+    page breaks. The writers below turn that description into Word,
+    HTML, Markdown or plain text, so the minutes for the website and
+    for email come from the same run as the Word document.
+
+    Only write_word_blocks needs python-docx.
+"""
+from html import escape
+
+# Output formats by file name ending.
+FORMATS = {
+    '.docx': 'docx',
+    '.html': 'html',
+    '.htm': 'html',
+    '.md': 'markdown',
+    '.txt': 'text',
+}
+
+# Width of a plain text page, for centred lines.
+TEXT_WIDTH = 72
+
+# Underlines of the plain text headings, by level.
+TEXT_UNDERLINES = {1: '=', 2: '-', 3: '~'}
+
+
+def format_for(file_path):
+    """Return the output format for a file name, e.g. minutes.html -> 'html'."""
+    name = file_path.lower()
+    for extension, file_format in FORMATS.items():
+        if name.endswith(extension):
+            return file_format
+    raise ValueError(f"Unknown minutes format: {file_path}")
+
+
+class MinutesDocument:
+    """
+    The blocks of the minutes, grouped by the sections of FileManager.export_sections.
+    Each block is a tuple:
+
+        ('heading', text, level, centered)
+        ('paragraph', text, centered)
+        ('bullets', list of lines)
+        ('table', list of rows, each a tuple of cell texts)
+        ('page break',)
+    """
+
+    def __init__(self, title=''):
+        self.title = title
+        self.sections = []          # (section name, list of blocks)
+        self._blocks = []
+
+    def start_section(self, name):
+        """The blocks added from now on belong to the named section."""
+        self._blocks = []
+        self.sections.append((name, self._blocks))
+
+    def heading(self, text, level, centered=False):
+        self._blocks.append(('heading', text, level, centered))
+
+    def paragraph(self, text, centered=False):
+        self._blocks.append(('paragraph', text, centered))
+
+    def bullets(self, text):
+        """Add a bullet for every line of a text field."""
+        self._blocks.append(('bullets', [line.strip() for line in text.split('\n')]))
+
+    def table(self, rows):
+        self._blocks.append(('table', [tuple(row) for row in rows]))
+
+    def page_break(self):
+        self._blocks.append(('page break',))
+
+    def blocks(self):
+        """Yield the blocks of every section in order."""
+        for section_name, blocks in self.sections:
+            yield from blocks
+
+
+# Word
+def write_word_blocks(blocks, doc, styles):
+    """
+    Add blocks to a Word document.
+    Input: the blocks, a python-docx Document or an ooxml_stream.StreamingDocument,
+    the style registry of its template
+    """
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    for block in blocks:
+        kind = block[0]
+        if kind == 'heading':
+            paragraph = styles.add_paragraph(doc, block[1], f'Heading {block[2]}')
+            if block[3]:
+                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif kind == 'paragraph':
+            paragraph = doc.add_paragraph(block[1])
+            if block[2]:
+                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif kind == 'bullets':
+            for line in block[1]:
+                styles.add_paragraph(doc, line, 'List Bullet')
+        elif kind == 'table':
+            rows = block[1]
+            table = doc.add_table(rows=len(rows), cols=len(rows[0]) if rows else 0)
+            # table.cell() finds every cell of the table on each call, which is slow for long tables
+            for row, table_row in zip(rows, table.rows):
+                for text, cell in zip(row, table_row.cells):
+                    cell.text = text
+        else:
+            doc.add_page_break()
+
+
+# HTML
+def to_html(minutes):
+    """Return the minutes as an HTML page."""
+    parts = ['<!DOCTYPE html>',
+             '<html>',
+             '<head>',
+             '<meta charset="utf-8">',
+             f'<title>{escape(minutes.title)}</title>',
+             '<style>.center { text-align: center; } .page-break { page-break-before: always; }</style>',
+             '</head>',
+             '<body>']
+    for block in minutes.blocks():
+        kind = block[0]
+        if kind == 'heading':
+            centered = ' class="center"' if block[3] else ''
+            parts.append(f'<h{block[2]}{centered}>{_html_text(block[1])}</h{block[2]}>')
+        elif kind == 'paragraph':
+            centered = ' class="center"' if block[2] else ''
+            parts.append(f'<p{centered}>{_html_text(block[1])}</p>')
+        elif kind == 'bullets':
+            lines = [line for line in block[1] if line]
+            if lines:
+                parts.append('<ul>')
+                parts.extend(f'<li>{_html_text(line)}</li>' for line in lines)
+                parts.append('</ul>')
+        elif kind == 'table':
+            parts.append('<table>')
+            for row in block[1]:
+                parts.append('<tr>' + ''.join(f'<td>{_html_text(text)}</td>' for text in row) + '</tr>')
+            parts.append('</table>')
+        else:
+            parts.append('<div class="page-break"></div>')
+    parts.extend(['</body>', '</html>', ''])
+    return '\n'.join(parts)
+
+
+def _html_text(text):
+    return escape(text).replace('\n', '<br>')
+
+
+# Markdown
+def to_markdown(minutes):
+    """Return the minutes as Markdown."""
+    parts = []
+    for block in minutes.blocks():
+        kind = block[0]
+        if kind == 'heading':
+            parts.append(f"{'#' * block[2]} {block[1]}")
+        elif kind == 'paragraph':
+            parts.append(block[1].replace('\n', '  \n'))
+        elif kind == 'bullets':
+            lines = [line for line in block[1] if line]
+            if lines:
+                parts.append('\n'.join(f'- {line}' for line in lines))
+        elif kind == 'table':
+            rows = block[1]
+            if rows:
+                # Markdown tables need a header row, the minutes tables have none
+                columns = len(rows[0])
+                lines = ['|' + '   |' * columns, '|' + '---|' * columns]
+                lines.extend('| ' + ' | '.join(text.replace('|', '\\|') for text in row) + ' |' for row in rows)
+                parts.append('\n'.join(lines))
+        else:
+            parts.append('---')
+    return '\n\n'.join(parts) + '\n'
+
+
+# Plain text
+def to_text(minutes):
+    """Return the minutes as plain text, for email."""
+    parts = []
+    for block in minutes.blocks():
+        kind = block[0]
+        if kind == 'heading':
+            text, level, centered = block[1], block[2], block[3]
+            underline = TEXT_UNDERLINES.get(level, '~') * len(text)
+            if centered:
+                text, underline = text.center(TEXT_WIDTH).rstrip(), underline.center(TEXT_WIDTH).rstrip()
+            parts.append(f'{text}\n{underline}')
+        elif kind == 'paragraph':
+            parts.append(block[1].center(TEXT_WIDTH).rstrip() if block[2] else block[1])
+        elif kind == 'bullets':
+            lines = [line for line in block[1] if line]
+            if lines:
+                parts.append('\n'.join(f'  * {line}' for line in lines))
+        elif kind == 'table':
+            rows = block[1]
+            if rows:
+                widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+                parts.append('\n'.join('  '.join(text.ljust(width) for text, width in zip(row, widths)).rstrip()
+                                       for row in rows))
+        else:
+            parts.append('\f')
+    return '\n\n'.join(parts) + '\n'
+
+
+TEXT_WRITERS = {
+    'html': to_html,
+    'markdown': to_markdown,
+    'text': to_text,
+}
+
+
+def write_text_file(minutes, file_path, file_format=None):
+    """
+    Write the minutes in one of the text formats.
+    Input: the MinutesDocument, the output path, 'html', 'markdown' or 'text' (chosen by the file name if left out)
+    """
+    file_format = file_format or format_for(file_path)
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(TEXT_WRITERS[file_format](minutes))
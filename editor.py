@@ -6,41 +6,204 @@
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+from tkinter import ttk, messagebox, filedialog, scrolledtext, simpledialog
 from datetime import datetime
+import copy
 import os
-from numpy import var
+import threading
+import time
 import assembly
+import autosave
+import config
 import dialogs
 import officers
 import file_mgr
+import gui_files
+import history
+import journal
+import ledger
+import live_session
+import schema
+import sharing
+import startup
+import templates
 
 DISPLAY_FONT = ('Arial', 12)
 
-class EditorGui:
-    def __init__(self):
-        self.editor_data = file_mgr.FileManager.default_editor_data()
-        self.file_mgr = file_mgr.FileManager()
-        self.assembly_data = assembly.AssemblyInfo()
-        self.officer_data = officers.OfficerDatabase()
-        self._inject_officers()
+# In low memory mode, widgets of tabs hidden this long are destroyed.
+TEARDOWN_IDLE_MS = 60000
 
-        self.root = tk.Tk()
-        self.root.title(f"Minutes Editor for the {self.assembly_data.assembly_info['Assembly Name']}, {self.assembly_data.assembly_info['Assembly Number']}")
+# Autosave at once, without waiting for the editor to be idle, after this many edits.
+COMPACT_EVERY = 50
 
-        # Get the screen width and height
-        self.screen_width = self.root.winfo_screenwidth()
-        self.screen_height = self.root.winfo_screenheight()
+# How often the window checks whether the startup thread has finished.
+STARTUP_POLL_MS = 20
 
-        # Set the window size to match the screen size
-        # root.geometry(f"{screen_width}x{screen_height}")
-        self.root.geometry("1000x600")
+# How often the window checks whether someone else saved the meeting file.
+MEETING_WATCH_MS = 2000
 
-        self.create_editor_gui()
+# Sets a list of Tk variables in one call: apply {pairs {...}} {name value name value ...}
+SET_VARIABLES = ('pairs', 'foreach {name value} $pairs {set ::$name $value}')
+
+class EditorGui:
+    def __init__(self, low_memory=False, profile=None, populate_benchmark=None, history_bytes=history.HISTORY_BYTES,
+                 tabs_benchmark=None, eager_tabs=False, quit_after_startup=False):
+        self.low_memory = low_memory
+        self.quit_after_startup = quit_after_startup    # close once started, to compare --profile-startup runs
+        self.populate_benchmark = populate_benchmark     # (meeting files, count, all tabs) for --bench-populate
+        self.tabs_benchmark = tabs_benchmark             # (editor data, rounds) for --bench-tabs
+        self.profile = profile or startup.StartupProfile()
+        with self.profile.phase('editor data'):
+            self.editor_data = file_mgr.FileManager.default_editor_data()
+            self.file_mgr = gui_files.GuiFileManager()
+            self.journal = journal.EditJournal()
+            self.history = history.History(self.editor_data, limit_bytes=history_bytes)
+
+        # The csv files are read by the startup thread once the window is up.
+        self.assembly_data = None
+        self.officer_data = None
+        self._roster = {}           # office -> name in officers.csv when it was read, see _config_changed
+        self._config_loaded = threading.Event()
+        self._config_applied = False
+        self._startup_done = threading.Event()
+        self._disk_change_shown = False     # the status bar has said the meeting file was saved by someone else
+        self.revision = 0           # counts the changes to editor_data, see FileManager.export_is_current
+        self.session = None         # the LiveSession shared with other laptops, see live_session.py
+
+        with self.profile.phase('window'):
+            self.root = tk.Tk()
+            self.root.title("Minutes Editor")
+
+            # Get the screen width and height
+            self.screen_width = self.root.winfo_screenwidth()
+            self.screen_height = self.root.winfo_screenheight()
+
+            # Set the window size to match the screen size
+            # root.geometry(f"{screen_width}x{screen_height}")
+            self.root.geometry("1000x600")
+
+        with self.profile.phase('widgets'):
+            self.create_editor_gui()
+            if eager_tabs:
+                # every tab built before the window is shown, as before tabs were built on first selection
+                self._build_all_tabs()
+            self.autosave = autosave.AutoSaver(self.root, self.file_mgr, self._autosave_snapshot,
+                                               self._autosave_done, self.set_status)
+        self.root.after_idle(self._window_shown)
 
         self.root.mainloop()
 
+    # Startup
+    def _window_shown(self):
+        """Start the startup thread once the window has been drawn."""
+        self.profile.mark('window shown')
+        threading.Thread(target=self._startup_thread, name='startup', daemon=True).start()
+        self.root.after(STARTUP_POLL_MS, self._poll_startup)
+
+    def _startup_thread(self):
+        """Read the csv files, then load the Word template so the first export is fast."""
+        try:
+            with self.profile.phase('config', background=True):
+                service = config.get_service()
+                self.assembly_data = service.assembly()
+                self.officer_data = service.officers()
+        except Exception as e:
+            print(f"Error reading the csv files: {e}")
+        finally:
+            self._config_loaded.set()
+        try:
+            with self.profile.phase('template warmup', background=True):
+                templates.warm_up()
+        except Exception as e:
+            print(f"Error loading the Word template: {e}")
+        finally:
+            self._startup_done.set()
+
+    def _poll_startup(self):
+        """Apply the configuration when the startup thread has read it."""
+        if self._config_loaded.is_set():
+            self._apply_config()
+        if self._startup_done.is_set():
+            self.profile.mark('startup done')
+            self.profile.report()
+            if self.quit_after_startup:
+                self.root.after_idle(self.root.destroy)
+            elif self.populate_benchmark:
+                self.root.after_idle(self._run_populate_benchmark)
+            elif self.tabs_benchmark:
+                self.root.after_idle(self._run_tabs_benchmark)
+        else:
+            self.root.after(STARTUP_POLL_MS, self._poll_startup)
+
+    def _wait_for_config(self):
+        """Called before anything that needs the csv files, in case the startup thread is still reading them."""
+        if not self._config_applied:
+            self._config_loaded.wait()
+            self._apply_config()
+
+    def _apply_config(self):
+        """Show the assembly in the title, add the officers and recover the journal."""
+        if self._config_applied:
+            return
+        self._config_applied = True
+        if self.assembly_data is None or self.officer_data is None:
+            # the startup thread failed, read the files here to show the error
+            self.assembly_data = assembly.AssemblyInfo()
+            self.officer_data = officers.OfficerDatabase()
+        self._inject_officers()
+        self._recover_journal()
+        self.history.reset(self.editor_data, self.file_mgr.current_file)
+        self._update_title()
+        config.get_service().add_listener(self._config_changed)
+        self.root.after(config.WATCH_MS, self._watch_config)
+        self.root.after(MEETING_WATCH_MS, self._watch_meeting_file)
+
+    def _watch_config(self):
+        """Check the csv files for changes every few seconds."""
+        config.get_service().check()
+        self.root.after(config.WATCH_MS, self._watch_config)
+
+    def _config_changed(self, name, data):
+        """
+        A csv file was read again, see config.py. A new assembly is shown in the title.
+        New officers replace the names in the meeting that still match the old officer list,
+        so a meeting recorded with other officers is left alone.
+        """
+        if name == 'assembly':
+            self.assembly_data = data
+            self._update_title()
+            self.set_status("The assembly information was reloaded.")
+            return
+
+        changes = []
+        for office, info in data.officers.items():
+            name_in_meeting = self.editor_data['officers'].get(office, {}).get('name', '')
+            if name_in_meeting in ('', self._roster.get(office)) and name_in_meeting != info['name']:
+                changes.append((('officers', office, 'name'), info['name']))
+        self.officer_data = data
+        self._roster = {office: info['name'] for office, info in data.officers.items()}
+        self._set_fields(changes)
+        for tab in self._tabs.values():
+            if tab['built'] and any(field.kind == 'roll call' for field in tab['spec'].fields):
+                # the names of the roll call are labels, build it again
+                self._teardown_tab(tab)
+                if self.notebook.select() == str(tab['frame']):
+                    self._build_tab(tab)
+        self.set_status("The officers were reloaded.")
+
+    def _update_title(self):
+        """Show the assembly and the meeting file in the title. A * marks unsaved changes."""
+        title = "Minutes Editor"
+        if self.assembly_data is not None:
+            title += f" for the {self.assembly_data.assembly_info['Assembly Name']}, {self.assembly_data.assembly_info['Assembly Number']}"
+        if self.file_mgr.current_file:
+            title += f" - {os.path.basename(self.file_mgr.current_file)}"
+        if self.journal.count:
+            title = "*" + title
+        self.root.title(title)
+
     def _inject_officers(self):
+        self._roster = {office: info['name'] for office, info in self.officer_data.officers.items()}
         for office, info in self.officer_data.officers.items():
             self.editor_data['officers'][office] = {
                 'name': info['name'],
@@ -49,408 +212,629 @@ class EditorGui:
 
     def create_editor_gui(self):
         self._create_menubar()
+        self._create_status_bar()
         self._create_notebook()
-        self._create_meeting_info_tab()
-        self._create_opening_ceremony_tab()
-        self._create_roll_call_tab()
-        self._create_minutes_tab()
-        self._create_reports_tab()
-        self._create_business_tab()
-        self._create_council_tab()
-        self._create_financial_tab()
-        self._create_closing_ceremony_tab()
+
+        # The tabs are empty frames until they are first selected.
+        self._tabs = {}
+        self.widgets = {}           # field id -> widget, for the tabs that are built
+        self._field_vars = {}       # field id -> StringVar of the entries and lists
+        self._leaving_tab = None
+        self._teardown_id = None
+        for spec in schema.TABS:
+            self._add_tab(spec)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(self._tabs[self.notebook.select()])
+
+    def _add_tab(self, spec):
+        """Add an empty tab for a schema.Tab."""
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=spec.name)
+        self._tabs[str(frame)] = {
+            'text': spec.name,
+            'spec': spec,
+            'frame': frame,
+            'built': False,
+            'last_shown': 0.0,
+        }
+
+    def _build_tab(self, tab):
+        """Create the widgets of a tab and fill them from editor_data."""
+        if not tab['built']:
+            self._create_tab(tab['spec'], tab['frame'])
+            tab['built'] = True
+            self._populate_tabs([tab], self.editor_data)
+        tab['last_shown'] = time.monotonic()
+
+    def _build_all_tabs(self):
+        for tab in self._tabs.values():
+            self._build_tab(tab)
+
+    def _on_tab_changed(self, event=None):
+        """Save the tab being left and build the selected tab the first time it is shown."""
+        if self._leaving_tab is not None and self._leaving_tab['built']:
+            self._sync_tab(self._leaving_tab)
+            self._leaving_tab['last_shown'] = time.monotonic()
+        tab = self._tabs.get(self.notebook.select())
+        if tab is None:
+            return
+        self._build_tab(tab)
+        self._leaving_tab = tab
+        if self.low_memory:
+            self._schedule_teardown()
+
+    def _schedule_teardown(self):
+        if self._teardown_id is not None:
+            self.root.after_cancel(self._teardown_id)
+        self._teardown_id = self.root.after(TEARDOWN_IDLE_MS, self._teardown_hidden_tabs)
+
+    def _teardown_hidden_tabs(self):
+        """Low memory mode: destroy the widgets of tabs that have been hidden for a while."""
+        self._teardown_id = None
+        selected = self.notebook.select()
+        now = time.monotonic()
+        for name, tab in self._tabs.items():
+            if name == selected or not tab['built']:
+                continue
+            if (now - tab['last_shown']) * 1000 < TEARDOWN_IDLE_MS:
+                continue
+            self._teardown_tab(tab)
+        if any(tab['built'] for name, tab in self._tabs.items() if name != selected):
+            self._schedule_teardown()
+
+    def _teardown_tab(self, tab):
+        """Destroy the widgets of a tab. It is built again when it is next shown."""
+        # copy the fields to editor_data before the widgets go away
+        self._sync_tab(tab)
+        for field in tab['spec'].fields:
+            self.widgets.pop(field.id, None)
+            self._field_vars.pop(field.id, None)
+        for child in tab['frame'].winfo_children():
+            child.destroy()
+        tab['built'] = False
+
+    def _sync_fields(self, fields):
+        """Copy the widgets of the fields to editor_data. Only the fields that changed are stored."""
+        values = {field.id: self._read_widget(field) for field in fields if field.id in self.widgets}
+        self._set_fields(schema.changes(self.editor_data, values, fields))
+
+    def _sync_tab(self, tab):
+        """
+        Copy what was typed into a tab to editor_data. The lists and attendance buttons
+        were stored when they were clicked; one left alone shows a default that is not in the meeting.
+        """
+        self._sync_fields([field for field in tab['spec'].fields if field.kind in schema.TYPED_KINDS])
+
+    def _sync_built_tabs(self):
+        """Copy every built tab to editor_data, before the meeting is saved or exported."""
+        for tab in self._tabs.values():
+            if tab['built']:
+                self._sync_tab(tab)
+
+    def _sync_shown_tab(self):
+        """Copy the tab being shown to editor_data, e.g. the text being typed before it is undone."""
+        tab = self._tabs.get(self.notebook.select())
+        if tab is not None and tab['built']:
+            self._sync_tab(tab)
+
+    def _set_fields(self, changes, remote=False, undoing=False):
+        """
+        Store changed fields in editor_data and record them in the journal.
+        The changes are shared with the live session, unless they came from it,
+        and become a step of the undo history, unless they came from it or from the session.
+        Input: list of (field path, value), remote is True for changes made on another laptop,
+        undoing is True for changes made by Undo or Redo
+        """
+        if not changes:
+            return
+        if self.session is not None and not remote:
+            self.session.send(changes)
+        was_clean = self.journal.count == 0
+        for path, value in changes:
+            journal.set_field(self.editor_data, path, value)
+            self.journal.append(path, value)
+            print(f"Saved {' / '.join(path)}: {value}")
+        if remote:
+            self.history.absorb(changes)
+        elif not undoing:
+            self.history.record(changes)
+        self.revision += 1
+        if was_clean:
+            self._update_title()
+        if self.journal.count >= COMPACT_EVERY:
+            self.autosave.save_now()
+        else:
+            self.autosave.touch()
+
+    def _autosave_snapshot(self):
+        """Give the autosave the meeting and the journal position it matches."""
+        return self.editor_data, self.journal.marker
+
+    def _autosave_done(self, file_path, marker):
+        """Drop the journalled edits that the autosave wrote to the meeting file."""
+        if file_path == self.journal.target_file:
+            self.journal.truncate(marker)
+            self._update_title()
+
+    def set_status(self, message):
+        """Show a message in the status bar."""
+        self.status_var.set(message)
+
+    def _compact_journal(self):
+        """Write the journalled edits into the meeting file and start a new journal."""
+        try:
+            self.file_mgr.save_meeting(self.editor_data, self.file_mgr.current_file)
+            self.journal.reset(self.file_mgr.current_file)
+        except Exception as e:
+            print(f"Error compacting the journal: {e}")
+
+    def _recover_journal(self):
+        """Replay the edits left in the journal by a session that did not save."""
+        recovered = self.journal.recover()
+        if recovered is None:
+            self.journal.reset(None)
+            return
+
+        target_file, entries = recovered
+        if target_file and os.path.exists(target_file):
+            try:
+                self.editor_data = self.file_mgr.load_meeting(target_file)
+            except Exception as e:
+                print(f"Error loading {target_file} for recovery: {e}")
+        for path, value in entries:
+            journal.set_field(self.editor_data, path, value)
+        self.revision += 1
+        self.populate_gui_fields(self.editor_data)
+
+        if self.file_mgr.current_file:
+            self._compact_journal()
+        else:
+            # keep the edits in the journal until the meeting is saved
+            self.journal.reset(None)
+            for path, value in entries:
+                self.journal.append(path, value)
+        messagebox.showinfo("Recovered Edits", f"{len(entries)} unsaved changes from the last session were restored.")
 
     def new_meeting(self):
-        self.file_mgr.new_json()
+        """Start the next meeting from the latest one in the catalog."""
+        self._wait_for_config()
+        self._sync_built_tabs()
+        if self.journal.count and not messagebox.askyesno(
+                "New Meeting", "The current meeting has unsaved changes. Start a new meeting anyway?"):
+            return
+        self.autosave.cancel()
+        self.leave_session()
+        started = time.perf_counter()
+        self.editor_data, previous_file = self.file_mgr.new_json()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for office, officer in self.editor_data['officers'].items():
+            # officers added since the last meeting come from the officer list
+            if not officer['name'] and office in self.officer_data.officers:
+                officer['name'] = self.officer_data.officers[office]['name']
+
+        self.revision += 1
+        self.populate_gui_fields(self.editor_data)
+        self.journal.reset(None)
+        self.history.replace(self.editor_data, None, "New Meeting")
+        self._update_title()
+        if previous_file:
+            self.set_status(f"New meeting carried forward from {previous_file} in {elapsed_ms:.0f} ms")
+        else:
+            self.set_status("New meeting")
 
     def open_working(self):
+        self._wait_for_config()
+        # the changes typed so far can be brought back by undoing the open
+        self._sync_built_tabs()
         loaded_data = self.file_mgr.open_json()
 
         if loaded_data:
+            self.leave_session()
             # Populated the GUI fields loaded data
             self.editor_data = loaded_data
+            self.revision += 1
             self.populate_gui_fields(self.editor_data)
+            self.journal.reset(self.file_mgr.current_file)
+            self.history.replace(self.editor_data, self.file_mgr.current_file,
+                                 f"Open {os.path.basename(self.file_mgr.current_file)}")
+            self._disk_change_shown = False
+            self._update_title()
 
     def save_working(self):
-        self.file_mgr.save_to_file(self.editor_data)
+        self._sync_built_tabs()
+        if self.file_mgr.current_file and self.journal.count == 0 and not self.file_mgr.changed_on_disk():
+            # nothing changed since the meeting was written
+            self.file_mgr.stats['skipped saves'] += 1
+            self.set_status(f"No changes to save in {self.file_mgr.current_file}")
+            return
+        self.autosave.cancel()
+        dirty_fields = self.journal.dirty_fields()
+        try:
+            saved = self.file_mgr.save_to_file(self.editor_data, my_fields=dirty_fields, resolve=self._resolve_conflicts)
+        finally:
+            merged = self._show_merged_fields()
+        if saved:
+            self._disk_change_shown = False
+            self.journal.reset(self.file_mgr.current_file)
+            self._update_title()
+            message = f"Saved {len(dirty_fields)} changed fields to {self.file_mgr.current_file}"
+            if merged:
+                message += f", with {merged} fields saved by someone else"
+            self.set_status(message)
+
+    def _show_merged_fields(self):
+        """
+        Show the fields the last save merged into editor_data, whether or not it finished.
+        Otherwise the widgets would still hold the old values and the next sync would write them back.
+        Output: the number of fields merged
+        """
+        merged = len(self.file_mgr.merged_fields)
+        self.file_mgr.merged_fields = []
+        if merged:
+            self.revision += 1
+            self.populate_gui_fields(self.editor_data)
+            self.history.sync(self.editor_data)
+        return merged
+
+    def _resolve_conflicts(self, conflicts):
+        """Ask which value to keep for the fields both users changed. Returns {path: value} or None."""
+        return dialogs.MergeConflictDialog(self.root, conflicts).show()
+
+    def _watch_meeting_file(self):
+        """Tell the user once when someone else saves the meeting file."""
+        if not self._disk_change_shown and self.file_mgr.current_file and self.file_mgr.changed_on_disk():
+            self._disk_change_shown = True
+            self.set_status(f"{self.file_mgr.current_file} was saved by someone else. Save to merge their changes.")
+        self.root.after(MEETING_WATCH_MS, self._watch_meeting_file)
 
     def save_as(self):
-        self.file_mgr.save_file_as_json(self.editor_data)
+        self._sync_built_tabs()
+        self.autosave.cancel()
+        if self.file_mgr.save_file_as_json(self.editor_data):
+            self.journal.reset(self.file_mgr.current_file)
+            self._update_title()
+            self.set_status(f"Saved {self.file_mgr.current_file}")
 
     def export_to_word(self):
-        self.file_mgr.convert_to_word(self.editor_data)
+        self._wait_for_config()
+        self._sync_built_tabs()
+        self.autosave.cancel()
+        try:
+            saved = self.file_mgr.convert_to_word(self.root, self.editor_data, self.assembly_data.assembly_info,
+                                                  changed=self.journal.count > 0, revision=self.revision,
+                                                  on_status=self.set_status, my_fields=self.journal.dirty_fields(),
+                                                  resolve=self._resolve_conflicts)
+        finally:
+            self._show_merged_fields()
+        if saved:
+            self.journal.reset(self.file_mgr.current_file)
+            self._update_title()
 
     def update_assembly_info(self):
         """Update the assemmly information."""
+        self._wait_for_config()
         assembly_dialog = dialogs.AssemblyInfoDialog(self.root, self.assembly_data)
         saved = assembly_dialog.show()
 
         if saved:
             self.assembly_data.save_assembly()
+            config.get_service().check()
             messagebox.showinfo("Assembly Info Saved", "The assembly metadata was successfully saved.")
         else:
             messagebox.showinfo("Assembly Info Not Saved", "The assembly metadata was not saved. The inforamtion was not changed.")
 
     def update_officer_info(self):
+        self._wait_for_config()
         officer_dialog = dialogs.OfficerInfoDialog(self.root, self.officer_data)
         saved = officer_dialog.show()
 
         print(saved)
+        if saved:
+            config.get_service().check()
+
+    # Undo and redo
+    def undo(self, event=None):
+        """Undo the last change to the meeting, in any tab. Bound to Ctrl+Z."""
+        self._sync_shown_tab()
+        undone = self.history.undo()
+        if undone is None:
+            self.set_status("Nothing to undo")
+        else:
+            self._show_step(*undone)
+            self.set_status(f"Undid {undone[0].label}")
+        return 'break'
+
+    def redo(self, event=None):
+        """Redo the last change undone. Bound to Ctrl+Y."""
+        self._sync_shown_tab()
+        redone = self.history.redo()
+        if redone is None:
+            self.set_status("Nothing to redo")
+        else:
+            self._show_step(*redone)
+            self.set_status(f"Redid {redone[0].label}")
+        return 'break'
+
+    def _show_step(self, step, changes):
+        """Bring the meeting to the state the history has moved to."""
+        if step.whole:
+            self._restore_meeting(self.history.current)
+        else:
+            self._set_fields(changes, undoing=True)
+            self._show_changes(changes)
 
-    # Save meeting information
-    def save_meeting_date(self, event=None):
-        date_value = self.date_entry.get().strip()
-        self.editor_data['Meeting Info']['Meeting Date'] = date_value
-        print(f"Saved meeting date: {date_value}")
-    
-    def save_start_time(self, event=None):
-        time_value = self.start_time_entry.get().strip()
-        self.editor_data['Meeting Info']['Start Time'] = time_value
-        print(f"Saved start time: {time_value}")
-
-    # Save the opening ceremony
-    def save_opening_intentions(self, event=None):
-        intentions_string = self.intentions_text.get(1.0, tk.END).strip()
-        self.editor_data['Opening Ceremony']['Intentions'] = intentions_string
-        print(f"Saved the prayer intetions: {intentions_string}")
-
-    def save_opening_prayer(self, event=None):
-        """Save the opening prayer."""
-        prayer_string = self.opening_prayer_entry.get().strip()
-        self.editor_data['Opening Ceremony']['Prayer'] = prayer_string
-        print(f"Saved the Opening Prayer: {prayer_string}")
-
-    def save_opening_prayer_leader(self, event=None):
-        """Save the the prayer leader's name."""
-        opening_leader_string = self.led_by_entry.get().strip()
-        self.editor_data['Opening Ceremony']['Leader'] = opening_leader_string
-        print(f"Saved the Prayer Leader: {opening_leader_string}")
-
-    def save_pledge_leader(self, event=None):
-        """Save the the Pledge leader's name."""
-        pledge_leader_string = self.pledge_entry.get().strip()
-        self.editor_data['Opening Ceremony']['Pledge'] = pledge_leader_string
-        print(f"Saved the Pledge Leader: {pledge_leader_string}")
-
-    # Save the meeting attendance
-    def save_attendance(self):
-        """Save the attendance data for officers."""
-        for office, var in self.attendance_vars.items():
-            self.editor_data['officers'][office]['attendance'] = var.get()
-        print('Saved  attendance data.')
-    
-    def save_other_attendees(self, event=None):
-        """Save the other attendees."""
-        attendees_string = self.other_attendees_text.get(1.0, tk.END).strip()
-        self.editor_data['attendees'] = attendees_string
-        print(f"Saved other attendees: {attendees_string}")
-
-    # Save the previous meeting minutes
-    def save_corrections(self, event=None):
-        """Save the corrections to the minutes."""
-        corrections_value = self.corrections_entry.get(1.0, tk.END).strip()
-        self.editor_data['Minutes']['Corrections'] = corrections_value
-        print(f"Saved corrections to the minutes: {corrections_value}")
-
-    def save_motion(self, event=None):
-        motion_string = self.motion_entry.get().strip()
-        self.editor_data['Minutes']['Motion to Approve'] = motion_string
-        print(f"Saved the motion: {motion_string}")
-
-    def save_second(self, event=None):
-        second_string = self.seconded_entry.get().strip()
-        self.editor_data['Minutes']['Seconded by'] = second_string
-        print(f"Saved Seconded by: {second_string}")
-
-    def save_approval(self, event=None):
-        approval_value = self.approved_combobox.get().strip()
-        self.editor_data['Minutes']['Approval'] = approval_value
-        print(f"Saved the approval vote: {approval_value}")
-
-    # Save the reports 
-    def save_friars_report(self, event=None):
-        friars_text = self.friars_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Friar'] = friars_text
-        print(f"Saved the Friars report: {friars_text}")
-
-    def save_bills(self, event=None):
-        bills_text = self.bills_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Bills'] = bills_text
-        print(f"Saved the Bills and Communications: {bills_text}")
-    
-    def save_comptrollers(self, event=None):
-        comptrollers_text = self.comptrollers_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Comptroller'] = comptrollers_text
-        print(f"Saved the Comptroller's report: {comptrollers_text}")
-
-    def save_standing_committees(self, event=None):
-        committees_text = self.committee_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Standing Committees'] = committees_text
-        print(f"Saved the Bills and Communications: {committees_text}")
-
-    def save_applications(self, event=None):
-        applications_text = self.applications_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Applications'] = applications_text
-        print(f"Saved the applications report: {applications_text}")
-
-    def save_trustees(self, event=None):
-        trustees_text = self.trustees_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Trustees'] = trustees_text
-        print(f"Saved the Trustees report: {trustees_text}")
-
-    def save_pursers(self, event=None):
-        pursers_text = self.pursers_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Reports']['Purser'] = pursers_text
-        print(f"Saved the pursers report: {pursers_text}")
-
-    # Handle the Business tab
-    def save_unfinished_business(self, event=None):
-        unfinished_business_text = self.unfinished_business_text.get(1.0, tk.END).strip()
-        self.editor_data['Business']['Unfinished Business'] = unfinished_business_text
-        print(f"Saved the Unfinished Business: {unfinished_business_text}")
-
-    def save_new_business(self, event=None):
-        new_business_text = self.new_business_text.get(1.0, tk.END).strip()
-        self.editor_data['Business']['New Business'] = new_business_text
-        print(f"Saved the New Business: {new_business_text}")
-
-    # Councils reports
-    def save_riverside(self, event=None):
-        riverside_text = self.riverside_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Council Reports']['Riverside'] = riverside_text
-        print(f"Saved the Riverside report: {riverside_text}")
-
-    def save_st_thomas(self, event=None):
-        st_thomas_text = self.st_thomas_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Council Reports']['St Thomas'] = st_thomas_text
-        print(f"Saved the St Thomas reports: {st_thomas_text}")
-
-    def save_sacred_heart(self, event=None):
-        sacred_heart_text = self.sacred_heart_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Council Reports']['Sacred Heart'] = sacred_heart_text
-        print(f"Saved the Sacred Heart report: {sacred_heart_text}")
-
-    def save_olph(self, event=None):
-        olph_text = self.olph_report_text.get(1.0, tk.END).strip()
-        self.editor_data['Council Reports']['OLPH'] = olph_text
-        print(f"Saved the OLPH report: {olph_text}")
-
-    # Closing ceremonies
-    def save_closing_prayer(self, event=None):
-        prayer_text = self.closing_prayer_entry.get().strip()
-        self.editor_data['Closing Ceremony']['Closing Prayer'] = prayer_text
-        print(f"Saved Closing prayer: {prayer_text}")
-
-    def save_closing_intentions(self, event=None):
-        intentions_text = self.closing_prayer_intentions_text.get(1.0, tk.END)
-        self.editor_data['Closing Ceremony']['Intentions'] = intentions_text
-        print(f"Saved the closing intentions: {intentions_text}")
-
-    def save_closing_leader(self, event=None):
-        prayer_leader_text = self.closing_led_by_entry.get().strip()
-        self.editor_data['Closing Ceremony']['Leader'] = prayer_leader_text
-        print(f"Saved the closing intentions: {prayer_leader_text}")
-
-    def save_adjourned_time(self, event=None):
-        adjourned_text = self.adjourned_time_entry.get().strip()
-        self.editor_data['Closing Ceremony']['Adjurned At'] = adjourned_text
-        print(f"Saved the closing intentions: {adjourned_text}")
-
-    def save_next_officers_mtg(self, event=None):
-        next_officers_mtg_text = self.next_officers_meeting_entry.get().strip()
-        self.editor_data['Closing Ceremony']['Next Officers Meeting'] = next_officers_mtg_text
-        print(f"Saved the closing intentions: {next_officers_mtg_text}")
-
-    def save_next_bus_mtg(self, event=None):
-        next_business_mtg_text = self.next_business_meeting_entry.get().strip()
-        self.editor_data['Closing Ceremony']['Next Business Meeting'] = next_business_mtg_text
-        print(f"Saved the closing intentions: {next_business_mtg_text}")
-
-    def save_financials(self, event=None):
+    def _restore_meeting(self, state):
         """
-        Save the financial report tab to working JSON
-        
-        :param self: Description
-        :param event: The function is called when the "Save" button is clicked 
-        or the tab is changed.
+        Show a whole meeting from the history, e.g. the one that was open before a meeting was opened.
+        Its differences from its file are journalled, so they are saved like any other change.
         """
-        # Save the data from the general account
-        self.editor_data['Financials']['General']['Start Balance'] = self.general_start_entry.get().strip()
-        self.editor_data['Financials']['General']['Receipts'] = self.general_receipts_entry.get().strip()
-        self.editor_data['Financials']['General']['Deposits'] = self.general_deposit_entry.get().strip()
-        self.editor_data['Financials']['General']['Disbursements'] = self.general_spent_entry.get().strip()
-        self.editor_data['Financials']['General']['End Balance'] = self.general_end_entry.get().strip()
-
-        # Save the data from the Chalice account
-        self.editor_data['Financials']['Chalice']['Start Balance'] = self.chalice_start_entry.get().strip()
-        self.editor_data['Financials']['Chalice']['Receipts'] = self.chalice_receipts_entry.get().strip()
-        self.editor_data['Financials']['Chalice']['Deposits'] = self.chalice_deposit_entry.get().strip()
-        self.editor_data['Financials']['Chalice']['Disbursements'] = self.chalice_spent_entry.get().strip()
-        self.editor_data['Financials']['Chalice']['End Balance'] = self.chalice_end_entry.get().strip()
-
-        # Sve the data from the Flag account 
-        self.editor_data['Financials']['Flag']['Start Balance'] = self.flag_start_entry.get().strip()
-        self.editor_data['Financials']['Flag']['Receipts'] = self.flag_receipts_entry.get().strip()
-        self.editor_data['Financials']['Flag']['Deposits'] = self.flag_deposit_entry.get().strip()
-        self.editor_data['Financials']['Flag']['Disbursements'] = self.flag_spent_entry.get().strip()
-        self.editor_data['Financials']['Flag']['End Balance'] = self.flag_end_entry.get().strip()
-
-        # Save the deposits and withdrawals.
-        self.editor_data['Financials']['Withdrawals'] = self.withdrawal_text.get(1.0, tk.END).strip()
-        self.editor_data['Financials']['Deposits'] = self.deposit_text.get(1.0, tk.END).strip()
-
-        print(f"Saving finincials: {self.editor_data['Financials']}")
-
+        self.leave_session()
+        self.autosave.cancel()
+        on_disk = None
+        if state.file and os.path.exists(state.file):
+            try:
+                on_disk = self.file_mgr.load_meeting(state.file)
+            except Exception as e:
+                print(f"Error loading {state.file}: {e}")
+        self.file_mgr.current_file = state.file
+        if on_disk is None:
+            on_disk = schema.default_editor_data()
+        # the history's trees are never changed, the editor changes editor_data in place
+        self.editor_data = copy.deepcopy(state.meeting)
+        self.journal.reset(state.file)
+        for path in sharing.changed_paths(on_disk, self.editor_data):
+            self.journal.append(path, journal.get_field(self.editor_data, path, ''))
+        self.revision += 1
+        self.populate_gui_fields(self.editor_data)
+        self._disk_change_shown = False
+        self._update_title()
+
+    # Live session
+    def host_session(self):
+        """Share the meeting with other laptops on the network."""
+        self._wait_for_config()
+        if self.session is not None:
+            return
+        self._sync_built_tabs()
+        try:
+            self.session = live_session.LiveSession.host(self.editor_data)
+        except OSError as e:
+            messagebox.showerror("Host Live Session", f"Cannot host a live session: {e}")
+            return
+        self.root.after(live_session.BATCH_MS, self._poll_session)
+        self.set_status(f"Hosting a live session on port {self.session.port}. "
+                        f"Others join with this computer's name or address.")
+
+    def join_session(self):
+        """Edit the meeting of another laptop's live session. The meeting open here is replaced."""
+        self._wait_for_config()
+        if self.session is not None:
+            return
+        self._sync_built_tabs()
+        if self.journal.count and not messagebox.askyesno(
+                "Join Live Session", "The current meeting has unsaved changes. Join a live session anyway?"):
+            return
+        address = simpledialog.askstring("Join Live Session", "Host name or address (name:port for another port):",
+                                         parent=self.root)
+        if not address:
+            return
+        host, _, port = address.strip().partition(':')
+        try:
+            self.session = live_session.LiveSession.join(host, int(port or live_session.SESSION_PORT))
+        except (live_session.SessionError, ValueError) as e:
+            messagebox.showerror("Join Live Session", str(e))
+            return
+
+        self.autosave.cancel()
+        self.editor_data = schema.default_editor_data()
+        for path, value in self.session.state.fields():
+            journal.set_field(self.editor_data, path, value)
+        # the meeting belongs to the host; it is saved here only with Save As
+        self.file_mgr.current_file = None
+        self.revision += 1
+        self.populate_gui_fields(self.editor_data)
+        self.journal.reset(None)
+        self.history.replace(self.editor_data, None, f"Join the live session of {host}")
+        self._update_title()
+        self.root.after(live_session.BATCH_MS, self._poll_session)
+        self.set_status(f"Joined the live session of {host}")
+
+    def leave_session(self):
+        """Stop sharing the meeting. The meeting stays open as it is."""
+        if self.session is None:
+            return
+        self.session.close()
+        self.session = None
+        self.set_status("Left the live session")
+
+    def _poll_session(self):
+        """
+        Every BATCH_MS: share what was typed into the shown tab, and show what was typed on the other laptops.
+        The shown tab is read first so that the changes made here are in the session before those of the others.
+        """
+        if self.session is None:
+            return
+        self._sync_shown_tab()
+        changes = self.session.poll()
+        if changes:
+            self._apply_remote(changes)
+        self.root.after(live_session.BATCH_MS, self._poll_session)
+
+    def _apply_remote(self, changes):
+        """Store the changes made on other laptops and show them."""
+        self._set_fields(changes, remote=True)
+        self._show_changes(changes)
+
+    def _show_changes(self, changes):
+        """Show changed fields in the widgets that are built. Input: list of (field path, value)"""
+        fields = {field.path: field for field in schema.FIELDS if field.kind != 'roll call'}
+        assignments = []
+        for path, value in changes:
+            if path[0] == 'officers' and path[-1] == 'attendance' and 'attendance' in self.widgets:
+                var = self.widgets['attendance'].get(path[1])
+                if var is not None:
+                    assignments += (str(var), value)
+                continue
+            field = fields.get(path)
+            if field is None or field.id not in self.widgets:
+                continue
+            if field.kind == 'text':
+                self._patch_text(self.widgets[field.id], value)
+            else:
+                self._write_widget(field, value, assignments)
+        if assignments:
+            self.root.tk.call('apply', SET_VARIABLES, tuple(assignments))
+
+    @staticmethod
+    def _patch_text(widget, value):
+        """
+        Change the text of a text box to value by replacing only the part that differs,
+        so the cursor and the view stay where they are while someone else types.
+        """
+        shown = widget.get(1.0, 'end-1c')
+        # the whitespace around the text is not part of the field, see _read_widget
+        start = len(shown) - len(shown.lstrip())
+        old = shown.strip()
+        prefix = 0
+        limit = min(len(old), len(value))
+        while prefix < limit and old[prefix] == value[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == value[-1 - suffix]:
+            suffix += 1
+        first = f'1.0 + {start + prefix} chars'
+        widget.delete(first, f'1.0 + {start + len(old) - suffix} chars')
+        widget.insert(first, value[prefix:len(value) - suffix])
+
+    # Move data between editor_data and the widgets
     def populate_gui_fields(self, data):
-        # load Meeting Info tab
-        if 'Meeting Info' in data:
-            self.date_entry.delete(0, tk.END)
-            self.date_entry.insert(0, data['Meeting Info'].get('Meeting Date', ''))
-
-            self.start_time_entry.delete(0, tk.END)
-            self.start_time_entry.insert(0, data['Meeting Info'].get('Start Time', ''))
-        # load Opening Ceremonies tab
-        if 'Opening Ceremony' in data:
-            self.intentions_text.delete(1.0, tk.END)
-            self.intentions_text.insert(1.0, data['Opening Ceremony'].get('Intentions', ''))
-
-            self.opening_prayer_entry.delete(0, tk.END)
-            self.opening_prayer_entry.insert(0, data['Opening Ceremony'].get('Prayer', ''))
-
-            self.led_by_entry.delete(0, tk.END)
-            self.led_by_entry.insert(0, data['Opening Ceremony'].get('Leader'))
-
-            self.pledge_entry.delete(0, tk.END)
-            self.pledge_entry.insert(0, data['Opening Ceremony'].get('Pledge', ''))
-        # load Roll Call tab
-        if 'officers' in data:
-            for office, info in data['officers'].items():
-                if office in self.attendance_vars:
-                    self.attendance_vars[office].set(info.get('attendance', 'Present'))
-        
-        if 'attendees' in data:
-            self.other_attendees_text.delete(1.0, tk.END)
-            self.other_attendees_text.insert(1.0, data.get('attendees', ''))
-        # load Minutes tab
-        if 'Minutes' in data:
-            self.corrections_entry.delete(1.0, tk.END)
-            self.corrections_entry.insert(1.0, data['Minutes'].get('Corrections', ''))
-            
-            self.motion_entry.delete(0, tk.END)
-            self.motion_entry.insert(0, data['Minutes'].get('Motion to Approve', ''))
-            
-            self.seconded_entry.delete(0, tk.END)
-            self.seconded_entry.insert(0, data['Minutes'].get('Seconded by', ''))
-            
-            # Set combobox value
-            approval = data['Minutes'].get('Approval', 'Approved')
-            self.approved_combobox.set(approval)
-        # load Reports tab
-        if 'Reports' in data:
-            self.friars_report_text.delete(1.0, tk.END)
-            self.friars_report_text.insert(1.0, data['Reports'].get('Friar', ''))
-
-            self.bills_report_text.delete(1.0, tk.END)
-            self.bills_report_text.insert(1.0, data['Reports'].get('Bills', ''))
-
-            self.comptrollers_report_text.delete(1.0, tk.END)
-            self.comptrollers_report_text.insert(1.0, data['Reports'].get('Comptroller', ''))
-
-            self.pursers_report_text.delete(1.0, tk.END)
-            self.pursers_report_text.insert(1.0, data['Reports'].get('Purser', ''))
-
-            self.committee_report_text.delete(1.0, tk.END)
-            self.committee_report_text.insert(1.0, data['Reports'].get('Standing Committees'))
-
-            self.applications_report_text.delete(1.0, tk.END)
-            self.applications_report_text.insert(1.0, data['Reports'].get('Applications', ''))
-
-            self.trustees_report_text.delete(1.0, tk.END)
-            self.trustees_report_text.insert(1.0, data['Reports'].get('Trustees', ''))
-        # load Business tab
-        if 'Business' in data:
-            self.unfinished_business_text.delete(1.0, tk.END)
-            self.unfinished_business_text.insert(1.0, data['Business'].get('Unfinished Business'), '')
-
-            self.new_business_text.delete(1.0, tk.END)
-            self.new_business_text.insert(1.0, data['Business'].get('New Business', ''))
-        # load Council tab
-        if 'Council Reports' in data:
-            self.riverside_report_text.delete(1.0, tk.END)
-            self.riverside_report_text.insert(1.0, data['Council Reports'].get('Riverside'), '')
-
-            self.st_thomas_report_text.delete(1.0, tk.END)
-            self.st_thomas_report_text.insert(1.0, data['Council Reports'].get('St Thomas'), '')
-            
-            self.sacred_heart_report_text.delete(1.0, tk.END)
-            self.sacred_heart_report_text.insert(1.0, data['Council Reports'].get('Sacred Heart'), '')
-
-            self.olph_report_text.delete(1.0, tk.END)
-            self.olph_report_text.insert(1.0, data['Council Reports'].get('OLPH'), '')
-
-        # load Closing Ceremony tab
-        if 'Closing Ceremony' in data:
-            self.closing_prayer_entry.delete(0, tk.END)
-            self.closing_prayer_entry.insert(0, data['Closing Ceremony'].get('Closing Prayer', ''))
-
-            self.closing_prayer_intentions_text.delete(1.0, tk.END)
-            self.closing_prayer_intentions_text.insert(1.0, data['Closing Ceremony'].get('Intentions'), '')
-
-            self.closing_led_by_entry.delete(0, tk.END)
-            self.closing_led_by_entry.insert(0, data['Closing Ceremony'].get('Leader', ''))
-
-            self.adjourned_time_entry.delete(0, tk.END)
-            self.adjourned_time_entry.insert(0, data['Closing Ceremony'].get('Adjurned At', ''))
-
-            self.next_officers_meeting_entry.delete(0, tk.END)
-            self.next_officers_meeting_entry.insert(0, data['Closing Ceremony'].get('Next Officers Meeting', ''))
-
-            self.next_business_meeting_entry.delete(0, tk.END)
-            self.next_business_meeting_entry.insert(0, data['Closing Ceremony'].get('Next Business Meeting', ''))
-        
-        # TODO: load Financial Report
-        if 'Financials' in data:
-            # Load the general account data
-            self.general_start_entry.delete(0, tk.END)
-            self.general_start_entry.insert(0, data['Financials']['General'].get('Start Balance', ''))  
-            self.general_receipts_entry.delete(0, tk.END)
-            self.general_receipts_entry.insert(0, data['Financials']['General'].get('Receipts', ''))
-            self.general_deposit_entry.delete(0, tk.END)
-            self.general_deposit_entry.insert(0, data['Financials']['General'].get('Deposits', ''))
-            self.general_spent_entry.delete(0, tk.END)
-            self.general_spent_entry.insert(0, data['Financials']['General'].get('Disbursements', ''))
-            self.general_end_entry.delete(0, tk.END)
-            self.general_end_entry.insert(0, data['Financials']['General'].get('End Balance', ''))
-
-            # Load the Chalice acccount data
-            self.chalice_start_entry.delete(0, tk.END)
-            self.chalice_start_entry.insert(0, data['Financials']['Chalice'].get('Start Balance', ''))  
-            self.chalice_receipts_entry.delete(0, tk.END)
-            self.chalice_receipts_entry.insert(0, data['Financials']['Chalice'].get('Receipts', ''))
-            self.chalice_deposit_entry.delete(0, tk.END)
-            self.chalice_deposit_entry.insert(0, data['Financials']['Chalice'].get('Deposits', ''))
-            self.chalice_spent_entry.delete(0, tk.END)
-            self.chalice_spent_entry.insert(0, data['Financials']['Chalice'].get('Disbursements', ''))
-            self.chalice_end_entry.delete(0, tk.END)
-            self.chalice_end_entry.insert(0, data['Financials']['Chalice'].get('End Balance', ''))
-
-            # Load the Flag account data
-            self.flag_start_entry.delete(0, tk.END)
-            self.flag_start_entry.insert(0, data['Financials']['Flag'].get('Start Balance', ''))  
-            self.flag_receipts_entry.delete(0, tk.END)
-            self.flag_receipts_entry.insert(0, data['Financials']['Flag'].get('Receipts', ''))
-            self.flag_deposit_entry.delete(0, tk.END)
-            self.flag_deposit_entry.insert(0, data['Financials']['Flag'].get('Deposits', ''))
-            self.flag_spent_entry.delete(0, tk.END)
-            self.flag_spent_entry.insert(0, data['Financials']['Flag'].get('Disbursements', ''))
-            self.flag_end_entry.delete(0, tk.END)
-            self.flag_end_entry.insert(0, data['Financials']['Flag'].get('End Balance', ''))
-
-            # Load the deposits and withdrawals.
-            self.withdrawal_text.delete(1.0, tk.END)
-            self.withdrawal_text.insert(1.0, data['Financials'].get('Withdrawals', ''))
-            self.deposit_text.delete(1.0, tk.END)
-            self.deposit_text.insert(1.0, data['Financials'].get('Deposits', ''))
+        """Fill the tabs that have been built. The other tabs are filled from editor_data when they are first shown."""
+        self._populate_tabs([tab for tab in self._tabs.values() if tab['built']], data)
+
+    def _populate_tabs(self, tabs, data):
+        """
+        Fill the widgets of tabs in one pass over their fields.
+        The frames do not resize while they are filled, and the entries, lists
+        and attendance buttons are all set by one Tcl call through their variables.
+        """
+        assignments = []            # variable name, value, variable name, value, ...
+        for tab in tabs:
+            tab['frame'].grid_propagate(False)
+        try:
+            for tab in tabs:
+                spec = tab['spec']
+                values = schema.read_values(data, spec.fields)
+                for field in spec.fields:
+                    if field.id in self.widgets:
+                        self._write_widget(field, values[field.id], assignments)
+            if assignments:
+                self.root.tk.call('apply', SET_VARIABLES, tuple(assignments))
+        finally:
+            for tab in tabs:
+                tab['frame'].grid_propagate(True)
+
+    def _run_populate_benchmark(self):
+        """
+        --bench-populate: open meetings one after another and time how long
+        the tabs take to fill, including the layout and drawing Tk does afterwards.
+        With all tabs built every tab is filled, as before the tabs were built on first selection;
+        otherwise only the tab shown with the window is.
+        """
+        import resource
+        meeting_files, count, all_tabs = self.populate_benchmark
+        if all_tabs:
+            self._build_all_tabs()
+        self.root.update()
+
+        times = []
+        for index in range(count):
+            data = self.file_mgr.load_meeting(meeting_files[index % len(meeting_files)])
+            start = time.perf_counter()
+            self.editor_data = data
+            self.populate_gui_fields(data)
+            self.root.update_idletasks()
+            times.append(time.perf_counter() - start)
+
+        times.sort()
+        mean = sum(times) / len(times)
+        p95 = times[max(0, -(-len(times) * 95 // 100) - 1)]
+        built = sum(tab['built'] for tab in self._tabs.values())
+        print(f"Populated {count} meetings from {len(meeting_files)} files, {built} of {len(self._tabs)} tabs built")
+        print(f"mean {mean * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms, max {times[-1] * 1000:.2f} ms")
+        print(f"peak memory {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+        self.root.destroy()
+
+    def _show_tab_timed(self, name):
+        """Select a tab and return the seconds until Tk has laid it out and drawn it."""
+        start = time.perf_counter()
+        self.notebook.select(name)
+        self.root.update()
+        return time.perf_counter() - start
+
+    def _run_tabs_benchmark(self):
+        """
+        --bench-tabs: time showing each tab the first time, when its widgets are created
+        and filled, and then again once it is built, for a number of rounds.
+        """
+        data, rounds = self.tabs_benchmark
+        self.editor_data = data
+        self.populate_gui_fields(data)
+        names = list(self._tabs)
+        # the first tab was built with the window, so it is rebuilt last, once it is hidden
+        order = names[1:] + names[:1]
+        for name in order[:-1]:
+            if self._tabs[name]['built']:
+                self._teardown_tab(self._tabs[name])
+        self.root.update()
+
+        first = {}
+        for name in order:
+            if self._tabs[name]['built']:
+                self._teardown_tab(self._tabs[name])
+            first[name] = self._show_tab_timed(name)
+        shown = {name: [] for name in names}
+        for _ in range(rounds):
+            for name in order:
+                shown[name].append(self._show_tab_timed(name))
+
+        print(f"{'tab':<24}{'first ms':>10}{'mean ms':>10}{'p95 ms':>10}   re-shown {rounds} times")
+        for name in names:
+            times = sorted(shown[name])
+            p95 = times[max(0, -(-len(times) * 95 // 100) - 1)]
+            print(f"{self._tabs[name]['text']:<24}{first[name] * 1000:>10.2f}"
+                  f"{sum(times) / len(times) * 1000:>10.2f}{p95 * 1000:>10.2f}")
+        self.root.destroy()
+
+    def _read_widget(self, field):
+        """Return the value shown by the widget of a field."""
+        widget = self.widgets[field.id]
+        if field.kind == 'roll call':
+            return {office: var.get() for office, var in widget.items()}
+        if field.kind == 'text':
+            return widget.get(1.0, tk.END).strip()
+        return widget.get().strip()
+
+    def _write_widget(self, field, value, assignments):
+        """
+        Show a value in the widget of a field.
+        Input: the field, its value, the list collecting the variables to set for _populate_tabs
+        """
+        widget = self.widgets[field.id]
+        if field.kind == 'roll call':
+            for office, attendance in value.items():
+                if office in widget:
+                    # no button is selected until the attendance is taken
+                    assignments += (str(widget[office]), attendance)
+        elif field.kind == 'text':
+            widget.replace(1.0, tk.END, value or '')
+            # opening a meeting is not an edit that can be undone
+            widget.edit_reset()
+            widget.edit_modified(False)
+        elif field.kind == 'choice':
+            assignments += (str(self._field_vars[field.id]), value or field.options['values'][0])
+        else:
+            assignments += (str(self._field_vars[field.id]), value or '')
+
 
     # Create the GUI
     def _create_menubar(self):
@@ -466,319 +850,114 @@ class EditorGui:
         file_menu.add_separator()
         file_menu.add_command(label='Export to Word', command=self.export_to_word)
 
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+        edit_menu.add_command(label='Undo', accelerator='Ctrl+Z', command=self.undo)
+        edit_menu.add_command(label='Redo', accelerator='Ctrl+Y', command=self.redo)
+        self.root.bind_all('<Control-z>', self.undo)
+        self.root.bind_all('<Control-y>', self.redo)
+
         # Add the Info menu to change Assembly and Officer data
         info_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Info", menu=info_menu)
         info_menu.add_command(label='Update Assembly Information', command=self.update_assembly_info)
         info_menu.add_command(label="Update Officer Information", command=self.update_officer_info)
 
+        session_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Session", menu=session_menu)
+        session_menu.add_command(label='Host Live Session', command=self.host_session)
+        session_menu.add_command(label='Join Live Session...', command=self.join_session)
+        session_menu.add_command(label='Leave Live Session', command=self.leave_session)
+
         menubar.add_command(label='Quit', command=self.root.quit)
 
+    def _create_status_bar(self):
+        # Show save messages without interrupting the user
+        self.status_var = tk.StringVar(value='Ready')
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, anchor='w', relief=tk.SUNKEN)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
     def _create_notebook(self):
         # Create a notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-    def _create_meeting_info_tab(self):
-        #create the Meeting Info tab
-        info_tab = ttk.Frame(self.notebook)
-        self.notebook.add(info_tab, text='Meeting Info')
-        ttk.Label(info_tab, text="Meeting Date:", font=DISPLAY_FONT).grid(column=0, row=0, sticky=tk.E, padx=5, pady=5)
-        self.date_entry = ttk.Entry(info_tab, width=30)
-        self.date_entry.grid(column=1, row=0, sticky=tk.W, padx=5, pady=5)
-        self.date_entry.bind('<FocusOut>', self.save_meeting_date)
-
-        ttk.Label(info_tab, text="Starting Time:", font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.E, padx=5, pady=5)
-        self.start_time_entry = ttk.Entry(info_tab, width=30)
-        self.start_time_entry.grid(column=1, row=1, sticky=tk.W, padx=5, pady=5)
-        self.start_time_entry.bind('<FocusOut>', self.save_start_time)
-
-    def _create_opening_ceremony_tab(self):
-        # create the Opening Ceremony tab
-        # TODO: make the scrolled text box match window resizing
-        opening_tab = ttk.Frame(self.notebook)
-        self.notebook.add(opening_tab, text='Opening Ceremony')
-        item_row = 0
-        ttk.Label(opening_tab, text='Intentions:', font=DISPLAY_FONT, anchor='w').grid(column=0, row=item_row, sticky=tk.W, padx=5, pady=5)
-        self.intentions_text = scrolledtext.ScrolledText(opening_tab, width=80, height=5)
-        self.intentions_text.grid(column=1, row=item_row, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.intentions_text.bind('<FocusOut>', self.save_opening_intentions)
-        item_row += 1
-        ttk.Label(opening_tab, text='Opening Prayer:', font=DISPLAY_FONT, anchor='w').grid(column=0, row=item_row, sticky=tk.W, padx=5, pady=5)
-        self.opening_prayer_entry = ttk.Entry(opening_tab, width=50, font=DISPLAY_FONT)
-        self.opening_prayer_entry.grid(column=1, row=item_row, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.opening_prayer_entry.bind('<FocusOut>', self.save_opening_prayer)
-        item_row += 1
-        ttk.Label(opening_tab, text='Led by:', font=DISPLAY_FONT, anchor='w').grid(column=0, row=item_row, sticky=tk.W, padx=5, pady=5)
-        self.led_by_entry = ttk.Entry(opening_tab, width=50, font=DISPLAY_FONT)
-        self.led_by_entry.grid(column=1, row=item_row, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.led_by_entry.bind('<FocusOut>', self.save_opening_prayer_leader)
-        item_row += 1
-        ttk.Label(opening_tab, text='Pledge led by', font=DISPLAY_FONT, anchor='w').grid(column=0, row=item_row, sticky=tk.W, padx=5, pady=5)
-        self.pledge_entry = ttk.Entry(opening_tab, width=50, font=DISPLAY_FONT)
-        self.pledge_entry.grid(column=1, row=item_row, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.pledge_entry.bind('<FocusOut>', self.save_pledge_leader)
-
-    def _create_roll_call_tab(self):
-        # create the Roll Call tab
-        roll_call_tab = ttk.Frame(self.notebook)
-        self.notebook.add(roll_call_tab, text='Roll Call')
-        roll_call_tab.rowconfigure(0, weight=1)
-        roll_call_tab.rowconfigure(1, weight=1)
-        roll_call_tab.rowconfigure(2, weight=1)
-        roll_call_tab.rowconfigure(3, weight=1)
-        roll_call_tab.rowconfigure(4, weight=1)
-        roll_call_tab.rowconfigure(5, weight=1)
-        roll_call_tab.rowconfigure(6, weight=1)
-        roll_call_tab.rowconfigure(7, weight=1)
-        roll_call_tab.rowconfigure(8, weight=1)
-        roll_call_tab.rowconfigure(9, weight=1)
-        roll_call_tab.rowconfigure(10, weight=1)
-        roll_call_tab.rowconfigure(11, weight=1)
-        roll_call_tab.rowconfigure(12, weight=1)
-        roll_call_tab.rowconfigure(13, weight=1)
-        roll_call_tab.rowconfigure(14, weight=1)
-        roll_call_tab.columnconfigure(0, weight=1)
-        roll_call_tab.columnconfigure(1, weight=1)
-        roll_call_tab.columnconfigure(2, weight=1)
-        roll_call_tab.columnconfigure(3, weight=1)
-        roll_call_tab.columnconfigure(4, weight=1)
-        # 
-        ttk.Label(roll_call_tab, text='Office', font=DISPLAY_FONT, anchor='w').grid(column=0, row=0, padx=5, pady=5, sticky='w')
-        ttk.Label(roll_call_tab, text='Name', font=DISPLAY_FONT, anchor='w').grid(column=1, row=0, padx=5, pady=5, sticky='w')
-        ttk.Label(roll_call_tab, text='Attendance', font=DISPLAY_FONT, anchor='w').grid(column=2, columnspan=3, row=0, padx=5, pady=5, sticky='w')
-
-        # officer_data = officers.OfficerDatabase().officers
-        row_index = 1
-        self.attendance_vars = {}
-
-        for office, info in self.officer_data.officers.items():
-            var = tk.StringVar(value='Present')
-            self.attendance_vars[office] = var
-
-            ttk.Label(roll_call_tab, text=office, font=DISPLAY_FONT, anchor='w').grid(column=0, row=row_index, padx=5, pady=5, sticky='w')
-            ttk.Label(roll_call_tab, text=info["name"], font=DISPLAY_FONT, anchor='w').grid(column=1, row=row_index, padx=5, pady=5, sticky='w')
-            if officers.OfficerDatabase().officers[office]['name'].lower() != "vacant":
-                ttk.Radiobutton(roll_call_tab, text='Present', value='Present', variable=var, command=self.save_attendance).grid(column=2, row=row_index, padx=5, pady=5, sticky='w')
-                ttk.Radiobutton(roll_call_tab, text='Absent', value='Absent', variable=var, command=self.save_attendance).grid(column=3, row=row_index, padx=5, pady=5, sticky='w')
-                ttk.Radiobutton(roll_call_tab, text='Excused', value='Excused', variable=var, command=self.save_attendance).grid(column=4, row=row_index, padx=5, pady=5, sticky='w')
-            
-            row_index += 1
-
-        ttk.Label(roll_call_tab, text='Other Attendees:', font=DISPLAY_FONT).grid(column=0, row=14, sticky=tk.EW, padx=5, pady=5)
-        self.other_attendees_text = scrolledtext.ScrolledText(roll_call_tab, width=80, height=5)
-        self.other_attendees_text.grid(column=1, row=14, columnspan=4, sticky=tk.NSEW, padx=5, pady=5)
-        self.other_attendees_text.bind('<FocusOut>', self.save_other_attendees)
-
-    def _create_minutes_tab(self):
-        # create a tab for the Minutes
-        minutes_tab = ttk.Frame(self.notebook)
-        self.notebook.add(minutes_tab, text='Minutes')
-        minutes_tab.columnconfigure(0, weight=1)
-        minutes_tab.columnconfigure(1, weight=4)
-        ttk.Label(minutes_tab, text='Reading of Minutes:', font=DISPLAY_FONT).grid(column=0, row=0, columnspan=5, sticky=tk.N, padx=5, pady=5)
-        ttk.Label(minutes_tab, text='Corrections:', font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.EW, padx=5, pady=5)
-        self.corrections_entry = scrolledtext.ScrolledText(minutes_tab, width=80, height=5)
-        self.corrections_entry.grid(column=2, row=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.corrections_entry.bind('<FocusOut>', self.save_corrections)
-        ttk.Label(minutes_tab, text='Motion to Approve:', font=DISPLAY_FONT).grid(column=0, row=2, sticky=tk.EW, padx=5, pady=5)
-        self.motion_entry = ttk.Entry(minutes_tab, width=50, font=DISPLAY_FONT)
-        self.motion_entry.grid(column=2, row=2, sticky=tk.W, padx=5, pady=5)
-        self.motion_entry.bind('<FocusOut>', self.save_motion)
-        ttk.Label(minutes_tab, text='Seconded by:', font=DISPLAY_FONT).grid(column=0, row=3, sticky=tk.EW, padx=5, pady=5)
-        self.seconded_entry = ttk.Entry(minutes_tab, width=50, font=DISPLAY_FONT)
-        self.seconded_entry.grid(column=2, row=3, sticky=tk.W, padx=5, pady=5)
-        self.seconded_entry.bind('<FocusOut>', self.save_second)
-        ttk.Label(minutes_tab, text='Approval:', font=DISPLAY_FONT).grid(column=0, row=4, sticky=tk.EW, padx=5, pady=5)
-        self.approved_combobox = ttk.Combobox(minutes_tab, width=20, values=('Approved', 'Corrected', 'Tabled'), state='readonly')
-        self.approved_combobox.grid(column=2, row=4, sticky=tk.W, padx=5, pady=5)
-        self.approved_combobox.current(0)
-        self.approved_combobox.bind('<<ComboboxSelected>>', self.save_approval)
-
-    def _create_reports_tab(self):
-        # create the Reports tab
-        reports_tab = ttk.Frame(self.notebook)
-        self.notebook.add(reports_tab, text='Reports')
-        reports_tab.rowconfigure(0, weight=1)
-        reports_tab.rowconfigure(1, weight=1)
-        reports_tab.rowconfigure(2, weight=1)
-        reports_tab.rowconfigure(3, weight=1)
-        reports_tab.rowconfigure(4, weight=1)
-        reports_tab.rowconfigure(5, weight=1)
-        reports_tab.rowconfigure(6, weight=1)
-        reports_tab.columnconfigure(0, weight=1)
-        reports_tab.columnconfigure(1, weight=3)
-        ttk.Label(reports_tab, text="Faithful Friars Report:", font=DISPLAY_FONT).grid(column=0, row=0, sticky=tk.NW, padx=5, pady=5)
-        self.friars_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.friars_report_text.grid(column=1, row=0, sticky='nsew', padx=5, pady=5)
-        self.friars_report_text.bind('<FocusOut>', self.save_friars_report)
-        ttk.Label(reports_tab, text="Bills and Communications:", font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.W, padx=5, pady=5)
-        self.bills_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.bills_report_text.grid(column=1, row=1, sticky='nsew', padx=5, pady=5)
-        self.bills_report_text.bind('<FocusOut>', self.save_bills)
-        ttk.Label(reports_tab, text="Faithful Comptroller Report:", font=DISPLAY_FONT).grid(column=0, row=2, sticky=tk.W, padx=5, pady=5)
-        self.comptrollers_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.comptrollers_report_text.grid(column=1, row=2, sticky='nsew', padx=5, pady=5)
-        self.comptrollers_report_text.bind('<FocusOut>', self.save_comptrollers)
-        ttk.Label(reports_tab, text="Faithful Purser's Report:", font=DISPLAY_FONT).grid(column=0, row=3, sticky=tk.W, padx=5, pady=5)
-        self.pursers_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.pursers_report_text.grid(column=1, row=3, sticky='nsew', padx=5, pady=5)
-        self.pursers_report_text.bind('<FocusOut>', self.save_pursers)
-        ttk.Label(reports_tab, text="Standing Committees Report:", font=DISPLAY_FONT).grid(column=0, row=4, sticky=tk.W, padx=5, pady=5)
-        self.committee_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.committee_report_text.grid(column=1, row=4, sticky='nsew', padx=5, pady=5)
-        self.committee_report_text.bind('<FocusOut>', self.save_standing_committees)
-        ttk.Label(reports_tab, text="Reading of Applications:", font=DISPLAY_FONT).grid(column=0, row=5, sticky=tk.W, padx=5, pady=5)
-        self.applications_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.applications_report_text.grid(column=1, row=5, sticky='nsew', padx=5, pady=5)
-        self.applications_report_text.bind('<FocusOut>', self.save_applications)
-        ttk.Label(reports_tab, text="Trustees Report:", font=DISPLAY_FONT).grid(column=0, row=6, sticky=tk.W, padx=5, pady=5)
-        self.trustees_report_text = scrolledtext.ScrolledText(reports_tab, wrap=tk.WORD)
-        self.trustees_report_text.grid(column=1, row=6, sticky='nsew', padx=5, pady=5)
-        self.trustees_report_text.bind('<FocusOut>', self.save_trustees)
-
-    def _create_business_tab (self):
-        # create the Business tab
-        business_tab = ttk.Frame(self.notebook)
-        self.notebook.add(business_tab, text='Business')
-        business_tab.rowconfigure(0, weight=1)
-        business_tab.rowconfigure(1, weight=1)
-        business_tab.columnconfigure(0, weight=1)
-        business_tab.columnconfigure(1, weight=3)
-
-        ttk.Label(business_tab, text='Unfinished Business:', font=DISPLAY_FONT).grid(column=0, row=0, sticky=tk.NW, padx=5, pady=5)
-        self.unfinished_business_text = scrolledtext.ScrolledText(business_tab, wrap=tk.WORD)
-        self.unfinished_business_text.grid(column=1, row=0, sticky='nsew', padx=5, pady=5)
-        self.unfinished_business_text.bind('<FocusOut>', self.save_unfinished_business)
-        ttk.Label(business_tab, text='New Business:', font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.NW, padx=5, pady=5)
-        self.new_business_text = scrolledtext.ScrolledText(business_tab, wrap=tk.WORD)
-        self.new_business_text.grid(column=1, row=1, sticky='nsew', padx=5, pady=5)
-        self.new_business_text.bind('<FocusOut>', self.save_new_business)
-
-    def _create_council_tab(self): 
-        # create a tab for the Council reports
-        council_tab = ttk.Frame(self.notebook)
-        self.notebook.add(council_tab, text='Council Reports')
-        council_tab.rowconfigure(0, weight=1)
-        council_tab.rowconfigure(1, weight=1)
-        council_tab.rowconfigure(2, weight=1)
-        council_tab.rowconfigure(3, weight=1)
-        council_tab.columnconfigure(0, weight=1)
-        council_tab.columnconfigure(1, weight=3)
-
-        ttk.Label(council_tab, text='Riverside:', font=DISPLAY_FONT).grid(column=0, row=0, sticky=tk.NW, padx=5, pady=5)
-        self.riverside_report_text = scrolledtext.ScrolledText(council_tab, wrap=tk.WORD)
-        self.riverside_report_text.grid(column=1, row=0, sticky='nsew', padx=5, pady=5)
-        self.riverside_report_text.bind('<FocusOut>', self.save_riverside)
-        ttk.Label(council_tab, text='St. Thomas:', font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.NW, padx=5, pady=5)
-        self.st_thomas_report_text = scrolledtext.ScrolledText(council_tab, wrap=tk.WORD)
-        self.st_thomas_report_text.grid(column=1, row=1, sticky='nsew', padx=5, pady=5)
-        self.st_thomas_report_text.bind('<FocusOut>', self.save_st_thomas)
-        ttk.Label(council_tab, text='Sacred Heart:', font=DISPLAY_FONT).grid(column=0, row=2, sticky=tk.NW, padx=5, pady=5)
-        self.sacred_heart_report_text = scrolledtext.ScrolledText(council_tab, wrap=tk.WORD)
-        self.sacred_heart_report_text.grid(column=1, row=2, sticky='nsew', padx=5, pady=5)
-        self.sacred_heart_report_text.bind('<FocusOut>', self.save_sacred_heart)
-        ttk.Label(council_tab, text='Our Lady of Perpetual Help:', font=DISPLAY_FONT).grid(column=0, row=3, sticky=tk.NW, padx=5, pady=5)
-        self.olph_report_text = scrolledtext.ScrolledText(council_tab, wrap=tk.WORD)
-        self.olph_report_text.grid(column=1, row=3, sticky='nsew', padx=5, pady=5)
-        self.olph_report_text.bind('<FocusOut>', self.save_olph)
-
-    def _create_financial_tab(self):
-        """
-        Docstring for create_financial_tab
-        
-        :param self: Collect the financial information for the minutes.
-        """
-        finacial_tab = ttk.Frame(self.notebook)
-        self.notebook.add(finacial_tab, text="Financial Statement")
-        self.notebook.bind('<FocusOut>', self.save_financials)
-        finacial_tab.rowconfigure(6, weight=1)
-        finacial_tab.rowconfigure(7, weight=1)
-        finacial_tab.columnconfigure(0, weight=1)
-        finacial_tab.columnconfigure(1, weight=1)
-        finacial_tab.columnconfigure(2, weight=1)
-        finacial_tab.columnconfigure(3, weight=1)
-        finacial_tab.columnconfigure(4, weight=1)
-
-        ttk.Label(finacial_tab, text='General Fund Account', font=DISPLAY_FONT).grid(column=1, row=0, sticky=tk.N, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Chalice Special Fund', font=DISPLAY_FONT).grid(column=2, row=0, sticky=tk.N, padx=5,pady=5)
-        ttk.Label(finacial_tab, text='Flag Special Fund', font=DISPLAY_FONT).grid(column=3, row=0, sticky=tk.N, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Starting Balance', font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.W, padx=5, pady=5)
-        self.general_start_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.general_start_entry.grid(column=1,row=1,sticky=tk.EW, padx=5, pady=5)
-        self.chalice_start_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.chalice_start_entry.grid(column=2,row=1,sticky=tk.EW, padx=5, pady=5)
-        self.flag_start_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.flag_start_entry.grid(column=3,row=1,sticky=tk.EW, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Total Receipts', font=DISPLAY_FONT).grid(column=0, row=2, sticky=tk.W, padx=5, pady=5)
-        self.general_receipts_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.general_receipts_entry.grid(column=1,row=2,sticky=tk.EW, padx=5, pady=5)
-        self.chalice_receipts_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.chalice_receipts_entry.grid(column=2,row=2,sticky=tk.EW, padx=5, pady=5)
-        self.flag_receipts_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.flag_receipts_entry.grid(column=3,row=2,sticky=tk.EW, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Funds Deposited', font=DISPLAY_FONT).grid(column=0, row=3, sticky=tk.W, padx=5, pady=5)
-        self.general_deposit_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.general_deposit_entry.grid(column=1,row=3,sticky=tk.EW, padx=5, pady=5)
-        self.chalice_deposit_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.chalice_deposit_entry.grid(column=2,row=3,sticky=tk.EW, padx=5, pady=5)
-        self.flag_deposit_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.flag_deposit_entry.grid(column=3,row=3,sticky=tk.EW, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Total Disbusements', font=DISPLAY_FONT).grid(column=0, row=4, sticky=tk.W, padx=5, pady=5)
-        self.general_spent_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.general_spent_entry.grid(column=1,row=4,sticky=tk.EW, padx=5, pady=5)
-        self.chalice_spent_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.chalice_spent_entry.grid(column=2,row=4,sticky=tk.EW, padx=5, pady=5)
-        self.flag_spent_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.flag_spent_entry.grid(column=3,row=4,sticky=tk.EW, padx=5, pady=5)
-        ttk.Label(finacial_tab, text='Ending Balance', font=DISPLAY_FONT).grid(column=0, row=5, sticky=tk.W, padx=5, pady=5)
-        self.general_end_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.general_end_entry.grid(column=1,row=5,sticky=tk.EW, padx=5, pady=5)
-        self.chalice_end_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.chalice_end_entry.grid(column=2,row=5,sticky=tk.EW, padx=5, pady=5)
-        self.flag_end_entry = ttk.Entry(finacial_tab,width=25, font=DISPLAY_FONT)
-        self.flag_end_entry.grid(column=3,row=5,sticky=tk.EW, padx=5, pady=5)
-
-        ttk.Label(finacial_tab, text='Withdrawals', font=DISPLAY_FONT).grid(column=0, row=6, sticky=tk.W, padx=5, pady=5)
-        self.withdrawal_text = scrolledtext.ScrolledText(finacial_tab, wrap=tk.WORD, height=5)
-        self.withdrawal_text.grid(column=1, row=6,columnspan=3, sticky=tk.NSEW, padx=5, pady=5)
-
-        ttk.Label(finacial_tab, text="Deposits", font=DISPLAY_FONT).grid(column=0, row=7, sticky=tk.W, padx=5, pady=5)
-        self.deposit_text = scrolledtext.ScrolledText(finacial_tab, wrap=tk.WORD, height=5)
-        self.deposit_text.grid(column=1, row=7,columnspan=3, sticky=tk.NSEW, padx=5, pady=5)
-
-        # This tab is not used during meetings. 
-        ttk.Button(finacial_tab, text="Save Page", command=self.save_financials).grid(row=8, column=0, padx=5, pady=5)
-
-    def _create_closing_ceremony_tab(self):
-        closing_tab = ttk.Frame(self.notebook)
-        self.notebook.add(closing_tab, text='Closing Ceremony')
-        closing_tab.rowconfigure(1, weight=1)
-        closing_tab.columnconfigure(0, weight=1)
-        closing_tab.columnconfigure(1, weight=3)
-
-        ttk.Label(closing_tab, text='Closing Prayer:', font=DISPLAY_FONT).grid(column=0, row=0, sticky=tk.W, padx=5, pady=5)
-        self.closing_prayer_entry = ttk.Entry(closing_tab, width=50, font=DISPLAY_FONT)
-        self.closing_prayer_entry.grid(column=1, row=0, sticky=tk.W, padx=5, pady=5)
-        self.closing_prayer_entry.bind('<FocusOut>', self.save_closing_prayer)
-        ttk.Label(closing_tab, text='Intentions:', font=DISPLAY_FONT).grid(column=0, row=1, sticky=tk.NSEW, padx=5, pady=5)
-        self.closing_prayer_intentions_text = scrolledtext.ScrolledText(closing_tab, wrap=tk.WORD, height=5)
-        self.closing_prayer_intentions_text.grid(column=1, row=1, sticky=tk.NSEW, padx=5, pady=5)
-        self.closing_prayer_intentions_text.bind('<FocusOut>', self.save_closing_intentions)
-        ttk.Label(closing_tab, text='Led by:', font=DISPLAY_FONT).grid(column=0, row=2, sticky=tk.W, padx=5, pady=5)
-        self.closing_led_by_entry = ttk.Entry(closing_tab, width=50, font=DISPLAY_FONT)
-        self.closing_led_by_entry.grid(column=1, row=2, sticky=tk.W, padx=5, pady=5)
-        self.closing_led_by_entry.bind('<FocusOut>', self.save_closing_leader)
-        ttk.Label(closing_tab, text='Meeting Adjourned at:', font=DISPLAY_FONT).grid(column=0, row=3, sticky=tk.W, padx=5, pady=5)
-        self.adjourned_time_entry = ttk.Entry(closing_tab, width=30)
-        self.adjourned_time_entry.grid(column=1, row=3, sticky=tk.W, padx=5, pady=5)
-        self.adjourned_time_entry.bind('<FocusOut>', self.save_adjourned_time)
-        ttk.Label(closing_tab, text='Next Officers Meeting:', font=DISPLAY_FONT).grid(column=0, row=4, sticky=tk.W, padx=5, pady=5)
-        self.next_officers_meeting_entry = ttk.Entry(closing_tab, width=30)
-        self.next_officers_meeting_entry.grid(column=1, row=4, sticky=tk.W, padx=5, pady=5)
-        self.next_officers_meeting_entry.bind('<FocusOut>', self.save_next_officers_mtg)
-        ttk.Label(closing_tab, text='Next Business Meeting:', font=DISPLAY_FONT).grid(column=0, row=5, sticky=tk.W, padx=5, pady=5)
-        self.next_business_meeting_entry = ttk.Entry(closing_tab, width=30)
-        self.next_business_meeting_entry.grid(column=1, row=5, sticky=tk.W, padx=5, pady=5)
-        self.next_business_meeting_entry.bind('<FocusOut>', self.save_next_bus_mtg)
-        
+    def _create_tab(self, spec, frame):
+        """Create the widgets of a tab from its schema.Tab."""
+        for row, weight in spec.rows.items():
+            frame.rowconfigure(row, weight=weight)
+        for column, weight in spec.columns.items():
+            frame.columnconfigure(column, weight=weight)
+        for text, row, column, sticky, columnspan in spec.labels:
+            ttk.Label(frame, text=text, font=DISPLAY_FONT).grid(column=column, row=row, columnspan=columnspan, sticky=sticky, padx=5, pady=5)
+
+        for field in spec.fields:
+            if field.kind == 'roll call':
+                self.widgets[field.id] = self._create_roll_call(frame, field)
+                continue
+            if field.label:
+                ttk.Label(frame, text=field.label, font=DISPLAY_FONT).grid(column=0, row=field.row, sticky=field.label_sticky, padx=5, pady=5)
+            widget = self._create_widget(frame, field)
+            widget.grid(column=field.column, row=field.row, columnspan=field.columnspan, sticky=field.sticky, padx=5, pady=5)
+            event = '<<ComboboxSelected>>' if field.kind == 'choice' else '<FocusOut>'
+            widget.bind(event, lambda event, field=field: self._sync_fields((field,)))
+            self.widgets[field.id] = widget
+
+        if spec.ledger_row is not None:
+            self._create_ledger_row(frame, spec)
+
+        if spec.save_button:
+            last_row = max(field.row for field in spec.fields)
+            ttk.Button(frame, text=spec.save_button, command=lambda: self._sync_tab(self._tabs[str(frame)])).grid(row=last_row + 1, column=0, padx=5, pady=5)
+
+    def _create_widget(self, frame, field):
+        """Create the widget for one field."""
+        options = dict(field.options)
+        if field.large:
+            options['font'] = DISPLAY_FONT
+        if field.kind == 'text':
+            widget = scrolledtext.ScrolledText(frame, **options)
+            # Ctrl+Z goes through the meeting history, which has the typing in this box as well
+            widget.bind('<<Undo>>', self.undo)
+            widget.bind('<<Redo>>', self.redo)
+            return widget
+        # the entries and lists are filled through their variables, see _populate_tabs
+        var = tk.StringVar()
+        self._field_vars[field.id] = var
+        if field.kind == 'choice':
+            widget = ttk.Combobox(frame, state='readonly', textvariable=var, **options)
+            widget.current(0)
+            return widget
+        return ttk.Entry(frame, textvariable=var, **options)
+
+    def _create_ledger_row(self, frame, spec):
+        """Show the End Balance of each fund worked out from its other amounts, updated as they are typed."""
+        for column, fund in enumerate(schema.FUNDS, start=1):
+            note = tk.StringVar()
+            ttk.Label(frame, textvariable=note, font=DISPLAY_FONT).grid(column=column, row=spec.ledger_row, sticky='ew', padx=5, pady=5)
+            ids = [schema.money_field_id(fund, key) for key in schema.MONEY_KEYS]
+            for field_id in ids:
+                self._field_vars[field_id].trace_add('write', lambda *args, ids=ids, note=note: self._show_computed_balance(ids, note))
+            self._show_computed_balance(ids, note)
+
+    def _show_computed_balance(self, ids, note):
+        """Input: the ids of the amounts of a fund in schema.MONEY_KEYS order, the StringVar of its note"""
+        account = {key: self._field_vars[field_id].get() for key, field_id in zip(schema.MONEY_KEYS, ids)}
+        computed, text = ledger.check_account(account)
+        note.set(text)
+
+    def _create_roll_call(self, frame, field):
+        """Create a row of attendance buttons for every officer. Returns the office -> StringVar dictionary."""
+        self._wait_for_config()
+        attendance_vars = {}
+        for row_index, (office, info) in enumerate(self.officer_data.officers.items(), start=field.row):
+            var = tk.StringVar()
+            attendance_vars[office] = var
+
+            ttk.Label(frame, text=office, font=DISPLAY_FONT, anchor='w').grid(column=0, row=row_index, padx=5, pady=5, sticky='w')
+            ttk.Label(frame, text=info["name"], font=DISPLAY_FONT, anchor='w').grid(column=1, row=row_index, padx=5, pady=5, sticky='w')
+            if info['name'].lower() != "vacant":
+                for column, choice in enumerate(schema.ATTENDANCE_CHOICES, start=2):
+                    ttk.Radiobutton(frame, text=choice, value=choice, variable=var,
+                                    command=lambda: self._sync_fields((field,))).grid(column=column, row=row_index, padx=5, pady=5, sticky='w')
+        return attendance_vars
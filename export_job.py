@@ -0,0 +1,114 @@
+"""
+    Word export on a background thread for the Minutes Editor.
+    The minutes are rendered from a copy of the meeting and the assembly
+    info, so the window stays responsive and the meeting can be edited
+    while python-docx works. A small window shows the section being
+    printed and has a Cancel button.
+"""
+import copy
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+import file_mgr
+
+# How often the window checks the export thread for news.
+POLL_MS = 50
+
+
+class ExportJob:
+    """ Exports one meeting to Word on a background thread and shows its progress."""
+
+    def __init__(self, parent, manager, editor_data, word_file, assembly_info, revision=None, on_status=None):
+        """
+        Input: the Tk root, the FileManager, the editor data dictionary, the output path,
+        the assembly info dictionary, the revision of the meeting (see FileManager.export_is_current),
+        a function showing a status message
+        """
+        self.parent = parent
+        self.manager = manager
+        self.word_file = word_file
+        self.revision = revision
+        self.on_status = on_status or print
+        # the thread works on copies, the editor keeps changing the originals
+        self.editor_data = copy.deepcopy(editor_data)
+        self.assembly_info = dict(assembly_info)
+
+        self.finished = False
+        self._cancel = threading.Event()
+        self._messages = queue.Queue()
+        self._create_window()
+        self._thread = threading.Thread(target=self._run, name='export', daemon=True)
+        self._thread.start()
+        self.parent.after(POLL_MS, self._poll)
+
+    def _create_window(self):
+        self.window = tk.Toplevel(self.parent)
+        self.window.title("Exporting to Word")
+        self.window.transient(self.parent)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.status_var = tk.StringVar(value="Preparing the export...")
+        ttk.Label(self.window, textvariable=self.status_var, width=45).grid(row=0, column=0, padx=10, pady=(10, 5), sticky='w')
+        self.progress = ttk.Progressbar(self.window, length=350, mode='determinate')
+        self.progress.grid(row=1, column=0, padx=10, pady=5)
+        self.cancel_button = ttk.Button(self.window, text="Cancel", command=self.cancel)
+        self.cancel_button.grid(row=2, column=0, padx=10, pady=(5, 10))
+
+    def lift(self):
+        """Bring the progress window to the front."""
+        self.window.lift()
+
+    def cancel(self):
+        """Ask the export thread to stop before its next section."""
+        self._cancel.set()
+        self.cancel_button.config(state='disabled')
+        self.status_var.set("Cancelling...")
+
+    def _run(self):
+        """The background thread: render and save the minutes."""
+        try:
+            written = self.manager.write_word(self.editor_data, self.word_file, self.assembly_info,
+                                              revision=self.revision, progress=self._report, cancel=self._cancel)
+            self._messages.put(('done', written))
+        except file_mgr.ExportCancelled:
+            self._messages.put(('cancelled', None))
+        except Exception as e:
+            self._messages.put(('error', e))
+
+    def _report(self, section_name, number, total):
+        """Called by the export thread before each section."""
+        self._messages.put(('section', (section_name, number, total)))
+
+    def _poll(self):
+        """Show the progress of the export thread on the Tk thread."""
+        while True:
+            try:
+                kind, detail = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind != 'section':
+                self._finish(kind, detail)
+                return
+            section_name, number, total = detail
+            self.progress.config(maximum=total, value=number - 1)
+            if not self._cancel.is_set():
+                self.status_var.set(f"Printing {section_name} ({number} of {total})")
+        self.parent.after(POLL_MS, self._poll)
+
+    def _finish(self, kind, detail):
+        """Close the progress window and report the result in the status bar."""
+        self.finished = True
+        self.window.destroy()
+        if kind == 'done' and detail:
+            print(f"The Minutes were exported to {self.word_file}")
+            self.on_status(f"The Minutes were exported to {self.word_file}")
+        elif kind == 'done':
+            self.on_status(f"Nothing has changed since the Minutes were exported to {self.word_file}")
+        elif kind == 'cancelled':
+            print(f"The export to {self.word_file} was cancelled.")
+            self.on_status(f"The export to {self.word_file} was cancelled.")
+        else:
+            print(f"Error exporting {self.word_file}: {detail}")
+            messagebox.showerror('Export Error', f"An error occurred: {detail}")
@@ -2,471 +2,466 @@
     Process files 
     includes saving and opening files.
     Handles conversion of data to Word Format.
+
+    This module does not use tkinter. The file dialogs and message
+    boxes used by the editor are in gui_files.py. python-docx is
+    imported by the export functions that need it, see templates.py,
+    and so is the streaming writer.
+
+    The section printers describe the minutes as a document_ir.MinutesDocument,
+    which is then written as Word, HTML, Markdown or plain text.
 """
-from tkinter import ttk, messagebox, filedialog
-from datetime import datetime
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-import json
-import assembly
+import copy
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import catalog
+import document_ir
+import journal
+import render_cache
+import schema
+import serializer
+import sharing
+import templates
+
+
+class ExportCancelled(Exception):
+    """Raised by write_word when its cancel event is set."""
+
 
 class FileManager:
     def __init__(self):
         # the dataframe is follows the notebook tabs.
         self.current_file = None    # to track the currently opened file.
         self.word_file = None       # to track the Word file
+        self.catalog = None         # the meeting catalog, opened on the first save
+        self._write_lock = threading.Lock()   # one meeting write at a time, see autosave.py
+        self._last_export = None    # what the last Word export was made from, see export_is_current()
+        self._exported = {}         # Word file -> (section digests, file size and time) of the last export to it
+        self.section_cache = render_cache.SectionCache()
+        self._on_disk = None        # (meeting file, its size and time, the meeting as in the file), see sharing.py
+        self.merged_fields = []     # the fields the last save changed in editor_data, from someone else or a conflict
+        self.stats = {
+            'saves': 0,
+            'skipped saves': 0,
+            'merges': 0,
+            'bytes written': 0,
+            'exports': 0,
+            'skipped exports': 0,
+        }
 
     # Create a static structure of the editor data dictionary.
     @staticmethod
     def default_editor_data():
-        return {
-            'Meeting Info' : {
-                'Meeting Date' : '',
-                'Start Time' : '',
-            },
-            'Opening Ceremony' : {
-                'Intentions' : '',
-                'Prayer' : '',
-                'Leader' : '',
-                'Pledge' : '',
-            },
-            'officers' : {
-                "Faithful Navigator": {
-                "name": "",
-                "attendance": "",
-                },
-                "Faithful Friar": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Admiral": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Captain": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Pilot": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Comptroller": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Scribe": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Purser": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Inner Sentinel": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Outer Sentinel": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Trustee (1 Yr)": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Trustee (2 Yr)": {
-                    "name": "",
-                    "attendance": "",
-                },
-                "Faithful Trustee (3 Yr)": {
-                    "name": "",
-                    "attendance": "",
-                },
-            },
-            "attendees": '',
-            'Minutes' : {
-                'Corrections' : '',
-                'Motion to Approve' : '',
-                'Seconded by' : '',
-                'Approval' : '',
-            },
-            'Reports' : {
-                'Friar' : '',
-                'Bills' : '',
-                'Comptroller' : '',
-                'Purser' : '',
-                'Standing Committees' : '',
-                'Applications' : '',
-                'Trustees' : '',
-            },
-            'Business' : {
-                'Unfinished Business' : '',
-                'New Business' : '',
-            },
-            'Council Reports' : {
-                'Riverside' : '',
-                'St Thomas' : '',
-                'Sacred Heart' : '',
-                'OLPH' : '',
-            },
-            'Closing Ceremony' : {
-                'Closing Prayer' : '',
-                'Intentions' : '',
-                'Leader' : '',
-                'Adjurned At' : '',
-                'Next Officers Meeting': '',
-                'Next Business Meeting' : '',
-            },
-            'Financials' : {
-                'General': {
-                    'Start Balance' : '',
-                    'Receipts' : '',
-                    'Deposits' : '',
-                    'Disbursements' : '',
-                    'End Balance': '',
-                },
-                'Chalice' : {
-                    'Start Balance' : '',
-                    'Receipts' : '',
-                    'Deposits' : '',
-                    'Disbursements' : '',
-                    'End Balance': '',
-                },
-                'Flag' : {
-                    'Start Balance' : '',
-                    'Receipts' : '',
-                    'Deposits' : '',
-                    'Disbursements' : '',
-                    'End Balance': '',
-                },
-            'Withdrawals' : '',
-            'Deposits' : '',
-            },
-        }
+        return schema.default_editor_data()
 
     def new_json(self):
         """
-            This function clears the dictionary editor_data and creates a new file.
-        """
-        
-        
-        print("The New Meeting Function to be developed.")
-
-    def save_file_as_json(self, editor_data):
-        """ This function saves the file under a new name."""
-        # Open file dialog to choose location and name
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            title="Save Meeting As"
-        )
-        if file_path:
+        Start a new meeting from the latest meeting in the catalog, see schema.carry_forward.
+        The meeting has no file until it is saved.
+        Output: (the editor data dictionary, the file of the meeting it was started from or None)
+        """
+        self.current_file = None
+        try:
+            latest = self._open_catalog().latest_meetings()
+        except sqlite3.Error as e:
+            print(f"Error reading the catalog: {e}")
+            latest = []
+        for row in latest:
             try:
-                with open(file_path, 'w') as file_to_save:
-                    json.dump(editor_data, file_to_save, indent=4)
-                self.current_file = file_path
-                print(f"Saved to: {file_path}")
-                return True
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")
-                print(f"Error saving: {e}")
-                return False
-        return False
+                return schema.carry_forward(serializer.load_file(row['path'])), row['path']
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                # the file was moved or damaged since it was catalogued, try the one before it
+                print(f"Error reading {row['path']}: {e}")
+        return self.default_editor_data(), None
 
-    def save_to_file(self, editor_data):
-        """" Saves a file. """
-        if self.current_file:
-            try:
-                with open(self.current_file, 'w') as file_to_save:
-                    json.dump(editor_data, file_to_save, indent=4)
-                messagebox.showinfo("Success", f"The file <{self.current_file}> was saved successfully!")
-                print(f"The file <{self.current_file}> was saved successfully!")
-                return True
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")                
-                print(f"Error saving {e}")
-                return False
-        else: 
-            return self.save_file_as_json(editor_data)
-
-    def open_json(self):
-        """Load the working data from a user selected JSON file."""
-        file_path = filedialog.askopenfilename(
-            defaultextension='.json',
-            filetypes=[("JSON files", '*.json'), ('All files', '*.*')],
-            title="Open Meeting File"
-        )
-
-        if file_path:   # User didn't cancel
+    def load_meeting(self, file_path):
+        """
+        Load a meeting from a meeting file in any of the formats in serializer.py.
+        Input: the file path
+        Output: the editor data dictionary
+        """
+        state = _file_state(file_path)
+        loaded_data = serializer.load_file(file_path)
+        self.current_file = file_path   # remember the file for later use
+        self._on_disk = (file_path, state, copy.deepcopy(loaded_data))
+        return loaded_data
+
+    def save_meeting(self, editor_data, file_path, changed=True, my_fields=None, resolve=None):
+        """
+        Save a meeting to a meeting file and make it the current file.
+        A meeting without changes is not written again to its own file.
+        If someone else saved the file since it was read, their changes are merged in first, see sharing.py.
+        Input: the editor data dictionary, the file path, False if nothing changed since the last save,
+        the paths of the fields changed since the file was read (worked out if left out),
+        a function that is given the list of sharing.Conflict and returns {path: value to keep}, or None to cancel
+        Output: True if the file was written; raises sharing.MergeConflict if the conflicts were not resolved
+        """
+        self.merged_fields = []
+        known = self._disk_state(file_path)
+        if not changed and file_path == self.current_file and known is not None and _file_state(file_path) == known:
+            self.stats['skipped saves'] += 1
+            return False
+        while True:
+            with sharing.MeetingLock(file_path):
+                conflicts, theirs = self._merge_from_disk(editor_data, file_path, my_fields)
+                if not conflicts:
+                    self.write_meeting(editor_data, file_path)
+                    self.current_file = file_path
+                    return True
+            # the lock is not held while the user decides
+            choices = resolve(conflicts) if resolve is not None else None
+            if choices is None:
+                raise sharing.MergeConflict(conflicts)
+            for path, value in choices.items():
+                journal.set_field(editor_data, path, value)
+                self.merged_fields.append(path)
+            self._on_disk = (file_path,) + theirs
+
+    def changed_on_disk(self):
+        """True if someone else has saved the current meeting file since this program read or wrote it."""
+        known = self._disk_state(self.current_file)
+        return known is not None and _file_state(self.current_file) not in (None, known)
+
+    def autosave_meeting(self, editor_data, file_path):
+        """
+        Write a meeting from the autosave thread, unless someone else has saved
+        the file since it was read: merging needs the user, so it waits for Save.
+        """
+        with sharing.MeetingLock(file_path):
+            if self._disk_state(file_path) not in (None, _file_state(file_path)):
+                raise sharing.ChangedOnDisk(f"{file_path} was changed by someone else. Save to merge the changes.")
+            self.write_meeting(editor_data, file_path)
+
+    def _disk_state(self, file_path):
+        """The size and time the meeting file had when this program last read or wrote it, None if it has not."""
+        if self._on_disk is None or self._on_disk[0] != file_path:
+            return None
+        return self._on_disk[1]
+
+    def _merge_from_disk(self, editor_data, file_path, my_fields):
+        """
+        Merge the changes someone else saved to the meeting file into editor_data. Called with the file locked.
+        Output: (list of sharing.Conflict, (size and time, meeting) of the file as read)
+        """
+        state = _file_state(file_path)
+        known = self._disk_state(file_path)
+        if known is None or state is None or state == known:
+            return [], None
+        theirs = serializer.load_file(file_path)
+        taken, conflicts = sharing.merge(self._on_disk[2], theirs, editor_data, my_fields)
+        # editor_data has the fields taken even if the save stops at the conflicts
+        self.merged_fields.extend(taken)
+        if taken or conflicts:
+            self.stats['merges'] += 1
+        print(f"Merged {len(taken)} fields saved by someone else to {file_path}, {len(conflicts)} conflicts")
+        return conflicts, (state, theirs)
+
+    def write_meeting(self, editor_data, file_path):
+        """
+        Write a meeting to a meeting file. Safe to call from a background thread.
+        The format is chosen by the file name, see serializer.py.
+        Input: the editor data dictionary, the file path
+        """
+        data = serializer.dumps(editor_data, serializer.format_for(file_path))
+        size = len(data)
+
+        # Write a temporary file and rename it, so a crash never leaves half a file.
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with self._write_lock:
             try:
-                with open(file_path, 'r') as f:
-                    loaded_data = json.load(f)
-
-                    # Update the editor_data with loaded data
-                    self.current_file = file_path   # remember the file for later use
-
-                    print(f"Loaded from: {file_path}")
-                    messagebox.showinfo("Success", f"Meeting loaded data from: {file_path}")
-                    return loaded_data
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file: {file_path}")
-                print(f"Error loading: {e}")
-                return None
-        return None # if the user cancels the open dialog
-
-    def convert_text_to_word(self, doc, paragraph_text):
-        """ 
-        Converts a string with '\n' into real paragrph breaks in a Word Document.
-        Input: the Word dataframe, the text list
-        Output: A bulletted sentence to the MS Word document
-        """
-
-        # Split the text into paragraphs based on '\n'
-        paragraphs = paragraph_text.split('\n')
-        
-        for para in paragraphs:
-            next_line = doc.add_paragraph(para.strip())
-            next_line.style = 'List Bullet'
-
-    def convert_to_word(self, editor_data):
-        """ 
-        This function converts a JSON into a MS Word document. 
-        Import: the editor data dictionary. 
-        Output: Word File
-        """
-        self.word_file = filedialog.asksaveasfilename(
-            title="Export to Word",
-            defaultextension=".docx",
-            filetypes=[("Word Documents", "*.docx"), ("All Files", "*.*")],
-            initialfile=f"KofC_Minutes_{datetime.now().strftime('%Y%m%d')}.docx"
-        )
-        print(f"Saving minutes to {self.word_file}")
-        assembly_data = assembly.AssemblyInfo()
-
-        # return if the user hits cancel.
-        if not self.word_file:
-            return
-        
-        # prepare the minutes for publication
+                with open(temp_path, 'wb') as file_to_save:
+                    file_to_save.write(data)
+                    file_to_save.flush()
+                    os.fsync(file_to_save.fileno())
+                os.replace(temp_path, file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            self.stats['saves'] += 1
+            self.stats['bytes written'] += size
+            self._on_disk = (file_path, _file_state(file_path), copy.deepcopy(editor_data))
+            self._update_catalog(file_path, editor_data)
+
+    def _update_catalog(self, file_path, editor_data):
+        """Record a saved meeting in the catalog. A catalog error never stops a save."""
         try:
-            self.save_to_file(editor_data)
-            doc = Document()
-
-
-            # TODO: refactor this section of the code
-            # prepare the title block
-            title = doc.add_heading(f"Knights of Columbus {assembly_data.assembly_info['Assembly Name']} {assembly_data.assembly_info['Assembly Number']}", 1)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            subtitle = doc.add_heading("Business Meeting Minutes", 2)
-            subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            # List the Meeting Info
-            doc.add_heading("Opening Ceremony", 2)
-            date_para = doc.add_paragraph(f"Date: {editor_data['Meeting Info']['Meeting Date']}")
-            date_para.space_after = Inches(0.0)
-            doc.add_paragraph(f"Time: {editor_data['Meeting Info']['Start Time']}")
-
-            # Print the body of the minutes.
-            self._print_opening_ceremony_data(editor_data['Opening Ceremony'], doc)
-            self._print_roll_call(roll_call=editor_data['officers'], other_attendees=editor_data['attendees'], doc=doc)
-            self._assembly_report_data(editor_data['Reports'], editor_data['Minutes'], doc)
-            self._print_business_report(editor_data['Business'], doc)
-            self._print_council_report(report_data=editor_data['Council Reports'], doc=doc)
-            self._print_closing_ceremony(editor_data['Closing Ceremony'], doc)
-            self._create_financial_report(editor_data, doc, assembly_data)
-
-            # Save the Document
-            doc.save(self.word_file)
-            messagebox.showinfo("Success", f"The Minutes were exported to:\n{self.word_file}")
-
-        except Exception as e:
-            messagebox.showerror('Export Error', f"An error occurred: {str(e)}")
-    
-    def _print_opening_ceremony_data(self, opening_data, doc):
-        """Print the Opening Ceremony data to the Word Document"""
-        doc.add_heading("Opening Ceremony", 2)
-        doc.add_paragraph("Prayer Intentions:").bold = True
-        self.convert_text_to_word(doc, opening_data['Intentions'])
-        doc.add_paragraph(f"Prayer: {opening_data['Prayer']}")
-        doc.add_paragraph(f"Prayer leg by: {opening_data['Leader']}")
-        doc.add_paragraph(f"Pledge of Alligence led by: {opening_data['Pledge']}")
-    
+            self._open_catalog().update(file_path, editor_data)
+        except sqlite3.Error as e:
+            print(f"Error updating the catalog: {e}")
+
+    def _open_catalog(self):
+        """Open the meeting catalog the first time it is needed."""
+        if self.catalog is None:
+            self.catalog = catalog.MeetingCatalog()
+        return self.catalog
+
+    def write_word(self, editor_data, word_file, assembly_info, streaming=False, revision=None,
+                   progress=None, cancel=None):
+        """
+        Render the minutes and save them as a Word document. Safe to call from a
+        background thread with a copy of editor_data, see export_job.py.
+        Input: the editor data dictionary, the output path, the assembly info dictionary,
+        streaming selects the streaming writer for very large documents,
+        revision identifies the state of editor_data (see export_is_current),
+        progress and cancel as in tracked_sections
+        Output: Word File; returns False if the export was skipped, raises ExportCancelled
+        """
+        if revision is not None and self.export_is_current(word_file, revision, assembly_info):
+            self.stats['skipped exports'] += 1
+            return False
+        minutes = self.build_minutes(editor_data, assembly_info)
+        written = self.write_minutes(minutes, word_file, streaming, progress, cancel)
+        self.word_file = word_file
+        self.stats['exports' if written else 'skipped exports'] += 1
+        if revision is not None:
+            self._last_export = self._export_stamp(word_file, revision, assembly_info)
+        return written
+
+    def publish(self, editor_data, assembly_info, paths, streaming=False):
+        """
+        Write the minutes in several formats at once. The minutes are described
+        once and each format is written by its own thread.
+        Input: the editor data dictionary, the assembly info dictionary,
+        the output paths (.docx, .html, .md or .txt, see document_ir.FORMATS),
+        streaming selects the streaming writer for the Word documents
+        """
+        minutes = self.build_minutes(editor_data, assembly_info)
+        if len(paths) == 1:
+            # one format needs no threads, e.g. `minutes export` of Word files only
+            self.write_minutes(minutes, paths[0], streaming)
+            return
+        with ThreadPoolExecutor(max_workers=len(paths) or 1) as executor:
+            futures = [executor.submit(self.write_minutes, minutes, path, streaming) for path in paths]
+            for future in futures:
+                future.result()
+
+    def write_minutes(self, minutes, file_path, streaming=False, progress=None, cancel=None):
+        """
+        Write a MinutesDocument in the format chosen by the file name.
+        Input: the MinutesDocument, the output path, streaming selects the streaming Word writer,
+        progress and cancel as in tracked_sections (Word only)
+        Output: False if the Word file already held exactly these minutes
+        """
+        file_format = document_ir.format_for(file_path)
+        if file_format != 'docx':
+            document_ir.write_text_file(minutes, file_path, file_format)
+            return True
+
+        template = templates.get_template()
+        if streaming:
+            import ooxml_stream
+            styles = ooxml_stream.StreamingStyleRegistry(template.styles)
+            try:
+                ooxml_stream.write_docx(file_path, template, self.word_sections(minutes, styles, progress, cancel))
+            except ExportCancelled:
+                # the streaming writer has already started the file
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                raise
+            return True
+
+        # the same sections in the same template give the same bytes, see templates.docx_bytes
+        digests = self._section_digests(minutes, template)
+        export_key = os.path.abspath(file_path)
+        if self._exported.get(export_key) == (digests, _file_state(file_path)):
+            return False
+        doc = self._render_word(minutes, template, digests, progress, cancel)
+        if cancel is not None and cancel.is_set():
+            raise ExportCancelled(file_path)
+        data = templates.docx_bytes(doc)
+        written = not _has_contents(file_path, data)
+        if written:
+            with open(file_path, 'wb') as word:
+                word.write(data)
+        self._exported[export_key] = (digests, _file_state(file_path))
+        return written
+
+    def _section_digests(self, minutes, template):
+        template_key = (template.template_file, template.mtime)
+        return [render_cache.section_digest(template_key, section_name, blocks)
+                for section_name, blocks in minutes.sections]
+
+    def _render_word(self, minutes, template, digests, progress=None, cancel=None):
+        """
+        Render a MinutesDocument with python-docx, copying unchanged sections from the section cache.
+        Output: the python-docx Document
+        """
+        doc = template.new_document()
+        sections = [(section_name, (blocks, digest)) for (section_name, blocks), digest in zip(minutes.sections, digests)]
+        for section_name, (blocks, digest) in self.tracked_sections(sections, progress, cancel):
+            render_cache.write_section(doc, blocks, template.styles, self.section_cache, digest)
+        return doc
+
+    def export_is_current(self, word_file, revision, assembly_info):
+        """
+        Return True if word_file was written by the last export from the same
+        revision of the meeting, assembly info and template, and has not been touched since.
+        """
+        return self._last_export is not None and self._last_export == self._export_stamp(word_file, revision, assembly_info)
+
+    def _export_stamp(self, word_file, revision, assembly_info):
+        template_file = templates.find_template_file()
+        return (os.path.abspath(word_file), revision, dict(assembly_info),
+                template_file, template_file and os.path.getmtime(template_file),
+                os.path.getmtime(word_file) if os.path.exists(word_file) else None)
+
+    def render_to_bytes(self, editor_data, assembly_info):
+        """
+        Render the minutes to the bytes of a Word document.
+        Input: the editor data dictionary, the assembly info dictionary
+        Output: the .docx file contents
+        """
+        return templates.docx_bytes(self.render_document(editor_data, assembly_info))
+
+    def render_document(self, editor_data, assembly_info, progress=None, cancel=None):
+        """
+        Build the Word document for a meeting without any dialogs.
+        Input: the editor data dictionary, the assembly info dictionary, progress and cancel as in tracked_sections
+        Output: the python-docx Document
+        """
+        template = templates.get_template()
+        minutes = self.build_minutes(editor_data, assembly_info)
+        return self._render_word(minutes, template, self._section_digests(minutes, template), progress, cancel)
+
+    def build_minutes(self, editor_data, assembly_info):
+        """
+        Describe the minutes once, for every output format.
+        Input: the editor data dictionary, the assembly info dictionary
+        Output: a document_ir.MinutesDocument
+        """
+        minutes = document_ir.MinutesDocument(
+            f"Knights of Columbus {assembly_info['Assembly Name']} {assembly_info['Assembly Number']} "
+            f"Business Meeting Minutes {editor_data['Meeting Info']['Meeting Date']}")
+        for section_name, print_section in self.export_sections(editor_data, assembly_info):
+            minutes.start_section(section_name)
+            print_section(minutes)
+        return minutes
+
+    def word_sections(self, minutes, styles, progress=None, cancel=None):
+        """
+        Yield (section name, function that adds the section to a Word document) for a MinutesDocument.
+        Used by the streaming writer, which does not use the section cache.
+        Input: the MinutesDocument, the style registry of the template, progress and cancel as in tracked_sections
+        """
+        for section_name, blocks in self.tracked_sections(minutes.sections, progress, cancel):
+            yield section_name, lambda doc, blocks=blocks: document_ir.write_word_blocks(blocks, doc, styles)
+
+    def tracked_sections(self, sections, progress=None, cancel=None):
+        """
+        Yield (section name, section) pairs, reporting each one before it is printed.
+        Input: the pairs, a function called with (section name, number, number of sections),
+        a threading.Event that stops the export with ExportCancelled when it is set
+        """
+        sections = list(sections)
+        for number, (section_name, section) in enumerate(sections, start=1):
+            if cancel is not None and cancel.is_set():
+                raise ExportCancelled(section_name)
+            if progress is not None:
+                progress(section_name, number, len(sections))
+            yield section_name, section
+
+    def export_sections(self, editor_data, assembly_info):
+        """
+        List the sections of the minutes in the order they are printed.
+        Input: the editor data dictionary, the assembly info dictionary
+        Output: yields (section name, function that prints the section to a MinutesDocument)
+        """
+        values = schema.read_values(editor_data)
+        yield 'Title', lambda doc: self._print_title_block(editor_data['Meeting Info'], doc, assembly_info)
+        yield 'Opening Ceremony', lambda doc: self._print_section(schema.SECTIONS['Opening Ceremony'], values, doc)
+        yield 'Roll Call', lambda doc: self._print_roll_call(roll_call=editor_data['officers'], other_attendees=editor_data['attendees'], doc=doc)
+        yield 'Reports', lambda doc: self._print_section(schema.SECTIONS['Reports'], values, doc)
+        yield 'Business', lambda doc: self._print_section(schema.SECTIONS['Business'], values, doc)
+        yield 'Council Reports', lambda doc: self._print_section(schema.SECTIONS['Council Reports'], values, doc)
+        yield 'Closing Ceremony', lambda doc: self._print_section(schema.SECTIONS['Closing Ceremony'], values, doc)
+        yield 'Financial Report', lambda doc: self._create_financial_report(editor_data, doc, assembly_info)
+
+    def _print_section(self, section, values, doc):
+        """
+        Print a section of the minutes described in schema.SECTIONS.
+        Input: the section, the field values from schema.read_values, the MinutesDocument
+        """
+        for step in section.steps:
+            if step[0] == 'heading':
+                doc.heading(step[1], step[2])
+            elif step[0] == 'paragraph':
+                doc.paragraph(step[1])
+            elif step[0] == 'line':
+                doc.paragraph(step[1].format(values[step[2]]))
+            else:
+                doc.bullets(values[step[1]])
+
+    def _print_title_block(self, meeting_info, doc, assembly_info):
+        """Print the title block and the Meeting Info."""
+        doc.heading(f"Knights of Columbus {assembly_info['Assembly Name']} {assembly_info['Assembly Number']}", 1, centered=True)
+        doc.heading("Business Meeting Minutes", 2, centered=True)
+
+        # List the Meeting Info
+        doc.heading("Opening Ceremony", 2)
+        doc.paragraph(f"Date: {meeting_info['Meeting Date']}")
+        doc.paragraph(f"Time: {meeting_info['Start Time']}")
+
     def _print_roll_call(self, roll_call, other_attendees, doc):
         """"Print the meeting attendance information."""
         # Roll Call
-        doc.add_heading("Roll Call", 2)
-        table = doc.add_table(rows=13, cols=3)
-
-        table.cell(0, 0).text = "Faithful Navigator"
-        table.cell(0, 1).text = roll_call['Faithful Navigator']['name']
-        table.cell(0, 2).text = roll_call['Faithful Navigator']['attendance']
-        table.cell(1, 0).text = "Faithful Friar"
-        table.cell(1, 1).text = roll_call['Faithful Friar']['name']
-        table.cell(1, 2).text = roll_call['Faithful Friar']['attendance']
-        table.cell(2, 0).text = "Faithful Admiral"
-        table.cell(2, 1).text = roll_call['Faithful Admiral']['name']
-        table.cell(2, 2).text = roll_call['Faithful Admiral']['attendance']
-        table.cell(3, 0).text = "Faithful Captain"
-        table.cell(3, 1).text = roll_call['Faithful Captain']['name']
-        table.cell(3, 2).text = roll_call['Faithful Captain']['attendance']
-        table.cell(4, 0).text = "Faithful Pilot"
-        table.cell(4, 1).text = roll_call['Faithful Pilot']['name']
-        table.cell(4, 2).text = roll_call['Faithful Pilot']['attendance']
-        table.cell(5, 0).text = "Faithful Comptroller"
-        table.cell(5, 1).text = roll_call['Faithful Comptroller']['name']
-        table.cell(5, 2).text = roll_call['Faithful Comptroller']['attendance']
-        table.cell(6, 0).text = "Faithful Scribe"
-        table.cell(6, 1).text = roll_call['Faithful Scribe']['name']
-        table.cell(6, 2).text = roll_call['Faithful Scribe']['attendance']
-        table.cell(7, 0).text = "Faithful Purser"
-        table.cell(7, 1).text = roll_call['Faithful Purser']['name']
-        table.cell(7, 2).text = roll_call['Faithful Purser']['attendance']
-        table.cell(8, 0).text = "Faithful Inner Sentinel"
-        table.cell(8, 1).text = roll_call['Faithful Inner Sentinel']['name']
-        table.cell(8, 2).text = roll_call['Faithful Inner Sentinel']['attendance']
-        table.cell(9, 0).text = "Faithful Outer Sentinel"
-        table.cell(9, 1).text = roll_call['Faithful Outer Sentinel']['name']
-        table.cell(9, 2).text = roll_call['Faithful Outer Sentinel']['attendance']
-        table.cell(10, 0).text = "Faithful Trustee (1 Yr)"
-        table.cell(10, 1).text = roll_call['Faithful Trustee (1 Yr)']['name']
-        table.cell(10, 2).text = roll_call['Faithful Trustee (1 Yr)']['attendance']
-        table.cell(11, 0).text = "Faithful Trustee (2 Yr)"
-        table.cell(11, 1).text = roll_call['Faithful Trustee (2 Yr)']['name']
-        table.cell(11, 2).text = roll_call['Faithful Trustee (2 Yr)']['attendance']
-        table.cell(12, 0).text = "Faithful Trustee (3 Yr)"
-        table.cell(12, 1).text = roll_call['Faithful Trustee (3 Yr)']['name']
-        table.cell(12, 2).text = roll_call['Faithful Trustee (3 Yr)']['attendance']
+        doc.heading("Roll Call", 2)
+        doc.table([(office, roll_call[office]['name'], roll_call[office]['attendance']) for office in schema.OFFICES])
         # Other Attendees
         if other_attendees != '':
-            doc.add_paragraph("Members in attendance:")
-            self.convert_text_to_word(doc, other_attendees)
-
-    def _assembly_report_data(self, assembly_reports, minute_report, doc):
-        """Print the Assembly Reports to the Word document."""
-        # Start with the Faithful Friar's report
-        doc.add_heading("Faithful Friar's Report", 2)
-        self.convert_text_to_word(doc, assembly_reports['Friar'])
-
-        # Handle the minutes of the last meeting.
-        doc.add_heading("Reading of Minutes", 2)
-        self.convert_text_to_word(doc, minute_report['Corrections'])
-        doc.add_paragraph(f"Motion to approve by: {minute_report['Motion to Approve']}")
-        doc.add_paragraph(f"Seconded by: {minute_report['Seconded by']}")
-        doc.add_paragraph(f"Minutes approved: {minute_report['Approval']}")
-
-        doc.add_heading("Bills and Communications", 2)
-        self.convert_text_to_word(doc, assembly_reports['Bills'])
-
-        doc.add_heading("Faithful Comptroller's Report", 2)
-        self.convert_text_to_word(doc, assembly_reports['Comptroller'])
-
-        doc.add_heading("Purser's Report", 2)
-        self.convert_text_to_word(doc,assembly_reports['Purser'])
-
-        doc.add_heading("Standing Committees", 2)
-        doc.add_heading("Color Corps Commander", 3)
-        self.convert_text_to_word(doc,assembly_reports['Standing Committees'])
-
-        doc.add_heading("Reading of Applications", 2)
-        self.convert_text_to_word(doc, assembly_reports['Applications'])
-
-        doc.add_heading("Trustees Report", 2)
-        self.convert_text_to_word(doc, assembly_reports['Trustees'])
-    
-    def _print_business_report(self, assy_business_data, doc):
-        """Print the Assembly Business reports to the Word document."""
-        doc.add_heading("Unfinished Business", 2)
-        self.convert_text_to_word(doc, assy_business_data['Unfinished Business'])
-        doc.add_heading("New Business", 2)
-        self.convert_text_to_word(doc, assy_business_data['New Business'])
-        
-
-    def _print_council_report(self, report_data, doc):
-        """Prints the Council reports to the Word Document."""
-        doc.add_heading("Report of the Councils", 2)
-        doc.add_heading("Riverside", 3)
-        self.convert_text_to_word(doc,report_data['Riverside'])
-        doc.add_heading("Saint Thomas", 3)
-        self.convert_text_to_word(doc, report_data['St Thomas'])
-        doc.add_heading("Sacred Heart", 3)
-        self.convert_text_to_word(doc, report_data['Sacred Heart'])
-        doc.add_heading("Our Lady of Perpetual Health", 3)
-        self.convert_text_to_word(doc, report_data['OLPH'])
-
-    def _print_closing_ceremony(self, closing_ceremony_data, doc):
-        """ Print the Closing Ceremony to the Word Document."""
-        doc.add_heading("Closing Ceremony", 2)
-        doc.add_paragraph(f"Closing prayer led by: {closing_ceremony_data['Leader']}")
-        doc.add_paragraph(f"Closing Prayer: {closing_ceremony_data['Closing Prayer']}")
-        doc.add_paragraph("Prayer Intentions:")
-        self.convert_text_to_word(doc, closing_ceremony_data['Intentions'])
-        doc.add_paragraph(f"Next Officers meeting: {closing_ceremony_data['Next Officers Meeting']}")
-        doc.add_paragraph(f"Next Business Meeting: {closing_ceremony_data['Next Business Meeting']}")
-
-    def _create_financial_report(self, editor_data, doc, assembly_data):
-        """Create the Financial Report section in the Wod Document."""
+            doc.paragraph("Members in attendance:")
+            doc.bullets(other_attendees)
+
+    def _create_financial_report(self, editor_data, doc, assembly_info):
+        """Create the Financial Report section."""
+        financials = editor_data['Financials']
         # Start on a new page
-        doc.add_page_break()
-        doc.add_heading(f"Knights of Columbus {assembly_data.assembly_info['Assembly Name']} {assembly_data.assembly_info['Assembly Number']}", 2).alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc.add_heading("FAITHFUL PURSER'S MONTHLY FINANCIAL REPORT", 1).alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc.add_paragraph(f"As of {editor_data['Meeting Info']['Meeting Date']}").alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc.add_heading("General Fund Account", 3).alignment = WD_ALIGN_PARAGRAPH.CENTER
-        self._print_general_report(editor_data, doc)
-        doc.add_heading("Chalice Special Fund Account", 3).alignment = WD_ALIGN_PARAGRAPH.CENTER
-        self._print_chalice_report(editor_data, doc)
-        doc.add_heading("Flag Special Fund Account", 3).alignment = WD_ALIGN_PARAGRAPH.CENTER
-        self._print_flag_report(editor_data, doc)
+        doc.page_break()
+        doc.heading(f"Knights of Columbus {assembly_info['Assembly Name']} {assembly_info['Assembly Number']}", 2, centered=True)
+        doc.heading("FAITHFUL PURSER'S MONTHLY FINANCIAL REPORT", 1, centered=True)
+        doc.paragraph(f"As of {editor_data['Meeting Info']['Meeting Date']}", centered=True)
+        doc.heading("General Fund Account", 3, centered=True)
+        self._print_fund_report(financials['General'], "Funds Deposited (membership)", doc)
+        doc.heading("Chalice Special Fund Account", 3, centered=True)
+        self._print_fund_report(financials['Chalice'], "Funds Deposited", doc)
+        doc.heading("Flag Special Fund Account", 3, centered=True)
+        self._print_fund_report(financials['Flag'], "Funds Deposited", doc)
         self._print_transactions(editor_data, doc)
 
-    def _print_general_report(self, editor_data, doc):
-        """Print the General Financial Report to the Word Document."""
-        general_table = doc.add_table(rows=5, cols=2)
-        general_table.cell(0, 0).text="Starting Monthly Balance"
-        general_table.cell(0, 1).text=editor_data['Financials']['General']['Start Balance']
-        general_table.cell(1, 0).text="Total Receipts"
-        general_table.cell(1, 1).text=editor_data['Financials']['General']['Receipts']
-        general_table.cell(2, 0).text="Funds Deposited (membership)"
-        general_table.cell(2, 1).text=editor_data['Financials']['General']['Deposits']
-        general_table.cell(3, 0).text="Less Total Disbursements"
-        general_table.cell(3, 1).text=editor_data['Financials']['General']['Disbursements']
-        general_table.cell(4, 0).text="Ending Balance"
-        general_table.cell(4, 1).text=editor_data['Financials']['General']['End Balance']
-
-    def _print_chalice_report(self, editor_data, doc):
-        """Print the Chalice Fincalcial Report to the Word Document."""
-        chalice_table = doc.add_table(rows=5, cols=2)
-        chalice_table.cell(0, 0).text="Starting Monthly Balance"
-        chalice_table.cell(0, 1).text=editor_data['Financials']['Chalice']['Start Balance']
-        chalice_table.cell(1, 0).text="Total Receipts"
-        chalice_table.cell(1, 1).text=editor_data['Financials']['Chalice']['Receipts']
-        chalice_table.cell(2, 0).text="Funds Deposited"
-        chalice_table.cell(2, 1).text=editor_data['Financials']['Chalice']['Deposits']
-        chalice_table.cell(3, 0).text="Less Total Disbursements"
-        chalice_table.cell(3, 1).text=editor_data['Financials']['Chalice']['Disbursements']
-        chalice_table.cell(4, 0).text="Ending Balance"
-        chalice_table.cell(4, 1).text=editor_data['Financials']['Chalice']['End Balance']
-
-    def _print_flag_report(self, editor_data, doc):
-        """Print the Flag Financial Report to the Word Document."""
-        flag_table = doc.add_table(rows=5, cols=2)
-        flag_table.cell(0, 0).text="Starting Monthly Balance"
-        flag_table.cell(0, 1).text=editor_data['Financials']['Flag']['Start Balance']
-        flag_table.cell(1, 0).text="Total Receipts"
-        flag_table.cell(1, 1).text=editor_data['Financials']['Flag']['Receipts']
-        flag_table.cell(2, 0).text="Funds Deposited"
-        flag_table.cell(2, 1).text=editor_data['Financials']['Flag']['Deposits']
-        flag_table.cell(3, 0).text="Less Total Disbursements"
-        flag_table.cell(3, 1).text=editor_data['Financials']['Flag']['Disbursements']
-        flag_table.cell(4, 0).text="Ending Balance"
-        flag_table.cell(4, 1).text=editor_data['Financials']['Flag']['End Balance']
+    def _print_fund_report(self, fund, deposits_label, doc):
+        """Print the balances of one fund."""
+        doc.table([
+            ("Starting Monthly Balance", fund['Start Balance']),
+            ("Total Receipts", fund['Receipts']),
+            (deposits_label, fund['Deposits']),
+            ("Less Total Disbursements", fund['Disbursements']),
+            ("Ending Balance", fund['End Balance']),
+        ])
 
     def _print_transactions(self, editor_data, doc):
-        """Print the list of transactions to the Word Document."""
+        """Print the list of transactions."""
         if editor_data['Financials']['Withdrawals'] != '':
-            doc.add_heading("Withdrawal",3)
-            self.convert_text_to_word(doc, editor_data['Financials']['Withdrawals'])
+            doc.heading("Withdrawal", 3)
+            doc.bullets(editor_data['Financials']['Withdrawals'])
         if editor_data['Financials']['Deposits'] != '':
-            doc.add_heading("Deposits", 3)
-            self.convert_text_to_word(doc, editor_data['Financials']['Deposits'])
+            doc.heading("Deposits", 3)
+            doc.bullets(editor_data['Financials']['Deposits'])
+
+
+def _file_state(file_path):
+    """The size and modification time of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _has_contents(file_path, data):
+    """Return True if the file exists and holds exactly data."""
+    if _file_state(file_path) is None or os.path.getsize(file_path) != len(data):
+        return False
+    with open(file_path, 'rb') as f:
+        return f.read() == data
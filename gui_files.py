@@ -0,0 +1,124 @@
+"""
+    File dialogs and message boxes for the Minutes Editor.
+    Wraps the Tk-free FileManager so that only the graphical
+    interface pays for tkinter.
+"""
+from tkinter import messagebox, filedialog
+from datetime import datetime
+import export_job
+import file_mgr
+
+# The meeting file formats, see serializer.py.
+MEETING_FILE_TYPES = [
+    ("JSON files", "*.json"),
+    ("Compressed meetings (gzip)", "*.json.gz"),
+    ("Compressed meetings (zstd)", "*.json.zst"),
+    ("All files", "*.*"),
+]
+
+class GuiFileManager(file_mgr.FileManager):
+    """ Asks the user for file names and reports the results in message boxes."""
+
+    def __init__(self):
+        super().__init__()
+        self.export_job = None      # the Word export running in the background, see export_job.py
+
+    def save_file_as_json(self, editor_data):
+        """ This function saves the file under a new name."""
+        # Open file dialog to choose location and name
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=MEETING_FILE_TYPES,
+            title="Save Meeting As"
+        )
+        if file_path:
+            try:
+                self.save_meeting(editor_data, file_path)
+                print(f"Saved to: {file_path}")
+                return True
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save file: {e}")
+                print(f"Error saving: {e}")
+                return False
+        return False
+
+    def save_to_file(self, editor_data, changed=True, my_fields=None, resolve=None):
+        """"
+        Saves a file. Nothing is written if the meeting has not changed since it was saved.
+        Changes saved to the file by someone else are merged in, see FileManager.save_meeting.
+        """
+        if self.current_file:
+            try:
+                if self.save_meeting(editor_data, self.current_file, changed, my_fields, resolve):
+                    print(f"The file <{self.current_file}> was saved successfully!")
+                else:
+                    print(f"The file <{self.current_file}> has no changes to save.")
+                return True
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save file: {e}")
+                print(f"Error saving {e}")
+                return False
+        else:
+            return self.save_file_as_json(editor_data)
+
+    def open_json(self):
+        """Load the working data from a user selected JSON file."""
+        file_path = filedialog.askopenfilename(
+            defaultextension='.json',
+            filetypes=MEETING_FILE_TYPES,
+            title="Open Meeting File"
+        )
+
+        if file_path:   # User didn't cancel
+            try:
+                loaded_data = self.load_meeting(file_path)
+                print(f"Loaded from: {file_path}")
+                messagebox.showinfo("Success", f"Meeting loaded data from: {file_path}")
+                return loaded_data
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load file: {file_path}")
+                print(f"Error loading: {e}")
+                return None
+        return None # if the user cancels the open dialog
+
+    def convert_to_word(self, parent, editor_data, assembly_info, changed=True, revision=None, on_status=None,
+                        my_fields=None, resolve=None):
+        """
+        This function converts a JSON into a MS Word document.
+        The meeting is saved first, then the document is written in the background by an ExportJob.
+        Nothing is exported if the save fails or is cancelled.
+        Import: the Tk root, the editor data dictionary, the assembly info dictionary,
+        False if the meeting has not changed since it was saved,
+        the revision of the meeting (see FileManager.export_is_current),
+        a function showing a status message,
+        the fields changed since the file was read and the conflict resolver, as for save_to_file
+        Output: Word File; returns True if the meeting file was saved
+        """
+        if self.export_job is not None and not self.export_job.finished:
+            # one export at a time
+            self.export_job.lift()
+            return False
+
+        word_file = filedialog.asksaveasfilename(
+            title="Export to Word",
+            defaultextension=".docx",
+            filetypes=[("Word Documents", "*.docx"), ("All Files", "*.*")],
+            initialfile=f"KofC_Minutes_{datetime.now().strftime('%Y%m%d')}.docx"
+        )
+
+        # return if the user hits cancel.
+        if not word_file:
+            return False
+        print(f"Saving minutes to {word_file}")
+
+        # prepare the minutes for publication
+        saved = self.save_to_file(editor_data, changed, my_fields, resolve)
+        if not saved:
+            return False
+        if self.merged_fields:
+            # editor_data changed after the revision was taken
+            revision = None
+        self.export_job = export_job.ExportJob(parent, self, editor_data, word_file, assembly_info,
+                                               revision=revision, on_status=on_status)
+        return saved
+
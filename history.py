@@ -0,0 +1,184 @@
+"""
+    Undo and redo across the whole meeting.
+    The text boxes can undo their own typing, but nothing could undo a
+    wrong attendance button or a meeting opened over the one being typed.
+
+    History keeps the states of the meeting since it was opened. A state
+    is a tree of dictionaries that is never changed once made: a new
+    state copies only the dictionaries on the path to each changed field
+    and shares the rest of the tree, and the strings, with the state
+    before it. So a step costs about the size of the change instead of a
+    copy of the meeting.
+
+    The memory used by the steps is estimated as they are made. When it
+    goes over the limit the oldest steps are forgotten.
+
+    This module does not use tkinter; the editor binds Ctrl+Z and Ctrl+Y.
+"""
+import collections
+import copy
+import sys
+import journal
+import sharing
+
+# The memory the steps may use before the oldest are forgotten.
+HISTORY_BYTES = 32 * 1024 * 1024
+
+# One state of the meeting and how it was reached from the one before.
+#   meeting     the tree of the meeting, shared with the other steps; never changed
+#   paths       the fields that changed
+#   label       what the user did, e.g. "Meeting Info / Meeting Date"
+#   file        the meeting file open in this state
+#   whole       the step replaced the whole meeting, e.g. a meeting was opened
+#   size        the estimated bytes this step added
+Step = collections.namedtuple('Step', 'meeting paths label file whole size')
+
+
+def shared_update(meeting, changes):
+    """
+    Make a new tree with the changed fields, sharing the dictionaries that did not change.
+    Input: the tree, list of (field path, value); a value of sharing.MISSING removes the field
+    Output: (the new tree, the bytes of the dictionaries copied and the new values)
+    """
+    new_tree = dict(meeting)
+    size = sys.getsizeof(new_tree)
+    copied = {id(new_tree)}
+    for path, value in changes:
+        node = new_tree
+        for key in path[:-1]:
+            child = node.get(key)
+            if not (isinstance(child, dict) and id(child) in copied):
+                child = dict(child) if isinstance(child, dict) else {}
+                copied.add(id(child))
+                size += sys.getsizeof(child)
+                node[key] = child
+            node = child
+        if value is sharing.MISSING:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = value
+            size += sys.getsizeof(value)
+    return new_tree, size
+
+
+def tree_size(meeting):
+    """The bytes of a tree: its dictionaries and their values."""
+    size = sys.getsizeof(meeting)
+    for value in meeting.values():
+        size += tree_size(value) if isinstance(value, dict) else sys.getsizeof(value)
+    return size
+
+
+def describe(paths):
+    """The label of a step, e.g. 'Meeting Info / Meeting Date' or 'Minutes / Corrections and 2 more fields'."""
+    if not paths:
+        return 'no change'
+    label = sharing.field_label(paths[0])
+    if len(paths) > 1:
+        label += f" and {len(paths) - 1} more fields"
+    return label
+
+
+class History:
+    """
+    The states of a meeting, oldest first, and the position of the one shown.
+    The steps after the position are the ones that can be redone.
+    """
+
+    def __init__(self, editor_data, file=None, limit_bytes=HISTORY_BYTES):
+        self.limit_bytes = limit_bytes
+        self.reset(editor_data, file)
+
+    def reset(self, editor_data, file=None):
+        """Forget the steps and start again from a meeting, e.g. when the editor has recovered its journal."""
+        meeting = copy.deepcopy(editor_data)
+        self.steps = [Step(meeting, [], 'open', file, True, tree_size(meeting))]
+        self.position = 0
+        self.nbytes = self.steps[0].size
+        self.stats = {'steps': 0, 'forgotten': 0}
+
+    @property
+    def current(self):
+        """The Step of the meeting shown."""
+        return self.steps[self.position]
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.steps) - 1
+
+    def record(self, changes, label=None):
+        """
+        Add a step for fields changed in the editor. The steps that could be redone are forgotten.
+        Input: list of (field path, value), what the user did (the fields changed if left out)
+        """
+        paths = [tuple(path) for path, value in changes]
+        meeting, size = shared_update(self.current.meeting, changes)
+        self._add(Step(meeting, paths, label or describe(paths), self.current.file, False, size))
+
+    def replace(self, editor_data, file, label):
+        """
+        Add a step for a meeting that replaced the one shown, e.g. one opened or started.
+        Only the fields that differ are copied. Undoing it brings back the whole meeting before.
+        """
+        paths = sharing.changed_paths(self.current.meeting, editor_data)
+        meeting, size = shared_update(self.current.meeting,
+                                      [(path, journal.get_field(editor_data, path, sharing.MISSING)) for path in paths])
+        self._add(Step(meeting, paths, label, file, True, size))
+
+    def absorb(self, changes):
+        """Take in changes that are not the user's own, e.g. from the live session, without a step to undo."""
+        step = self.current
+        meeting, size = shared_update(step.meeting, changes)
+        self.steps[self.position] = step._replace(meeting=meeting, size=step.size + size)
+        self.nbytes += size
+        self._forget_oldest()
+
+    def sync(self, editor_data):
+        """Absorb the fields of editor_data that were changed outside the editor, e.g. merged by a save."""
+        paths = sharing.changed_paths(self.current.meeting, editor_data)
+        if paths:
+            self.absorb([(path, journal.get_field(editor_data, path, sharing.MISSING)) for path in paths])
+
+    def undo(self):
+        """
+        Go back one step.
+        Output: (the Step undone, list of (field path, value) that undo it), or None if there is nothing to undo.
+        If the step is whole, the meeting to show is current.meeting.
+        """
+        if not self.can_undo():
+            return None
+        step = self.current
+        self.position -= 1
+        before = self.current.meeting
+        return step, [(path, journal.get_field(before, path, '')) for path in step.paths]
+
+    def redo(self):
+        """Go forward one step. Output: as undo(), or None if there is nothing to redo"""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        step = self.current
+        return step, [(path, journal.get_field(step.meeting, path, '')) for path in step.paths]
+
+    def _add(self, step):
+        for forgotten in self.steps[self.position + 1:]:
+            self.nbytes -= forgotten.size
+        del self.steps[self.position + 1:]
+        self.steps.append(step)
+        self.position += 1
+        self.nbytes += step.size
+        self.stats['steps'] += 1
+        self._forget_oldest()
+
+    def _forget_oldest(self):
+        """Drop the oldest steps while the history uses more than limit_bytes."""
+        forget = 0
+        while self.nbytes > self.limit_bytes and forget < self.position:
+            self.nbytes -= self.steps[forget].size
+            forget += 1
+        if forget:
+            del self.steps[:forget]
+            self.position -= forget
+            self.stats['forgotten'] += forget
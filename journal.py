@@ -0,0 +1,142 @@
+"""
+    Edit journal for crash recovery.
+    Every field the editor changes is appended to a journal file as it
+    happens. If the program stops before the meeting is saved, the
+    journal is replayed the next time the editor starts.
+
+    The first line of the journal names the meeting file the edits
+    belong to. Each following line is a JSON list of
+    [field path, value].
+"""
+import json
+import os
+
+JOURNAL_FILE = 'minutes.journal'
+
+
+def set_field(editor_data, path, value):
+    """
+    Set one field of the editor data.
+    Input: the editor data dictionary, the field path as a list of keys, the value
+    """
+    target = editor_data
+    for key in path[:-1]:
+        target = target.setdefault(key, {})
+    target[path[-1]] = value
+
+
+def get_field(editor_data, path, default=None):
+    """Return one field of the editor data, or default if it is missing."""
+    target = editor_data
+    for key in path:
+        if not isinstance(target, dict) or key not in target:
+            return default
+        target = target[key]
+    return target
+
+
+class EditJournal:
+    """ An append-only log of field changes."""
+
+    def __init__(self, journal_file=JOURNAL_FILE):
+        self.journal_file = journal_file
+        self.target_file = None
+        self.entries = []           # the edits not yet written to the meeting file
+        self.generation = 0         # counts the resets, so old save markers can be recognised
+        self.first_sequence = 0     # the sequence number of entries[0]
+        self._file = None
+
+    @property
+    def count(self):
+        """The number of edits not yet written to the meeting file."""
+        return len(self.entries)
+
+    def dirty_fields(self):
+        """The paths of the fields changed since the meeting file was written."""
+        return {tuple(path) for path, value in self.entries}
+
+    @property
+    def marker(self):
+        """Identifies the current end of the journal, see truncate()."""
+        return self.generation, self.first_sequence + len(self.entries)
+
+    def recover(self):
+        """
+        Read the journal left by a previous session.
+        Output: (the meeting file or None, list of (path, value)), or None if there is nothing to recover
+        """
+        if not os.path.exists(self.journal_file):
+            return None
+        entries = []
+        target_file = None
+        with open(self.journal_file, 'r') as f:
+            for line_number, line in enumerate(f):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may be cut short by the crash
+                    break
+                if line_number == 0:
+                    target_file = record.get('file')
+                else:
+                    entries.append((record[0], record[1]))
+        if not entries:
+            return None
+        return target_file, entries
+
+    def reset(self, target_file):
+        """
+        Start a new journal for a meeting file.
+        Input: the meeting file, or None for a meeting that has not been saved
+        """
+        self.generation += 1
+        self.first_sequence = 0
+        self.target_file = target_file
+        self._rewrite([])
+
+    def _rewrite(self, entries):
+        """Replace the journal file with the header and the given edits."""
+        self.close()
+        self._file = open(self.journal_file, 'w')
+        self._file.write(json.dumps({'file': self.target_file}) + '\n')
+        for path, value in entries:
+            self._file.write(json.dumps([path, value]) + '\n')
+        self._file.flush()
+        self.entries = list(entries)
+
+    def append(self, path, value):
+        """
+        Record one field change. This runs on every edit, so it only
+        writes one short line and does not wait for the disk.
+        Input: the field path as a list of keys, the new value
+        """
+        if self._file is None:
+            self.reset(self.target_file)
+        self._file.write(json.dumps([path, value]) + '\n')
+        self._file.flush()
+        self.entries.append((path, value))
+
+    def truncate(self, marker):
+        """
+        Drop the edits that have been written to the meeting file.
+        Edits made after the marker stay in the journal. A marker from
+        before the last reset is ignored.
+        Input: the marker taken when the meeting was copied for saving
+        """
+        generation, sequence = marker
+        if generation != self.generation or sequence <= self.first_sequence:
+            return
+        saved = sequence - self.first_sequence
+        self.first_sequence = sequence
+        self._rewrite(self.entries[saved:])
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """Remove the journal file."""
+        self.close()
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
@@ -0,0 +1,204 @@
+"""
+    The financial ledger.
+    The balances on the Financial Statement tab are typed as free text.
+    This module reads them as whole cents, so no rounding creeps in,
+    and checks that every fund adds up:
+
+        Start Balance + Receipts + Deposits - Disbursements = End Balance
+
+    and that each meeting starts where the previous one ended.
+
+    One meeting is checked with plain integers, which is all the editor
+    needs. A whole archive is checked at once with NumPy arrays; numpy is
+    imported only then, so the editor starts without it.
+"""
+import re
+import catalog
+import schema
+import serializer
+
+# An amount as typed: 1234.5, $1,234.56, -12.00 or (12.00) for a negative amount.
+_AMOUNT = re.compile(r'^([-+])?\$?([-+])?(\d[\d,]*)?(?:\.(\d{0,2}))?$')
+
+# An amount at the end of a line of the Withdrawals or Deposits lists: $45, 45.00 or (45.00),
+# so that a check number at the end of a line is not read as an amount.
+_LINE_AMOUNT = re.compile(r'(\(?-?\$\s*\d[\d,]*(?:\.\d{1,2})?\)?|\(?-?\d[\d,]*\.\d{2}\)?)\s*$')
+
+# The columns of the balance arrays.
+START, RECEIPTS, DEPOSITS, DISBURSEMENTS, END = range(len(schema.MONEY_KEYS))
+
+
+def parse_cents(text):
+    """
+    Read an amount as whole cents.
+    Input: the amount as typed
+    Output: the cents as an int, None if the field is blank; raises ValueError if it is not an amount
+    """
+    text = (text or '').strip().replace(' ', '')
+    if not text:
+        return None
+    negative = text.startswith('(') and text.endswith(')')
+    if negative:
+        text = text[1:-1]
+    match = _AMOUNT.match(text)
+    if match is None or not (match.group(3) or match.group(4)):
+        raise ValueError(f"Not an amount: {text}")
+    whole = int((match.group(3) or '0').replace(',', ''))
+    cents = whole * 100 + int((match.group(4) or '').ljust(2, '0'))
+    if negative or '-' in (match.group(1), match.group(2)):
+        cents = -cents
+    return cents
+
+
+def format_cents(cents):
+    """Show cents as an amount, e.g. 123456 -> 1,234.56."""
+    sign = '-' if cents < 0 else ''
+    return f"{sign}{abs(cents) // 100:,}.{abs(cents) % 100:02d}"
+
+
+def transaction_amounts(text):
+    """
+    Read the amount at the end of each line of a Withdrawals or Deposits list.
+    Lines without an amount are left out.
+    Output: list of cents
+    """
+    amounts = []
+    for line in (text or '').split('\n'):
+        match = _LINE_AMOUNT.search(line.strip())
+        if match:
+            try:
+                amounts.append(parse_cents(match.group(1)))
+            except ValueError:
+                continue
+    return amounts
+
+
+def check_account(account):
+    """
+    Work out the End Balance of one fund from the other four amounts.
+    Blank Receipts, Deposits and Disbursements count as zero.
+    Input: the fund dictionary from editor_data['Financials']
+    Output: (computed End Balance in cents or None, a note for the Financial Statement tab)
+    """
+    try:
+        amounts = [parse_cents(account.get(key, '')) for key in schema.MONEY_KEYS]
+    except ValueError as e:
+        return None, str(e)
+    if amounts[START] is None:
+        return None, ''
+    computed = amounts[START] + (amounts[RECEIPTS] or 0) + (amounts[DEPOSITS] or 0) - (amounts[DISBURSEMENTS] or 0)
+    if amounts[END] is not None and amounts[END] != computed:
+        return computed, f"= {format_cents(computed)}, off by {format_cents(amounts[END] - computed)}"
+    return computed, f"= {format_cents(computed)}"
+
+
+class Ledger:
+    """
+    The balances of every fund in a run of meetings, as NumPy arrays of cents.
+        cents[meeting, fund, column]    the amounts, 0 where blank or unreadable
+        present[meeting, fund, column]  True where an amount was read
+        transactions[meeting, 0 or 1]   the totals of the Withdrawals and Deposits lists
+    """
+
+    def __init__(self, meetings):
+        """
+        Input: list of (label, editor_data['Financials']) in meeting order
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ValueError("Reconciling the ledger needs the numpy package.")
+        self.numpy = numpy
+        self.labels = [label for label, financials in meetings]
+        self.unreadable = []        # (label, fund, key, text)
+        self.failures = []          # (path, error) of the meeting files that could not be read, see from_files
+        shape = (len(meetings), len(schema.FUNDS), len(schema.MONEY_KEYS))
+        self.cents = numpy.zeros(shape, dtype=numpy.int64)
+        self.present = numpy.zeros(shape, dtype=bool)
+        self.transactions = numpy.zeros((len(meetings), 2), dtype=numpy.int64)
+
+        for index, (label, financials) in enumerate(meetings):
+            for fund_index, fund in enumerate(schema.FUNDS):
+                account = financials.get(fund, {})
+                for column, key in enumerate(schema.MONEY_KEYS):
+                    text = account.get(key, '')
+                    try:
+                        cents = parse_cents(text)
+                    except ValueError:
+                        self.unreadable.append((label, fund, key, text))
+                        continue
+                    if cents is not None:
+                        self.cents[index, fund_index, column] = cents
+                        self.present[index, fund_index, column] = True
+            self.transactions[index, 0] = sum(transaction_amounts(financials.get('Withdrawals', '')))
+            self.transactions[index, 1] = sum(transaction_amounts(financials.get('Deposits', '')))
+
+    @classmethod
+    def from_files(cls, paths):
+        """
+        Read the meeting files, ordered by Meeting Date. Meetings without a readable date are left out,
+        and the files that cannot be read as meetings are listed in failures.
+        """
+        meetings = []
+        failures = []
+        for path in paths:
+            try:
+                editor_data = serializer.load_file(path)
+                meeting_day = catalog.parse_meeting_date(editor_data.get('Meeting Info', {}).get('Meeting Date', ''))
+                financials = editor_data.get('Financials', {})
+                if not isinstance(financials, dict):
+                    raise ValueError("the Financials cannot be read")
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                failures.append((path, e))
+                continue
+            if meeting_day:
+                meetings.append((meeting_day, path, financials))
+        meetings.sort()
+        meeting_ledger = cls([(f"{meeting_day} {path}", financials) for meeting_day, path, financials in meetings])
+        meeting_ledger.failures = failures
+        return meeting_ledger
+
+    @classmethod
+    def from_catalog(cls, meeting_catalog, year=None):
+        """Read the balances indexed by the meeting catalog, see catalog.py."""
+        meetings = {}
+        for row in meeting_catalog.ledger_rows(year):
+            label = f"{row['meeting_day']} {row['path']}"
+            financials = meetings.setdefault(label, {})
+            financials[row['fund']] = {key: row[column] or '' for key, column in zip(
+                schema.MONEY_KEYS, ('start_balance', 'receipts', 'deposits', 'disbursements', 'end_balance'))}
+        return cls(list(meetings.items()))
+
+    def computed_end(self):
+        """The End Balances worked out from the other amounts, for every meeting and fund."""
+        cents = self.cents
+        return cents[:, :, START] + cents[:, :, RECEIPTS] + cents[:, :, DEPOSITS] - cents[:, :, DISBURSEMENTS]
+
+    def reconcile(self):
+        """
+        Find the funds that do not add up and the meetings that do not start
+        where the previous one ended.
+        Output: list of (label, fund, problem) in meeting order
+        """
+        numpy = self.numpy
+        present = self.present
+        computed = self.computed_end()
+        end = self.cents[:, :, END]
+        start = self.cents[:, :, START]
+
+        checked = present[:, :, START] & present[:, :, END]
+        off = checked & (computed != end)
+        # a meeting starts where the one before it ended
+        linked = present[1:, :, START] & present[:-1, :, END]
+        breaks = linked & (start[1:] != end[:-1])
+
+        issues = []
+        for index, fund_index in numpy.argwhere(off):
+            issues.append((index, fund_index, f"End Balance {format_cents(int(end[index, fund_index]))} "
+                                              f"should be {format_cents(int(computed[index, fund_index]))}"))
+        for index, fund_index in numpy.argwhere(breaks):
+            issues.append((index + 1, fund_index, f"Start Balance {format_cents(int(start[index + 1, fund_index]))} "
+                                                  f"is not the last End Balance {format_cents(int(end[index, fund_index]))}"))
+        issues.sort(key=lambda issue: (issue[0], issue[1]))
+        return [(self.labels[index], schema.FUNDS[fund_index], problem) for index, fund_index, problem in issues]
+
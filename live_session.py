@@ -0,0 +1,473 @@
+"""
+    A live meeting shared by several Minutes Editors on the local network.
+    One laptop hosts the session and the others join it. Everyone types
+    into the same meeting, and each change reaches the others within a
+    few tens of milliseconds.
+
+    Each text box of the meeting is a sequence CRDT (a replicated growable
+    array): every character has an id made of a Lamport counter and the
+    laptop that typed it, and is placed after the character it was typed
+    after. Laptops that apply the same changes in any order end up with
+    the same text, so two people can type into the same box at once. The
+    other fields (entries, lists, attendance) keep the value with the
+    latest id.
+
+    A change is sent as the characters inserted and the ids deleted, not
+    the whole field. The changes made in BATCH_MS are sent together, and
+    a run of typed characters becomes one insert. The host passes every
+    batch on to the other laptops and keeps a copy of the meeting, so a
+    laptop that joins late is sent a snapshot: the text with the deleted
+    characters kept only as counts.
+
+    Messages are length prefixed JSON over TCP. Nothing here needs tkinter;
+    the editor calls send() with its field changes and poll() for the
+    changes of the others.
+"""
+import json
+import queue
+import secrets
+import selectors
+import socket
+import struct
+import threading
+import time
+import journal
+import schema
+import sharing
+
+# The TCP port of the host.
+SESSION_PORT = 47600
+
+# Changes made within this time are sent together.
+BATCH_MS = 30
+
+# The site of the meeting as it was when the session was hosted.
+HOST_SITE = '0'
+
+# The fields that are shared as sequence CRDTs, the others keep their latest value.
+TEXT_PATHS = {field.path for field in schema.FIELDS if field.kind == 'text'}
+
+_LENGTH = struct.Struct('>I')
+
+
+class SessionError(Exception):
+    """ The session could not be hosted or joined."""
+
+
+# The replicated data
+class TextCRDT:
+    """
+    The characters of a text field in document order, deleted ones included:
+    each item is [counter, site, character, visible].
+    """
+
+    def __init__(self, items=None):
+        self.items = items or []
+
+    @classmethod
+    def from_text(cls, text, site, first_counter):
+        return cls([[first_counter + offset, site, char, True] for offset, char in enumerate(text)])
+
+    def text(self):
+        return ''.join(item[2] for item in self.items if item[3])
+
+    def _index(self, counter, site):
+        for index in range(len(self.items) - 1, -1, -1):
+            item = self.items[index]
+            if item[0] == counter and item[1] == site:
+                return index
+        raise KeyError((counter, site))
+
+    def insert(self, after, counter, site, text):
+        """
+        Insert a run of characters with the counters counter, counter + 1, ...
+        each after the one before it. Characters inserted at the same place by
+        others with later ids stay in front, so every laptop gets the same order.
+        Input: the [counter, site] of the character before the run, or None for the start
+        """
+        items = self.items
+        position = 0 if after is None else self._index(*after) + 1
+        for offset, char in enumerate(text):
+            ident = (counter + offset, site)
+            while position < len(items) and (items[position][0], items[position][1]) > ident:
+                position += 1
+            items.insert(position, [ident[0], site, char, True])
+            position += 1
+
+    def delete(self, ids):
+        """Hide the characters with the given [counter, site] ids."""
+        wanted = {tuple(ident) for ident in ids}
+        for item in self.items:
+            if (item[0], item[1]) in wanted:
+                item[3] = False
+
+    def edit_ops(self, path, new_text, counter, site):
+        """
+        The operations that turn this text into new_text: one delete and one insert
+        around the common beginning and end.
+        Output: (list of operations, the number of counters used)
+        """
+        visible = [item for item in self.items if item[3]]
+        old_text = ''.join(item[2] for item in visible)
+        prefix = 0
+        limit = min(len(old_text), len(new_text))
+        while prefix < limit and old_text[prefix] == new_text[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_text[-1 - suffix] == new_text[-1 - suffix]:
+            suffix += 1
+
+        ops = []
+        deleted = visible[prefix:len(visible) - suffix]
+        if deleted:
+            ops.append(['d', list(path), [[item[0], item[1]] for item in deleted]])
+        inserted = new_text[prefix:len(new_text) - suffix]
+        if inserted:
+            after = [visible[prefix - 1][0], visible[prefix - 1][1]] if prefix else None
+            ops.append(['i', list(path), after, counter, site, inserted])
+        return ops, len(inserted)
+
+    def snapshot(self):
+        """
+        The items as runs of one site with consecutive counters:
+        [site, first counter, text] for visible runs, [site, first counter, count] for deleted ones.
+        """
+        runs = []
+        for counter, site, char, visible in self.items:
+            if runs:
+                run = runs[-1]
+                length = len(run[2]) if isinstance(run[2], str) else run[2]
+                if run[0] == site and run[1] + length == counter and isinstance(run[2], str) == visible:
+                    run[2] = run[2] + char if visible else run[2] + 1
+                    continue
+            runs.append([site, counter, char if visible else 1])
+        return runs
+
+    @classmethod
+    def from_snapshot(cls, runs):
+        items = []
+        for site, first, content in runs:
+            if isinstance(content, str):
+                items.extend([first + offset, site, char, True] for offset, char in enumerate(content))
+            else:
+                items.extend([first + offset, site, '', False] for offset in range(content))
+        return cls(items)
+
+
+class SessionState:
+    """ The shared meeting on one laptop: a TextCRDT for each text field and a (value, counter, site) for the others."""
+
+    def __init__(self, site):
+        self.site = site
+        self.clock = 0              # Lamport counter
+        self.texts = {}             # field path -> TextCRDT
+        self.values = {}            # field path -> [value, counter, site]
+
+    @classmethod
+    def from_editor_data(cls, site, editor_data):
+        """The state of the host when the session starts. Every laptop numbers this meeting the same way."""
+        state = cls(site)
+        counter = 1
+        for path in sharing.changed_paths({}, editor_data):
+            value = journal.get_field(editor_data, path)
+            if path in TEXT_PATHS and isinstance(value, str):
+                state.texts[path] = TextCRDT.from_text(value, HOST_SITE, counter)
+                counter += len(value)
+            else:
+                state.values[path] = [value, 0, HOST_SITE]
+        for path in TEXT_PATHS - set(state.texts):
+            state.texts[path] = TextCRDT()
+        state.clock = counter
+        return state
+
+    def fields(self):
+        """Every field as (path, value)."""
+        return ([(path, text.text()) for path, text in self.texts.items()] +
+                [(path, value[0]) for path, value in self.values.items()])
+
+    def local_changes(self, changes):
+        """
+        Turn the editor's field changes into operations and apply them here.
+        Input: list of (field path, value)
+        Output: list of operations
+        """
+        ops = []
+        for path, value in changes:
+            path = tuple(path)
+            if path in self.texts:
+                text_ops, used = self.texts[path].edit_ops(path, value, self.clock + 1, self.site)
+                self.clock += used
+                ops.extend(text_ops)
+            else:
+                self.clock += 1
+                ops.append(['v', list(path), value, self.clock, self.site])
+        self.apply(ops)
+        return ops
+
+    def apply(self, ops):
+        """
+        Apply operations, from this laptop or another.
+        Output: list of (field path, new value) of the fields that changed
+        """
+        changed = {}
+        for op in ops:
+            kind, path = op[0], tuple(op[1])
+            if kind == 'i':
+                after, counter, site, text = op[2:]
+                self.texts.setdefault(path, TextCRDT()).insert(after, counter, site, text)
+                self.clock = max(self.clock, counter + len(text) - 1)
+                changed[path] = None
+            elif kind == 'd':
+                self.texts.setdefault(path, TextCRDT()).delete(op[2])
+                changed[path] = None
+            else:
+                value, counter, site = op[2:]
+                current = self.values.get(path)
+                self.clock = max(self.clock, counter)
+                if current is None or (counter, site) > (current[1], current[2]):
+                    self.values[path] = [value, counter, site]
+                    changed[path] = None
+        return [(path, self.texts[path].text() if path in self.texts else self.values[path][0]) for path in changed]
+
+    def snapshot(self):
+        return {
+            'clock': self.clock,
+            'texts': [[list(path), text.snapshot()] for path, text in self.texts.items()],
+            'values': [[list(path)] + value for path, value in self.values.items()],
+        }
+
+    @classmethod
+    def from_snapshot(cls, site, snapshot):
+        state = cls(site)
+        state.clock = snapshot['clock']
+        state.texts = {tuple(path): TextCRDT.from_snapshot(runs) for path, runs in snapshot['texts']}
+        state.values = {tuple(entry[0]): entry[1:] for entry in snapshot['values']}
+        return state
+
+
+def coalesce(ops, new_ops):
+    """
+    Add operations to a batch, joining an insert that continues the last one
+    (a character typed after the one before it) into a single run, and
+    deletes from the same field into one.
+    """
+    for op in new_ops:
+        last = ops[-1] if ops else None
+        if (op[0] == 'i' and last is not None and last[0] == 'i' and last[1] == op[1] and last[4] == op[4]
+                and op[2] == [last[3] + len(last[5]) - 1, last[4]] and op[3] == last[3] + len(last[5])):
+            last[5] += op[5]
+        elif op[0] == 'd' and last is not None and last[0] == 'd' and last[1] == op[1]:
+            last[2].extend(op[2])
+        else:
+            ops.append(op)
+
+
+# The network
+def encode(message):
+    data = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    return _LENGTH.pack(len(data)) + data
+
+
+class _Connection:
+    """ A TCP connection that reads length prefixed messages."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = b''
+
+    def read_messages(self):
+        """Read what has arrived. Output: list of raw messages, or None when the connection has closed."""
+        data = self.sock.recv(65536)
+        if not data:
+            return None
+        self.buffer += data
+        messages = []
+        while len(self.buffer) >= _LENGTH.size:
+            length, = _LENGTH.unpack_from(self.buffer)
+            if len(self.buffer) < _LENGTH.size + length:
+                break
+            messages.append(self.buffer[:_LENGTH.size + length])
+            self.buffer = self.buffer[_LENGTH.size + length:]
+        return messages
+
+
+def decode(frame):
+    return json.loads(frame[_LENGTH.size:])
+
+
+class LiveSession:
+    """
+    One laptop's end of a session. The editor calls send() and poll() on its
+    own thread; a background thread talks to the network.
+    """
+
+    def __init__(self, state, listener=None, host_connection=None, mirror=None):
+        self.state = state
+        self.is_host = listener is not None
+        self.port = listener.getsockname()[1] if listener is not None else None
+        self.stats = {'bytes sent': 0, 'bytes received': 0, 'batches sent': 0, 'snapshot bytes': 0}
+        self._listener = listener
+        self._host = host_connection            # the connection to the host, for the others
+        self._mirror = mirror                   # the host's copy for late joiners, kept by the network thread
+        self._peers = []                        # the host's connections to the others
+        self._outbox = []
+        self._inbox = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._selector = selectors.DefaultSelector()
+        if listener is not None:
+            self._selector.register(listener, selectors.EVENT_READ)
+        if host_connection is not None:
+            self._selector.register(host_connection.sock, selectors.EVENT_READ, host_connection)
+        self._thread = threading.Thread(target=self._run, name='live session', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def host(cls, editor_data, port=SESSION_PORT, address=''):
+        """Share a meeting. Port 0 picks a free port, see LiveSession.port. Output: the LiveSession"""
+        listener = socket.create_server((address, port))
+        listener.setblocking(False)
+        state = SessionState.from_editor_data(HOST_SITE, editor_data)
+        mirror = SessionState.from_editor_data(HOST_SITE, editor_data)
+        return cls(state, listener=listener, mirror=mirror)
+
+    @classmethod
+    def join(cls, address, port=SESSION_PORT, timeout=10.0):
+        """
+        Join the session of a host and wait for its snapshot.
+        Output: the LiveSession; its state holds the meeting, see SessionState.fields
+        """
+        try:
+            sock = socket.create_connection((address, port), timeout=timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            site = secrets.token_hex(3)
+            sock.sendall(encode({'t': 'hello', 'site': site}))
+            connection = _Connection(sock)
+            while True:
+                messages = connection.read_messages()
+                if messages is None:
+                    raise SessionError(f"The host {address} closed the connection.")
+                if messages:
+                    break
+        except OSError as e:
+            raise SessionError(f"Cannot join the session at {address}:{port}: {e}")
+        sock.settimeout(None)
+        state = SessionState.from_snapshot(site, decode(messages[0])['snapshot'])
+        session = cls(state, host_connection=connection)
+        session.stats['bytes received'] += len(messages[0])
+        for frame in messages[1:]:
+            session._inbox.put(decode(frame)['ops'])
+        return session
+
+    @property
+    def peer_count(self):
+        return len(self._peers)
+
+    def send(self, changes):
+        """Share field changes made on this laptop. Input: list of (field path, value)"""
+        ops = self.state.local_changes(changes)
+        if ops:
+            with self._lock:
+                coalesce(self._outbox, ops)
+
+    def poll(self):
+        """Apply the changes that have arrived from the others. Output: list of (field path, value)"""
+        changed = {}
+        while True:
+            try:
+                ops = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            changed.update(self.state.apply(ops))
+        return list(changed.items())
+
+    def close(self):
+        self._closed.set()
+        self._thread.join(timeout=1.0)
+
+    # The network thread
+    def _run(self):
+        next_flush = time.monotonic()
+        try:
+            while not self._closed.is_set():
+                timeout = max(0.0, next_flush - time.monotonic())
+                for key, events in self._selector.select(timeout):
+                    if key.fileobj is self._listener:
+                        self._accept()
+                    else:
+                        self._receive(key.data)
+                if time.monotonic() >= next_flush:
+                    self._flush()
+                    next_flush = time.monotonic() + BATCH_MS / 1000
+        finally:
+            for connection in self._peers + ([self._host] if self._host else []):
+                connection.sock.close()
+            if self._listener is not None:
+                self._listener.close()
+            self._selector.close()
+
+    def _accept(self):
+        sock, address = self._listener.accept()
+        sock.setblocking(True)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._selector.register(sock, selectors.EVENT_READ, _Connection(sock))
+
+    def _receive(self, connection):
+        try:
+            frames = connection.read_messages()
+        except OSError:
+            frames = None
+        if frames is None:
+            self._drop(connection)
+            return
+        for frame in frames:
+            self.stats['bytes received'] += len(frame)
+            message = decode(frame)
+            if message['t'] == 'hello' and self.is_host:
+                # send what is waiting first, so the snapshot is followed only by newer changes
+                self._flush()
+                snapshot = encode({'t': 'snapshot', 'snapshot': self._mirror.snapshot()})
+                self.stats['snapshot bytes'] += len(snapshot)
+                self._send(connection, snapshot)
+                self._peers.append(connection)
+            elif message['t'] == 'ops':
+                if self.is_host:
+                    self._mirror.apply(message['ops'])
+                    for peer in self._peers:
+                        if peer is not connection:
+                            self._send(peer, frame)
+                self._inbox.put(message['ops'])
+
+    def _flush(self):
+        """Send the changes made on this laptop since the last batch."""
+        with self._lock:
+            ops, self._outbox = self._outbox, []
+        if not ops:
+            return
+        frame = encode({'t': 'ops', 'ops': ops})
+        self.stats['batches sent'] += 1
+        if self.is_host:
+            self._mirror.apply(ops)
+            for peer in list(self._peers):
+                self._send(peer, frame)
+        elif self._host is not None:
+            self._send(self._host, frame)
+
+    def _send(self, connection, frame):
+        try:
+            connection.sock.sendall(frame)
+            self.stats['bytes sent'] += len(frame)
+        except OSError:
+            self._drop(connection)
+
+    def _drop(self, connection):
+        if connection in self._peers:
+            self._peers.remove(connection)
+        try:
+            self._selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        connection.sock.close()
+        if connection is self._host:
+            self._host = None
+            print("The live session host has gone.")
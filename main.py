@@ -1,4 +1,52 @@
-import editor
+import argparse
+import sys
+import startup
 
 if __name__ == "__main__":
-    minutes_editor = editor.EditorGui()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Minutes Editor")
+    parser.add_argument('--low-memory', action='store_true',
+                        help="Destroy the widgets of tabs that have been hidden for a while.")
+    parser.add_argument('--history-mb', type=float, default=32,
+                        help="Memory kept for Undo before the oldest changes are forgotten (default 32).")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="Print the import times and startup phases once the editor is ready.")
+    parser.add_argument('--eager-tabs', action='store_true',
+                        help="Build every tab before the window is shown, as before tabs were built on first "
+                             "selection. For comparing --profile-startup runs.")
+    parser.add_argument('--quit-after-startup', action='store_true',
+                        help="Close the window once the startup has finished, e.g. after --profile-startup.")
+    parser.add_argument('--bench-populate', nargs='+', metavar='SOURCE',
+                        help="Open meetings from these folders or files, report the mean and p95 time "
+                             "to fill the tabs and quit. Under Xvfb: xvfb-run python main.py --bench-populate DIR")
+    parser.add_argument('--populate-tabs', choices=('all', 'shown'), default='all',
+                        help="Tabs built before --bench-populate: all of them, as before tabs were built on first "
+                             "selection, or only the one shown with the window (default all).")
+    parser.add_argument('--bench-tabs', nargs='?', const='', metavar='MEETING',
+                        help="Show each tab the first time and then again, report how long each took and quit. "
+                             "Uses a made up meeting if none is given. Under Xvfb: xvfb-run python main.py --bench-tabs")
+    parser.add_argument('--count', type=int, default=200,
+                        help="Number of meetings opened by --bench-populate, or times each tab is shown "
+                             "again by --bench-tabs (default 200).")
+    args = parser.parse_args()
+
+    populate_benchmark = None
+    if args.bench_populate:
+        import minutes
+        meeting_files = minutes.find_meeting_files(args.bench_populate)
+        if not meeting_files:
+            sys.exit("No meeting files found.")
+        populate_benchmark = (meeting_files, args.count, args.populate_tabs == 'all')
+    tabs_benchmark = None
+    if args.bench_tabs is not None:
+        import minutes
+        tabs_benchmark = (minutes.sample_meeting(args.bench_tabs or None), args.count)
+
+    profile = startup.StartupProfile(args.profile_startup)
+    profile.start_import_timer()
+    with profile.phase('imports'):
+        import editor
+    minutes_editor = editor.EditorGui(low_memory=args.low_memory, profile=profile,
+                                      populate_benchmark=populate_benchmark,
+                                      history_bytes=int(args.history_mb * 1024 * 1024),
+                                      tabs_benchmark=tabs_benchmark, eager_tabs=args.eager_tabs,
+                                      quit_after_startup=args.quit_after_startup)
@@ -0,0 +1,1171 @@
+"""
+    Command line tools for Minutes Editor.
+    Runs without the graphical interface so that meetings can be
+    processed in bulk, e.g.
+
+        python -m minutes export meetings/ --out word/ --jobs 4
+        python -m minutes export meetings/ --out site/ --formats docx html md txt
+        python -m minutes book meetings/ --year 2025 --out minutes-2025.docx
+        python -m minutes serve --jobs 4
+        python -m minutes bench-daemon meetings/ --clients 8
+        python -m minutes catalog rebuild meetings/
+        python -m minutes catalog motions --year 2025
+        python -m minutes bench-catalog --count 10000
+        python -m minutes ledger meetings/
+        python -m minutes bench-ledger --count 10000
+        python -m minutes attendance meetings/ --out attendance.docx
+        python -m minutes bench-attendance --years 50
+        python -m minutes bench-fields meetings/
+        python -m minutes simulate-saves
+        python -m minutes bench-formats --count 10000
+        python -m minutes bench-save --count 200
+        python -m minutes bench-templates --counts 1 100 1000
+        python -m minutes bench-reexport
+        python -m minutes bench-config
+        python -m minutes bench-session --peers 2 5 20
+        python -m minutes bench-history --edits 10000
+        python -m minutes bench-imports
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import assembly
+import attendance
+import catalog
+import config
+import file_mgr
+import history
+import journal
+import ledger
+import live_session
+import minutes_book
+import render_daemon
+import schema
+import serializer
+
+
+def find_meeting_files(sources):
+    """
+    Expand the command line sources into a sorted list of meeting files.
+    Input: directories, glob patterns or file names
+    Output: list of meeting file paths
+    """
+    found = set()
+    for source in sources:
+        if os.path.isdir(source):
+            paths = [path for path in glob.glob(os.path.join(source, '*')) if serializer.is_meeting_file(path)]
+        else:
+            paths = glob.glob(source)
+        for path in paths:
+            if os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def is_up_to_date(source, target):
+    """Return True if the Word file exists and is newer than its JSON source."""
+    return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source)
+
+
+def export_one(source, targets, assembly_info, streaming=False):
+    """
+    Render one meeting file to Word and the other formats. Runs inside a worker process.
+    Input: the meeting file path, the output paths (see document_ir.FORMATS),
+    the assembly info dictionary, streaming selects the streaming Word writer
+    Output: (source, seconds) on success
+    """
+    start = time.perf_counter()
+    editor_data = serializer.load_file(source)
+    file_mgr.FileManager().publish(editor_data, assembly_info, targets, streaming)
+    return source, time.perf_counter() - start
+
+
+def export_command(args):
+    """Export every meeting found in the sources to Word documents."""
+    sources = find_meeting_files(args.sources)
+    if not sources:
+        print("No meeting files found.")
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    assembly_info = config.assembly_info()
+
+    jobs = []
+    skipped = 0
+    for source in sources:
+        targets = [os.path.join(args.out, f"{serializer.meeting_name(source)}.{extension}") for extension in args.formats]
+        if not args.force and all(is_up_to_date(source, target) for target in targets):
+            skipped += 1
+            continue
+        jobs.append((source, targets))
+
+    timings = []
+    failures = []
+    start = time.perf_counter()
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {executor.submit(export_one, source, targets, assembly_info, args.streaming): source
+                       for source, targets in jobs}
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    timings.append(future.result())
+                    print(f"Exported {source}")
+                except Exception as e:
+                    failures.append((source, e))
+                    print(f"Failed {source}: {e}")
+    elapsed = time.perf_counter() - start
+
+    # Report the results
+    print()
+    for source, seconds in sorted(timings):
+        print(f"{seconds * 1000:8.1f} ms  {source}")
+    for source, error in sorted(failures, key=lambda item: item[0]):
+        print(f"  FAILED     {source}: {error}")
+    print(f"\n{len(timings)} exported, {skipped} up to date, {len(failures)} failed in {elapsed:.2f} s")
+    return 1 if failures else 0
+
+
+def book_command(args):
+    """Write the minutes of a year, or of every meeting found, into one Word document."""
+    sources = find_meeting_files(args.sources)
+    if not sources:
+        print("No meeting files found.")
+        return 1
+    assembly_info = config.assembly_info()
+    start = time.perf_counter()
+    count, failures = minutes_book.write_book(sources, args.out, assembly_info, args.year, args.jobs)
+    for source, error in failures:
+        print(f"  FAILED     {source}: {error}")
+    if count == 0:
+        print("No meetings to put in the book.")
+        return 1
+    print(f"{count} meetings written to {args.out} in {time.perf_counter() - start:.2f} s, "
+          f"{len(failures)} files could not be read or rendered")
+    return 1 if failures else 0
+
+
+def serve_command(args):
+    """Run the render daemon, see render_daemon.py."""
+    try:
+        render_daemon.serve(args.socket, args.jobs, args.queue)
+    except OSError as e:
+        print(e)
+        return 1
+    return 0
+
+
+def bench_daemon_command(args):
+    """
+    Load test the render daemon: exports one at a time and from several
+    clients at once, against starting `minutes export` for every meeting.
+    """
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as folder:
+        sources = find_meeting_files(args.sources)
+        if not sources:
+            sample = os.path.join(folder, 'sample.json')
+            with open(sample, 'wb') as f:
+                f.write(serializer.dumps(sample_meeting()))
+            sources = [sample]
+        socket_path = os.path.join(folder, render_daemon.SOCKET_FILE)
+        script = os.path.abspath(__file__)
+        daemon = subprocess.Popen([sys.executable, script, 'serve', '--socket', socket_path, '--jobs', str(args.jobs)])
+        try:
+            start = time.perf_counter()
+            while True:
+                try:
+                    render_daemon.request({'op': 'stats'}, socket_path)
+                    break
+                except OSError:
+                    if daemon.poll() is not None or time.perf_counter() - start > 60:
+                        print("The render daemon did not start.")
+                        return 1
+                    time.sleep(0.05)
+            print(f"daemon started in {time.perf_counter() - start:.2f} s with {args.jobs} workers")
+
+            def timed_render(number):
+                begin = time.perf_counter()
+                reply = render_daemon.render(sources[number % len(sources)],
+                                             [os.path.join(folder, f"out{number}.docx")], socket_path)
+                if not reply['ok']:
+                    raise RuntimeError(reply['error'])
+                return time.perf_counter() - begin
+
+            print(f"\n{'':<28}{'per s':>8}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+            for name, clients in (('daemon, one client', 1), (f"daemon, {args.clients} clients", args.clients)):
+                begin = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=clients) as executor:
+                    times = list(executor.map(timed_render, range(args.count)))
+                elapsed = time.perf_counter() - begin
+                print(f"{name:<28}{args.count / elapsed:>8.1f}" + ''.join(f"{value:>10.1f}" for value in percentiles(times)))
+
+            times = []
+            for number in range(args.cold):
+                begin = time.perf_counter()
+                subprocess.run([sys.executable, script, 'export', sources[number % len(sources)],
+                                '--out', os.path.join(folder, 'cold'), '--force', '--jobs', '1'],
+                               check=True, stdout=subprocess.DEVNULL)
+                times.append(time.perf_counter() - begin)
+            print(f"{'cold minutes export':<28}{len(times) / sum(times):>8.1f}" + ''.join(f"{value:>10.1f}" for value in percentiles(times)))
+
+            stats = render_daemon.request({'op': 'stats'}, socket_path)
+            print(f"\n{stats['rendered']} rendered, {stats['failed']} failed, {stats['busy']} busy replies")
+        finally:
+            try:
+                render_daemon.request({'op': 'stop'}, socket_path)
+            except OSError:
+                daemon.terminate()
+            daemon.wait()
+    return 0
+
+
+def catalog_command(args):
+    """Rebuild or query the meeting catalog."""
+    meeting_catalog = catalog.MeetingCatalog(args.db)
+    start = time.perf_counter()
+    if args.action == 'rebuild':
+        indexed, failures = meeting_catalog.rebuild(args.directory)
+        for path, error in failures:
+            print(f"Failed {path}: {error}")
+        print(f"{indexed} meetings indexed, {len(failures)} failed in {time.perf_counter() - start:.2f} s")
+        return 1 if failures else 0
+
+    if args.action == 'meetings':
+        rows = meeting_catalog.meetings(args.year)
+        columns = ('meeting_day', 'meeting_date', 'start_time', 'path')
+    elif args.action == 'motions':
+        rows = meeting_catalog.motions(args.year)
+        columns = ('meeting_day', 'motion_by', 'seconded_by', 'approval')
+    elif args.action == 'balances':
+        rows = meeting_catalog.balances(args.fund, args.year)
+        columns = ('meeting_day', 'start_balance', 'receipts', 'deposits', 'disbursements', 'end_balance')
+    else:
+        rows = meeting_catalog.attendance(args.name)
+        columns = ('meeting_day', 'office', 'attendance')
+    elapsed = time.perf_counter() - start
+
+    print('\t'.join(columns))
+    for row in rows:
+        print('\t'.join(str(row[column] or '') for column in columns))
+    print(f"{len(rows)} rows in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+def bench_catalog_command(args):
+    """
+    Time rebuilding the catalog of made up meetings, starting the next meeting
+    from it and the catalog queries, against opening every file to find the
+    latest meeting.
+    """
+    import random
+    chooser = random.Random(1)
+    names = [f"Sir Knight {number}" for number in range(60)]
+
+    with tempfile.TemporaryDirectory() as folder:
+        meetings = os.path.join(folder, 'meetings')
+        os.mkdir(meetings)
+        for number in range(args.count):
+            editor_data = sample_meeting()
+            # two meetings a month, in the date formats the scribes have used
+            year, month, day = 1950 + number // 24, number // 2 % 12 + 1, 1 + number % 2 * 14 + chooser.randrange(14)
+            date_format = chooser.choice([date_format for date_format in catalog.DATE_FORMATS if '%y' not in date_format])
+            editor_data['Meeting Info']['Meeting Date'] = time.strftime(date_format, (year, month, day, 0, 0, 0, 0, 1, -1))
+            for office in schema.OFFICES:
+                editor_data['officers'][office] = {'name': chooser.choice(names),
+                                                   'attendance': chooser.choice(('Present', 'Absent', 'Excused'))}
+            editor_data['Minutes']['Motion to Approve'], editor_data['Minutes']['Seconded by'] = chooser.sample(names, 2)
+            with open(os.path.join(meetings, f"meeting{number:05d}.json"), 'wb') as f:
+                f.write(serializer.dumps(editor_data))
+
+        meeting_catalog = catalog.MeetingCatalog(os.path.join(folder, catalog.CATALOG_FILE))
+        timings = []
+        for name in ('rebuild', 'rebuild again'):
+            start = time.perf_counter()
+            indexed, failures = meeting_catalog.rebuild(meetings)
+            timings.append((name, [time.perf_counter() - start]))
+        if failures:
+            print(f"{len(failures)} meetings could not be indexed, e.g. {failures[0][0]}: {failures[0][1]}")
+            return 1
+
+        def start_next_meeting():
+            # as FileManager.new_json
+            row = meeting_catalog.latest_meetings()[0]
+            return schema.carry_forward(serializer.load_file(row['path']))
+
+        def scan_for_latest():
+            # what starting the next meeting costs without the catalog
+            dated = []
+            for path in find_meeting_files([meetings]):
+                day = catalog.parse_meeting_date(serializer.load_file(path)['Meeting Info']['Meeting Date'])
+                if day:
+                    dated.append((day, path))
+            return schema.carry_forward(serializer.load_file(max(dated)[1]))
+
+        middle_year = 1950 + args.count // 48
+        queries = (
+            ('next meeting (catalog)', start_next_meeting, args.repeat),
+            ('next meeting (scan files)', scan_for_latest, 1),
+            ('latest meetings', meeting_catalog.latest_meetings, args.repeat),
+            ('meetings of a year', lambda: meeting_catalog.meetings(middle_year), args.repeat),
+            ('all meetings', meeting_catalog.meetings, max(1, args.repeat // 10)),
+            ('motions of a year', lambda: meeting_catalog.motions(middle_year), args.repeat),
+            ('balances of a year', lambda: meeting_catalog.balances('General', middle_year), args.repeat),
+            ('attendance of a knight', lambda: meeting_catalog.attendance(names[0]), args.repeat),
+        )
+        for name, query, repeat in queries:
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                query()
+                times.append(time.perf_counter() - start)
+            timings.append((name, times))
+        meeting_catalog.close()
+        size = sum(os.path.getsize(path) for path in glob.glob(os.path.join(folder, catalog.CATALOG_FILE + '*')))
+
+    print(f"{indexed} meetings, catalog {size / 1024:.0f} KB")
+    print(f"\n{'':<28}{'runs':>6}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, times in timings:
+        print(f"{name:<28}{len(times):>6}" + ''.join(f"{value:>10.2f}" for value in percentiles(times)))
+    return 0
+
+
+def ledger_command(args):
+    """Check that every fund adds up in every meeting and that each meeting starts where the last one ended."""
+    start = time.perf_counter()
+    try:
+        if args.sources:
+            sources = find_meeting_files(args.sources)
+            if not sources:
+                print("No meeting files found.")
+                return 1
+            meeting_ledger = ledger.Ledger.from_files(sources)
+        else:
+            meeting_ledger = ledger.Ledger.from_catalog(catalog.MeetingCatalog(args.db), args.year)
+        issues = meeting_ledger.reconcile()
+    except ValueError as e:
+        print(e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    for label, fund, key, text in meeting_ledger.unreadable:
+        print(f"{label}  {fund}: {key} is not an amount: {text}")
+    for label, fund, problem in issues:
+        print(f"{label}  {fund}: {problem}")
+    for source, error in meeting_ledger.failures:
+        print(f"  FAILED     {source}: {error}")
+    withdrawals, deposits = (int(total) for total in meeting_ledger.transactions.sum(axis=0))
+    print(f"\n{len(meeting_ledger.labels)} meetings checked in {elapsed * 1000:.1f} ms: "
+          f"{len(issues)} problems, {len(meeting_ledger.unreadable)} unreadable amounts, "
+          f"{len(meeting_ledger.failures)} files could not be read")
+    if args.sources:
+        print(f"Withdrawals listed: {ledger.format_cents(withdrawals)}, deposits listed: {ledger.format_cents(deposits)}")
+    return 1 if issues or meeting_ledger.unreadable or meeting_ledger.failures else 0
+
+
+def bench_ledger_command(args):
+    """
+    Reconcile made up meetings with NumPy arrays and with a plain Python loop
+    over the same amounts, which finds the same problems.
+    """
+    import random
+    chooser = random.Random(1)
+    meetings = []
+    balances = {fund: 100000 for fund in schema.FUNDS}
+    for number in range(args.count):
+        financials = {'Withdrawals': f"Check {number} $12.50", 'Deposits': ''}
+        for fund in schema.FUNDS:
+            receipts, deposits, disbursements = (chooser.randrange(0, 50000) for _ in range(3))
+            end = balances[fund] + receipts + deposits - disbursements
+            # one End Balance in a hundred is mistyped
+            typed_end = end + chooser.choice((-100, 100)) if chooser.random() < 0.01 else end
+            financials[fund] = {key: ledger.format_cents(cents) for key, cents in zip(
+                schema.MONEY_KEYS, (balances[fund], receipts, deposits, disbursements, typed_end))}
+            balances[fund] = end
+        meetings.append((f"meeting {number}", financials))
+
+    try:
+        start = time.perf_counter()
+        meeting_ledger = ledger.Ledger(meetings)
+        parse_time = time.perf_counter() - start
+    except ValueError as e:
+        print(e)
+        return 1
+    start = time.perf_counter()
+    issues = meeting_ledger.reconcile()
+    numpy_time = time.perf_counter() - start
+
+    cents = meeting_ledger.cents.tolist()
+    start = time.perf_counter()
+    loop_issues = 0
+    for index, meeting in enumerate(cents):
+        for fund_index, (start_balance, receipts, deposits, disbursements, end) in enumerate(meeting):
+            loop_issues += start_balance + receipts + deposits - disbursements != end
+            if index:
+                loop_issues += cents[index - 1][fund_index][ledger.END] != start_balance
+    loop_time = time.perf_counter() - start
+
+    print(f"{args.count} meetings, {len(schema.FUNDS)} funds")
+    print(f"{'read amounts':<24}{parse_time * 1000:>10.1f} ms")
+    print(f"{'reconcile (numpy)':<24}{numpy_time * 1000:>10.1f} ms  {len(issues)} problems")
+    print(f"{'reconcile (loop)':<24}{loop_time * 1000:>10.1f} ms  {loop_issues} problems")
+    return 0
+
+
+def attendance_command(args):
+    """Report the attendance rates, streaks and trends of every officer and member."""
+    sources = find_meeting_files(args.sources)
+    if not sources:
+        print("No meeting files found.")
+        return 1
+    start = time.perf_counter()
+    try:
+        store, undated = attendance.AttendanceStore.from_files(sources, args.jobs)
+    except ValueError as e:
+        print(e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Name':<30}{'Office':<28}{'Rate':>6}{'Longest':>9}{'Current':>9}{'Last ' + str(attendance.TREND_MEETINGS):>9}")
+    for summary in store.summaries():
+        print(f"{summary.name:<30}{summary.office:<28}{summary.rate:>6.0%}{summary.longest_streak:>9}"
+              f"{summary.current_streak:>9}{summary.recent_rate:>9.0%}")
+    for source, error in store.failures:
+        print(f"  FAILED     {source}: {error}")
+    print(f"\n{len(store.meeting_days)} meetings, {len(store.names)} people read in {elapsed * 1000:.1f} ms, "
+          f"{undated} left out without a readable Meeting Date, {len(store.failures)} files could not be read")
+    if args.out:
+        report = store.report(config.assembly_info())
+        file_mgr.FileManager().write_minutes(report, args.out)
+        print(f"Report written to {args.out}")
+    return 1 if store.failures else 0
+
+
+def bench_attendance_command(args):
+    """
+    Time reading the attendance of made up monthly meetings, with worker
+    processes and with one process, and working out the report.
+    """
+    import random
+    import resource
+    chooser = random.Random(1)
+    members = [f"Member {number}" for number in range(args.members)]
+    officers = [f"Officer {number}" for number in range(len(schema.OFFICES) * 3)]
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for number in range(args.years * 12):
+            editor_data = schema.default_editor_data()
+            year, month = 1976 + number // 12, number % 12 + 1
+            editor_data['Meeting Info']['Meeting Date'] = f"{month:02d}/10/{year}"
+            # a new set of officers every few years
+            term = number // 36 % 3
+            for office_number, office in enumerate(schema.OFFICES):
+                editor_data['officers'][office] = {
+                    'name': officers[term * len(schema.OFFICES) + office_number],
+                    'attendance': chooser.choices(('Present', 'Absent', 'Excused'), (8, 1, 1))[0]}
+            editor_data['attendees'] = '\n'.join(member for member in members if chooser.random() < 0.4)
+            path = os.path.join(folder, f"meeting{number:04d}.json")
+            with open(path, 'wb') as f:
+                f.write(serializer.dumps(editor_data))
+            paths.append(path)
+
+        timings = []
+        try:
+            for jobs in (args.jobs, 1):
+                start = time.perf_counter()
+                store, undated = attendance.AttendanceStore.from_files(paths, jobs)
+                timings.append((f"read ({jobs} jobs)", time.perf_counter() - start))
+        except ValueError as e:
+            print(e)
+            return 1
+        start = time.perf_counter()
+        summaries = store.summaries()
+        yearly = store.yearly()
+        timings.append(("rates, streaks, trends", time.perf_counter() - start))
+        start = time.perf_counter()
+        report = store.report({'Assembly Name': 'Bench', 'Assembly Number': '0'})
+        file_mgr.FileManager().write_minutes(report, os.path.join(folder, 'attendance.docx'))
+        timings.append(("Word report", time.perf_counter() - start))
+
+    print(f"{len(store.meeting_days)} meetings, {len(summaries)} people, {len(yearly)} years")
+    for name, seconds in timings:
+        print(f"{name:<26}{seconds * 1000:>10.1f} ms")
+    print(f"{'attendance array':<26}{store.codes.nbytes / 1024:>10.1f} KB")
+    print(f"{'array and names':<26}{store.nbytes() / 1024:>10.1f} KB")
+    print(f"{'peak memory':<26}{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:>10.1f} MB")
+    return 0
+
+
+def bench_fields_command(args):
+    """
+    Time the data side of filling and saving the editor tabs for each meeting:
+    one pass reading every field, and one pass comparing every field with
+    changed values, as the editor does when a tab is filled or saved.
+    """
+    sources = find_meeting_files(args.sources)
+    if not sources:
+        print("No meeting files found.")
+        return 1
+
+    populate_total = 0.0
+    save_total = 0.0
+    for source in sources:
+        editor_data = serializer.load_file(source)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            values = schema.read_values(editor_data)
+        populate = (time.perf_counter() - start) / args.repeat
+
+        # every field edited, the worst case for a save
+        edited = {field_id: (dict.fromkeys(value, 'Absent') if isinstance(value, dict) else f"{value} edited")
+                  for field_id, value in values.items()}
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            changes = schema.changes(editor_data, edited)
+        save = (time.perf_counter() - start) / args.repeat
+
+        populate_total += populate
+        save_total += save
+        print(f"{populate * 1e6:8.1f} us populate {save * 1e6:8.1f} us save  {len(changes)} changes  {source}")
+    print(f"\n{len(schema.FIELDS)} fields, {len(sources)} meetings: "
+          f"{populate_total / len(sources) * 1e6:.1f} us populate and {save_total / len(sources) * 1e6:.1f} us save per meeting")
+    return 0
+
+
+def percentiles(times):
+    """
+    Summarize the times of a benchmark.
+    Input: the times in seconds
+    Output: (mean, median, 99th percentile) in milliseconds
+    """
+    times = sorted(times)
+    return (sum(times) / len(times) * 1000, times[len(times) // 2] * 1000,
+            times[min(len(times) - 1, int(len(times) * 0.99))] * 1000)
+
+
+def sample_meeting(meeting_file=None):
+    """Load a meeting for the benchmarks, or make one up with every field filled in."""
+    if meeting_file:
+        return serializer.load_file(meeting_file)
+    editor_data = schema.default_editor_data()
+    for field in schema.FIELDS:
+        if field.kind != 'roll call':
+            journal.set_field(editor_data, field.path, f"{field.label or field.id} text")
+    return editor_data
+
+
+def simulate_saves_command(args):
+    """
+    Replay a meeting being typed in, pressing Save after every field and
+    then once more without changes, and report the FileManager counters.
+    """
+    finished = sample_meeting(args.meeting)
+
+    with tempfile.TemporaryDirectory() as folder:
+        meeting_file = os.path.join(folder, 'meeting.json')
+        manager = file_mgr.FileManager()
+        manager.catalog = catalog.MeetingCatalog(os.path.join(folder, catalog.CATALOG_FILE))
+        edits = journal.EditJournal(os.path.join(folder, journal.JOURNAL_FILE))
+        editor_data = schema.default_editor_data()
+        manager.save_meeting(editor_data, meeting_file)
+        edits.reset(meeting_file)
+
+        values = schema.read_values(finished)
+        for field in schema.FIELDS:
+            for path, value in schema.changes(editor_data, {field.id: values[field.id]}, (field,)):
+                journal.set_field(editor_data, path, value)
+                edits.append(path, value)
+            for _ in range(args.clicks):
+                before = manager.stats['bytes written']
+                if manager.save_meeting(editor_data, meeting_file, changed=edits.count > 0):
+                    edits.reset(meeting_file)
+                    print(f"{manager.stats['bytes written'] - before:8d} bytes  {field.id}")
+        manager.catalog.close()
+        edits.discard()
+
+    stats = manager.stats
+    print(f"\n{stats['saves']} saves, {stats['skipped saves']} skipped, {stats['bytes written']} bytes written, "
+          f"{stats['bytes written'] / max(stats['saves'], 1):.0f} bytes per save")
+    return 0
+
+
+def bench_formats_command(args):
+    """Compare the time to save and load meetings, and their size on disk, in each file format."""
+    editor_data = sample_meeting(args.meeting)
+
+    def save_stdlib(path):
+        with open(path, 'w') as f:
+            json.dump(editor_data, f, indent=4)
+
+    def load_stdlib(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def save_with(file_format):
+        def save(path):
+            with open(path, 'wb') as f:
+                f.write(serializer.dumps(editor_data, file_format))
+        return save
+
+    formats = [('json module', '.json', save_stdlib, load_stdlib),
+               ('json' + (' (orjson)' if serializer.orjson else ''), '.json', save_with('json'), serializer.load_file),
+               ('gzip', '.json.gz', save_with('gzip'), serializer.load_file)]
+    if serializer.zstandard is not None:
+        formats.append(('zstd', '.json.zst', save_with('zstd'), serializer.load_file))
+    else:
+        print("zstandard is not installed, the zstd format is left out.")
+
+    print(f"{'format':<16}{'meetings':>10}{'save ms':>12}{'load ms':>12}{'bytes':>14}")
+    for count in (1, args.count):
+        for name, extension, save, load in formats:
+            with tempfile.TemporaryDirectory() as folder:
+                paths = [os.path.join(folder, f"meeting{number}{extension}") for number in range(count)]
+                start = time.perf_counter()
+                for path in paths:
+                    save(path)
+                save_time = time.perf_counter() - start
+                start = time.perf_counter()
+                for path in paths:
+                    load(path)
+                load_time = time.perf_counter() - start
+                size = sum(os.path.getsize(path) for path in paths)
+            print(f"{name:<16}{count:>10}{save_time * 1000:>12.1f}{load_time * 1000:>12.1f}{size:>14,}")
+    return 0
+
+
+def bench_save_command(args):
+    """
+    Time saving a meeting as Save and the autosave do, through FileManager.write_meeting,
+    in each file format, for the meeting and for a long one, and report the file sizes.
+    """
+    import random
+    chooser = random.Random(1)
+    words = ('the', 'council', 'motion', 'carried', 'brother', 'knights', 'report', 'fund', 'dinner', 'parish',
+             'approved', 'committee', 'charity', 'members', 'degree', 'honor', 'guard', 'color', 'corps', 'dues')
+    editor_data = sample_meeting(args.meeting)
+    long_meeting = sample_meeting(args.meeting)
+    for field in schema.FIELDS:
+        if field.kind == 'text':
+            # a paragraph of made up sentences for every line
+            lines = [' '.join(chooser.choice(words) for _ in range(40)) for _ in range(args.long)]
+            journal.set_field(long_meeting, field.path, '\n'.join(lines))
+    formats = [('json', '.json'), ('gzip', '.json.gz')]
+    if serializer.zstandard is not None:
+        formats.append(('zstd', '.json.zst'))
+    else:
+        print("zstandard is not installed, the zstd format is left out.")
+
+    print(f"{'':<22}{'bytes':>10}{'encode ms':>11}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    with tempfile.TemporaryDirectory() as folder:
+        manager = file_mgr.FileManager()
+        manager.catalog = catalog.MeetingCatalog(os.path.join(folder, catalog.CATALOG_FILE))
+        for meeting_name, meeting in (('meeting', editor_data), (f"long, {args.long} lines", long_meeting)):
+            for name, extension in formats:
+                path = os.path.join(folder, 'meeting' + extension)
+                start = time.perf_counter()
+                for _ in range(args.count):
+                    serializer.dumps(meeting, name)
+                encode = (time.perf_counter() - start) / args.count
+                times = []
+                for _ in range(args.count):
+                    start = time.perf_counter()
+                    manager.write_meeting(meeting, path)
+                    times.append(time.perf_counter() - start)
+                print(f"{meeting_name + ', ' + name:<22}{os.path.getsize(path):>10,}{encode * 1000:>11.2f}"
+                      + ''.join(f"{value:>10.2f}" for value in percentiles(times)))
+        manager.catalog.close()
+    return 0
+
+
+def bench_templates_command(args):
+    """
+    Time Word exports in one process with the parsed template reused, as
+    templates.get_template does, and with the template parsed again for
+    every export, as when each export started from a new Document().
+    The template is shared by every thread, so it is also timed with each
+    export on a new thread, as Export to Word and `minutes export` run them.
+    """
+    import threading
+    import templates
+    editor_data = sample_meeting(args.meeting)
+    assembly_info = {'Assembly Name': 'Bench', 'Assembly Number': '0'}
+
+    def export(times):
+        start = time.perf_counter()
+        # a new FileManager each time, so no section is copied from the section cache
+        file_mgr.FileManager().render_to_bytes(editor_data, assembly_info)
+        times.append(time.perf_counter() - start)
+
+    def on_new_thread(times):
+        thread = threading.Thread(target=export, args=(times,))
+        thread.start()
+        thread.join()
+
+    runs = (('template reused', export, True),
+            ('reused, new threads', on_new_thread, True),
+            ('parsed every time', export, False))
+    print(f"{'':<22}{'exports':>8}{'first ms':>10}{'mean ms':>10}{'total s':>10}")
+    for name, run, reuse in runs:
+        for count in args.counts:
+            templates._template = None
+            times = []
+            for _ in range(count):
+                if not reuse:
+                    templates._template = None
+                run(times)
+            print(f"{name:<22}{count:>8}{times[0] * 1000:>10.1f}{sum(times) / count * 1000:>10.1f}{sum(times):>10.2f}")
+    return 0
+
+
+def bench_reexport_command(args):
+    """
+    Compare a full Word export with exporting again after one field was edited,
+    when the other sections come from the section cache, and with exporting
+    again without changes, when nothing is rendered or written.
+    """
+    editor_data = sample_meeting(args.meeting)
+    assembly_info = config.assembly_info()
+    edited_field = schema.FIELDS_BY_ID['new_business']
+    manager = file_mgr.FileManager()
+
+    with tempfile.TemporaryDirectory() as folder:
+        word_file = os.path.join(folder, 'minutes.docx')
+        manager.write_word(editor_data, word_file, assembly_info)     # load the template first
+
+        def full_export(number):
+            manager.section_cache.clear()
+            journal.set_field(editor_data, edited_field.path, f"Full export {number}")
+            manager.write_word(editor_data, word_file, assembly_info)
+
+        def one_field_edit(number):
+            journal.set_field(editor_data, edited_field.path, f"Edit {number}")
+            manager.write_word(editor_data, word_file, assembly_info)
+
+        def unchanged(number):
+            manager.write_word(editor_data, word_file, assembly_info)
+
+        print(f"{'export':<20}{'mean ms':>10}{'min ms':>10}")
+        for name, export in (('full', full_export), ('one field edited', one_field_edit), ('unchanged', unchanged)):
+            times = []
+            for number in range(args.repeat):
+                start = time.perf_counter()
+                export(number)
+                times.append(time.perf_counter() - start)
+            print(f"{name:<20}{sum(times) / len(times) * 1000:>10.2f}{min(times) * 1000:>10.2f}")
+    cache = manager.section_cache
+    print(f"\nsection cache: {cache.hits} hits, {cache.misses} misses, {len(cache)} sections kept; "
+          f"{manager.stats['exports']} exports written, {manager.stats['skipped exports']} skipped")
+    return 0
+
+
+def bench_config_command(args):
+    """
+    Compare reading assembly.csv for every export, as each new AssemblyInfo does,
+    with the config service, which reads it again only when it changes.
+    """
+    editor_data = sample_meeting(args.meeting)
+    edited_field = schema.FIELDS_BY_ID['new_business']
+    service = config.ConfigService()
+    manager = file_mgr.FileManager()
+
+    def read_config(cached):
+        return service.assembly().assembly_info if cached else assembly.AssemblyInfo().assembly_info
+
+    with tempfile.TemporaryDirectory() as folder:
+        word_file = os.path.join(folder, 'minutes.docx')
+        manager.write_word(editor_data, word_file, read_config(True))     # load the template first
+
+        def config_only(number, cached):
+            read_config(cached)
+
+        def one_field_edit(number, cached):
+            journal.set_field(editor_data, edited_field.path, f"Edit {number} {cached}")
+            manager.write_word(editor_data, word_file, read_config(cached))
+
+        def unchanged(number, cached):
+            manager.write_word(editor_data, word_file, read_config(cached))
+
+        print(f"{'ms per export':<24}{'no cache':>10}{'cached':>10}")
+        for name, export in (('read assembly.csv', config_only), ('one field edit', one_field_edit),
+                             ('unchanged', unchanged)):
+            means = []
+            for cached in (False, True):
+                start = time.perf_counter()
+                for number in range(args.repeat):
+                    export(number, cached)
+                means.append((time.perf_counter() - start) / args.repeat)
+            print(f"{name:<24}{means[0] * 1000:>10.3f}{means[1] * 1000:>10.3f}")
+    print(f"\nconfig service: {service.stats['reads']} reads, {service.stats['hits']} hits")
+    return 0
+
+
+def _session_typist(port, path, keystrokes, interval, start, results):
+    """A laptop in bench-session that types one character every interval seconds."""
+    session = live_session.LiveSession.join('127.0.0.1', port)
+    text = dict(session.state.fields())[path]
+    start.wait()
+    sent = []
+    for number in range(keystrokes):
+        text += 'abcdefghij'[number % 10]
+        sent.append(time.monotonic())
+        session.send([(path, text)])
+        time.sleep(interval)
+    time.sleep(live_session.BATCH_MS * 3 / 1000)
+    results.put(('typist', sent, session.stats))
+    session.close()
+
+
+def _session_reader(port, path, keystrokes, start, ready, results):
+    """A laptop in bench-session that notes when each character arrives."""
+    session = live_session.LiveSession.join('127.0.0.1', port)
+    ready.put(True)
+    arrived = _watch_keystrokes(session, path, keystrokes)
+    results.put(('reader', arrived, session.stats))
+    session.close()
+
+
+def _watch_keystrokes(session, path, keystrokes, timeout=120.0):
+    """Poll a session until keystrokes more characters have arrived. Output: the arrival time of each"""
+    base = len(dict(session.state.fields())[path])
+    arrived = []
+    deadline = time.monotonic() + timeout
+    while len(arrived) < keystrokes and time.monotonic() < deadline:
+        for changed_path, value in session.poll():
+            if changed_path == path:
+                now = time.monotonic()
+                arrived.extend([now] * (len(value) - base - len(arrived)))
+        time.sleep(0.001)
+    return arrived
+
+
+def bench_session_command(args):
+    """
+    Time a live session on this computer: one laptop types into a text box
+    and the time until each character reaches the others is measured, for
+    sessions of different sizes. Every laptop is its own process.
+    """
+    import multiprocessing
+    context = multiprocessing.get_context('spawn')
+    path = schema.FIELDS_BY_ID['attendees'].path
+    editor_data = sample_meeting(args.meeting)
+
+    print(f"{'laptops':>8}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'typist B/key':>14}{'all B/key':>11}"
+          f"{'snapshot B':>12}{'join ms':>9}")
+    for laptops in args.peers:
+        host = live_session.LiveSession.host(editor_data, port=0, address='127.0.0.1')
+        start, ready, results = context.Event(), context.Queue(), context.Queue()
+        readers = [context.Process(target=_session_reader, args=(host.port, path, args.keystrokes, start, ready, results))
+                   for _ in range(laptops - 2)]
+        typist = context.Process(target=_session_typist,
+                                 args=(host.port, path, args.keystrokes, args.interval / 1000, start, results))
+        for process in readers:
+            process.start()
+        for process in readers:
+            ready.get()
+        typist.start()
+        while host.peer_count < laptops - 1:
+            time.sleep(0.01)
+        start.set()
+        arrivals = [_watch_keystrokes(host, path, args.keystrokes)]
+        sent, stats = None, []
+        for _ in range(laptops - 1):
+            role, times, peer_stats = results.get()
+            stats.append(peer_stats)
+            if role == 'typist':
+                sent, typist_stats = times, peer_stats
+            else:
+                arrivals.append(times)
+        for process in readers + [typist]:
+            process.join()
+        stats.append(dict(host.stats))
+
+        # a laptop that joins after the typing is sent a snapshot
+        begin = time.perf_counter()
+        late = live_session.LiveSession.join('127.0.0.1', host.port)
+        join_ms = (time.perf_counter() - begin) * 1000
+        snapshot_bytes = late.stats['bytes received']
+        late.close()
+        host.close()
+
+        delays = [arrived - sent[number] for times in arrivals for number, arrived in enumerate(times)]
+        lost = args.keystrokes * len(arrivals) - len(delays)
+        # the snapshots sent to the laptops as they joined are left out
+        total_bytes = sum(peer_stats['bytes sent'] - peer_stats['snapshot bytes'] for peer_stats in stats)
+        print(f"{laptops:>8}" + ''.join(f"{value:>10.1f}" for value in percentiles(delays))
+              + f"{typist_stats['bytes sent'] / args.keystrokes:>14.1f}{total_bytes / args.keystrokes:>11.1f}"
+              f"{snapshot_bytes:>12}{join_ms:>9.1f}" + (f"  {lost} keystrokes lost" if lost else ''))
+    print(f"\nchanges are sent every {live_session.BATCH_MS} ms; one keystroke every {args.interval} ms")
+    return 0
+
+
+def bench_history_command(args):
+    """
+    Measure the memory of the undo history over many edits, against keeping
+    a copy of the meeting for every step.
+    """
+    import copy
+    import tracemalloc
+    editor_data = sample_meeting(args.meeting)
+    fields = [field for field in schema.FIELDS if field.kind != 'roll call']
+    attendance_path = ('officers', schema.OFFICES[0], 'attendance')
+
+    def edits():
+        """The same edits for every run: a field typed into, and every tenth edit an attendance button."""
+        data = copy.deepcopy(editor_data)
+        for number in range(args.edits):
+            if number % 10 == 9:
+                path, value = attendance_path, schema.ATTENDANCE_CHOICES[number % len(schema.ATTENDANCE_CHOICES)]
+            else:
+                path = fields[number % len(fields)].path
+                value = f"{journal.get_field(data, path, '')} {number}"
+            journal.set_field(data, path, value)
+            yield data, [(path, value)]
+
+    def copies():
+        steps = []
+        for data, changes in edits():
+            steps.append(copy.deepcopy(data))
+        return steps
+
+    def shared(limit_bytes):
+        steps = history.History(editor_data, limit_bytes=limit_bytes)
+        for data, changes in edits():
+            steps.record(changes)
+        return steps
+
+    def strings_only():
+        # the typed values themselves, which every kind of history keeps
+        return [changes for data, changes in edits()]
+
+    print(f"{args.edits} edits of a meeting of {history.tree_size(editor_data) / 1024:.1f} KB")
+    print(f"{'':<28}{'MB':>8}{'bytes/edit':>12}{'us/edit':>10}{'steps kept':>12}{'estimated MB':>14}")
+    runs = (('typed values only', strings_only), ('copy of the meeting', copies),
+            ('shared history', lambda: shared(float('inf'))),
+            (f"shared, {args.limit_mb:g} MB limit", lambda: shared(args.limit_mb * 1024 * 1024)))
+    for name, run in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        kept = run()
+        elapsed = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        if isinstance(kept, history.History):
+            steps, estimate = len(kept.steps) - 1, f"{kept.nbytes / 1024 / 1024:.2f}"
+        else:
+            steps, estimate = len(kept), ''
+        print(f"{name:<28}{used / 1024 / 1024:>8.2f}{used / args.edits:>12.0f}{elapsed / args.edits * 1e6:>10.1f}"
+              f"{steps:>12}{estimate:>14}")
+        del kept
+
+    steps = shared(float('inf'))
+    start = time.perf_counter()
+    while steps.undo() is not None:
+        pass
+    print(f"\nundoing all {args.edits} edits took {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+# The modules the command line tools and the render daemon use; none of them may import tkinter.
+CORE_MODULES = ('file_mgr', 'serializer', 'schema', 'journal', 'catalog', 'sharing', 'history',
+                'live_session', 'render_daemon', 'minutes')
+
+
+def measure_import(module):
+    """
+    Import a module in a new Python with -X importtime.
+    Input: the module name
+    Output: dictionary of the import time in ms, the modules imported, whether tkinter was imported
+    and the peak memory in MB of the process
+    """
+    import subprocess
+    # ru_maxrss keeps the peak of the process that started this one, so read VmHWM where there is /proc
+    code = ("import json, resource, sys, " + module + "\n"
+            "try:\n"
+            "    rss = [int(line.split()[1]) for line in open('/proc/self/status') if line.startswith('VmHWM')][0]\n"
+            "except OSError:\n"
+            "    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+            "print(json.dumps({'tkinter': 'tkinter' in sys.modules, 'modules': len(sys.modules), 'rss': rss / 1024}))")
+    done = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    result = json.loads(done.stdout.splitlines()[-1])
+    # the last line of the report for the module is its own import, with everything it imported
+    for line in done.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            result['ms'] = int(parts[1]) / 1000
+    return result
+
+
+def bench_imports_command(args):
+    """
+    Time importing each of the core modules, and the editor for comparison,
+    in a new Python each time, and check that none of them imports tkinter.
+    """
+    import statistics
+    print(f"{'':<16}{'import ms':>10}{'modules':>9}{'peak MB':>9}  tkinter")
+    leaks = []
+    for module in CORE_MODULES + ('editor',):
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        tkinter = runs[0]['tkinter']
+        if tkinter and module in CORE_MODULES:
+            leaks.append(module)
+        print(f"{module:<16}{statistics.median(run['ms'] for run in runs):>10.1f}{runs[0]['modules']:>9}"
+              f"{statistics.median(run['rss'] for run in runs):>9.1f}  {'yes' if tkinter else 'no'}")
+    if leaks:
+        print(f"\ntkinter is imported by {', '.join(leaks)}")
+        return 1
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='minutes', description="Minutes Editor command line tools.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help="Export meeting JSON files to Word documents.")
+    export_parser.add_argument('sources', nargs='+', help="Directories, glob patterns or JSON files.")
+    export_parser.add_argument('--out', required=True, help="Folder for the Word documents.")
+    export_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    export_parser.add_argument('--force', action='store_true', help="Export even if the Word file is up to date.")
+    export_parser.add_argument('--streaming', action='store_true', help="Use the streaming writer for very large meetings.")
+    export_parser.add_argument('--formats', nargs='+', default=['docx'], choices=['docx', 'html', 'md', 'txt'],
+                               help="Formats to write, all from one pass over each meeting (default docx).")
+    export_parser.set_defaults(func=export_command)
+
+    book_parser = commands.add_parser('book', help="Write a year of meetings into one Word document.")
+    book_parser.add_argument('sources', nargs='+', help="Directories, glob patterns or meeting files.")
+    book_parser.add_argument('--out', required=True, help="The Word file for the book.")
+    book_parser.add_argument('--year', type=int, help="Only the meetings of this year.")
+    book_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    book_parser.set_defaults(func=book_command)
+
+    serve_parser = commands.add_parser('serve', help="Run the render daemon for fast exports from scripts.")
+    serve_parser.add_argument('--socket', default=render_daemon.SOCKET_FILE, help="The socket file.")
+    serve_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    serve_parser.add_argument('--queue', type=int, default=render_daemon.QUEUE_SIZE,
+                              help="Requests accepted beyond the ones being rendered.")
+    serve_parser.set_defaults(func=serve_command)
+
+    bench_daemon_parser = commands.add_parser('bench-daemon', help="Load test the render daemon.")
+    bench_daemon_parser.add_argument('sources', nargs='*', help="Meetings to export. Made up if left out.")
+    bench_daemon_parser.add_argument('--count', type=int, default=200, help="Exports through the daemon.")
+    bench_daemon_parser.add_argument('--clients', type=int, default=8, help="Clients sending at once.")
+    bench_daemon_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Daemon worker processes.")
+    bench_daemon_parser.add_argument('--cold', type=int, default=10, help="Exports each started as a new process.")
+    bench_daemon_parser.set_defaults(func=bench_daemon_command)
+
+    catalog_parser = commands.add_parser('catalog', help="Build and query the meeting catalog.")
+    catalog_parser.add_argument('--db', default=catalog.CATALOG_FILE, help="The catalog database file.")
+    catalog_parser.set_defaults(func=catalog_command)
+    actions = catalog_parser.add_subparsers(dest='action', required=True)
+    rebuild_parser = actions.add_parser('rebuild', help="Index every meeting JSON in a folder.")
+    rebuild_parser.add_argument('directory')
+    for action in ('meetings', 'motions'):
+        action_parser = actions.add_parser(action, help=f"List the {action}.")
+        action_parser.add_argument('--year', type=int)
+    balances_parser = actions.add_parser('balances', help="List the balances of a fund.")
+    balances_parser.add_argument('fund', choices=schema.FUNDS)
+    balances_parser.add_argument('--year', type=int)
+    attendance_parser = actions.add_parser('attendance', help="List the attendance of an officer.")
+    attendance_parser.add_argument('name')
+
+    bench_catalog_parser = commands.add_parser('bench-catalog', help="Time the catalog on made up meetings.")
+    bench_catalog_parser.add_argument('--count', type=int, default=10000, help="The number of meetings.")
+    bench_catalog_parser.add_argument('--repeat', type=int, default=200, help="How many times each query is run.")
+    bench_catalog_parser.set_defaults(func=bench_catalog_command)
+
+    ledger_parser = commands.add_parser('ledger', help="Check the fund balances of every meeting.")
+    ledger_parser.add_argument('sources', nargs='*', help="Directories, glob patterns or meeting files. "
+                                                          "The catalog is used if left out.")
+    ledger_parser.add_argument('--db', default=catalog.CATALOG_FILE, help="The catalog database file.")
+    ledger_parser.add_argument('--year', type=int, help="Only the meetings of this year (catalog only).")
+    ledger_parser.set_defaults(func=ledger_command)
+
+    bench_ledger_parser = commands.add_parser('bench-ledger', help="Time reconciling made up meetings.")
+    bench_ledger_parser.add_argument('--count', type=int, default=10000, help="Number of meetings.")
+    bench_ledger_parser.set_defaults(func=bench_ledger_command)
+
+    attendance_parser = commands.add_parser('attendance', help="Report the attendance of every officer and member.")
+    attendance_parser.add_argument('sources', nargs='+', help="Directories, glob patterns or meeting files.")
+    attendance_parser.add_argument('--out', help="Write the report to a .docx, .html, .md or .txt file.")
+    attendance_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    attendance_parser.set_defaults(func=attendance_command)
+
+    bench_attendance_parser = commands.add_parser('bench-attendance', help="Time the attendance report on made up meetings.")
+    bench_attendance_parser.add_argument('--years', type=int, default=50, help="Years of monthly meetings.")
+    bench_attendance_parser.add_argument('--members', type=int, default=200, help="Members who come to meetings.")
+    bench_attendance_parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    bench_attendance_parser.set_defaults(func=bench_attendance_command)
+
+    bench_parser = commands.add_parser('bench-fields', help="Time reading and comparing the fields of meetings.")
+    bench_parser.add_argument('sources', nargs='+', help="Directories, glob patterns or JSON files.")
+    bench_parser.add_argument('--repeat', type=int, default=1000, help="Passes over each meeting.")
+    bench_parser.set_defaults(func=bench_fields_command)
+
+    simulate_parser = commands.add_parser('simulate-saves', help="Count the bytes written while a meeting is typed in.")
+    simulate_parser.add_argument('meeting', nargs='?', help="A finished meeting to type in. Made up if left out.")
+    simulate_parser.add_argument('--clicks', type=int, default=2, help="Save clicks after each field.")
+    simulate_parser.set_defaults(func=simulate_saves_command)
+
+    formats_parser = commands.add_parser('bench-formats', help="Compare the meeting file formats.")
+    formats_parser.add_argument('meeting', nargs='?', help="The meeting to save and load. Made up if left out.")
+    formats_parser.add_argument('--count', type=int, default=10000, help="Meetings in the large run.")
+    formats_parser.set_defaults(func=bench_formats_command)
+
+    save_parser = commands.add_parser('bench-save', help="Time saving a meeting in each file format.")
+    save_parser.add_argument('meeting', nargs='?', help="The meeting to save. Made up if left out.")
+    save_parser.add_argument('--count', type=int, default=200, help="Saves in each format.")
+    save_parser.add_argument('--long', type=int, default=50, help="Lines of text in each text box of the long meeting.")
+    save_parser.set_defaults(func=bench_save_command)
+
+    templates_parser = commands.add_parser('bench-templates', help="Time Word exports with and without reusing the template.")
+    templates_parser.add_argument('meeting', nargs='?', help="The meeting to export. Made up if left out.")
+    templates_parser.add_argument('--counts', type=int, nargs='+', default=[1, 100, 1000], help="Exports in each run.")
+    templates_parser.set_defaults(func=bench_templates_command)
+
+    reexport_parser = commands.add_parser('bench-reexport', help="Time exporting again after a one field edit.")
+    reexport_parser.add_argument('meeting', nargs='?', help="The meeting to export. Made up if left out.")
+    reexport_parser.add_argument('--repeat', type=int, default=20, help="Exports of each kind.")
+    reexport_parser.set_defaults(func=bench_reexport_command)
+
+    config_parser = commands.add_parser('bench-config', help="Time exports with and without the config cache.")
+    config_parser.add_argument('meeting', nargs='?', help="The meeting to export. Made up if left out.")
+    config_parser.add_argument('--repeat', type=int, default=200, help="Exports of each kind.")
+    config_parser.set_defaults(func=bench_config_command)
+
+    session_parser = commands.add_parser('bench-session', help="Time a live session between processes on this computer.")
+    session_parser.add_argument('meeting', nargs='?', help="The meeting to share. Made up if left out.")
+    session_parser.add_argument('--peers', type=int, nargs='+', default=[2, 5, 20],
+                                help="Laptops in the session, the host and the typist included.")
+    session_parser.add_argument('--keystrokes', type=int, default=200, help="Characters typed.")
+    session_parser.add_argument('--interval', type=float, default=50, help="Milliseconds between keystrokes.")
+    session_parser.set_defaults(func=bench_session_command)
+
+    history_parser = commands.add_parser('bench-history', help="Measure the memory of the undo history.")
+    history_parser.add_argument('meeting', nargs='?', help="The meeting to edit. Made up if left out.")
+    history_parser.add_argument('--edits', type=int, default=10000, help="Edits made.")
+    history_parser.add_argument('--limit-mb', type=float, default=1, help="The memory limit of the last run.")
+    history_parser.set_defaults(func=bench_history_command)
+
+    imports_parser = commands.add_parser('bench-imports', help="Time importing the core modules and check they do not need tkinter.")
+    imports_parser.add_argument('--repeat', type=int, default=5, help="How many times each module is imported.")
+    imports_parser.set_defaults(func=bench_imports_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
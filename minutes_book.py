@@ -0,0 +1,181 @@
+"""
+    The annual minutes book: a year (or several) of meetings in one Word document.
+    The meetings are ordered by their Meeting Date and each one starts on a
+    new page. The book opens with a table of contents of the meetings; Word
+    adds the page numbers when the book is opened.
+
+    Worker processes render the meetings through the usual section
+    printers into Word XML, and the pieces are written into the book in
+    order as they arrive. Only a few meetings are held in memory at a time,
+    however many years the book covers.
+"""
+import collections
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+import catalog
+import document_ir
+import file_mgr
+import ooxml_stream
+import serializer
+import templates
+
+# The identifier that ties the table of contents to the meeting entries.
+TOC_ID = 'M'
+
+# Meetings rendered ahead of the one being written, per worker process.
+AHEAD_PER_JOB = 2
+
+
+def order_meetings(paths, year=None):
+    """
+    Read the Meeting Date of each meeting file and sort the files by it.
+    Meetings whose date cannot be read come last, by file name. Files that
+    cannot be read as meetings are left out of the book.
+    Input: the meeting file paths, a year to keep only the meetings of that year
+    Output: (list of (ISO date or None, Meeting Date as typed, path), list of (path, error) of the files left out)
+    """
+    meetings = []
+    failures = []
+    for path in paths:
+        try:
+            date_text = serializer.load_file(path)['Meeting Info']['Meeting Date']
+            meeting_day = catalog.parse_meeting_date(date_text)
+        except Exception as e:
+            failures.append((path, e))
+            continue
+        if year is not None and (meeting_day is None or not meeting_day.startswith(f"{year:04d}-")):
+            continue
+        meetings.append((meeting_day, date_text, path))
+    meetings.sort(key=lambda meeting: (meeting[0] is None, meeting[0] or '', meeting[2]))
+    return meetings, failures
+
+
+def render_meeting(path, assembly_info):
+    """
+    Render one meeting to the Word XML of its body. Runs inside a worker process.
+    Input: the meeting file path, the assembly info dictionary
+    Output: the XML as bytes
+    """
+    manager = file_mgr.FileManager()
+    template = templates.get_template()
+    minutes = manager.build_minutes(serializer.load_file(path), assembly_info)
+    buffer = io.BytesIO()
+    _write_minutes_xml(manager, minutes, template, buffer)
+    return buffer.getvalue()
+
+
+def _write_minutes_xml(manager, minutes, template, stream):
+    doc = ooxml_stream.StreamingDocument(stream, ooxml_stream.block_width(template))
+    styles = ooxml_stream.StreamingStyleRegistry(template.styles)
+    for section_name, print_section in manager.word_sections(minutes, styles):
+        print_section(doc)
+    doc.flush()
+
+
+def _rendered_in_order(executor, meetings, assembly_info, ahead):
+    """
+    Yield (meeting, XML, None) for the rendered meetings in book order, or (meeting, None, error)
+    for a meeting that could not be rendered. At most `ahead` meetings are
+    being rendered or waiting to be written at any time.
+    """
+    waiting = collections.deque()
+    remaining = iter(meetings)
+
+    def submit_next():
+        meeting = next(remaining, None)
+        if meeting is not None:
+            waiting.append((meeting, executor.submit(render_meeting, meeting[2], assembly_info)))
+
+    for _ in range(ahead):
+        submit_next()
+    while waiting:
+        meeting, future = waiting.popleft()
+        try:
+            rendered = (meeting, future.result(), None)
+        except Exception as e:
+            rendered = (meeting, None, e)
+        submit_next()
+        yield rendered
+
+
+def _toc_entry(meeting_day, date_text, path):
+    """The text of a meeting in the table of contents."""
+    if meeting_day is None:
+        return f"Meeting {serializer.meeting_name(path)}"
+    return f"Meeting of {date_text.strip()}"
+
+
+def toc_xml(entries):
+    """
+    A table of contents field listing the entries. Word is asked to update
+    it when the book is opened, which adds the page numbers.
+    """
+    begin = ('<w:r><w:fldChar w:fldCharType="begin" w:dirty="true"/></w:r>'
+             f'<w:r><w:instrText xml:space="preserve"> TOC \\f {TOC_ID} \\h \\z </w:instrText></w:r>'
+             '<w:r><w:fldChar w:fldCharType="separate"/></w:r>')
+    end = '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+    paragraphs = [ooxml_stream.run_xml(entry) for entry in entries] or ['']
+    paragraphs[0] = begin + paragraphs[0]
+    paragraphs[-1] = paragraphs[-1] + end
+    return ''.join(f'<w:p>{paragraph}</w:p>' for paragraph in paragraphs)
+
+
+def meeting_start_xml(entry):
+    """A page break holding the entry of the meeting that follows in the table of contents."""
+    entry = escape(entry.replace('"', "'"))
+    return ('<w:p><w:r><w:br w:type="page"/></w:r>'
+            '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+            f'<w:r><w:instrText xml:space="preserve"> TC "{entry}" \\f {TOC_ID} \\l 1 </w:instrText></w:r>'
+            '<w:r><w:fldChar w:fldCharType="end"/></w:r></w:p>')
+
+
+def write_book(paths, book_file, assembly_info, year=None, jobs=None):
+    """
+    Write the minutes book. It is written to a temporary file that replaces
+    book_file only when the book is complete.
+    Input: the meeting file paths, the output path, the assembly info dictionary,
+    a year to keep only its meetings, the number of worker processes
+    Output: (the number of meetings in the book, list of (path, error) of the files that could not be read or rendered)
+    """
+    meetings, failures = order_meetings(paths, year)
+    jobs = jobs or os.cpu_count() or 1
+    manager = file_mgr.FileManager()
+    template = templates.get_template()
+
+    front = document_ir.MinutesDocument()
+    front.start_section('Title')
+    front.heading(f"Knights of Columbus {assembly_info['Assembly Name']} {assembly_info['Assembly Number']}", 1, centered=True)
+    front.heading("Minutes of the Business Meetings", 2, centered=True)
+    dated = [date_text.strip() for meeting_day, date_text, path in meetings if meeting_day]
+    if dated:
+        front.paragraph(f"{dated[0]} to {dated[-1]}", centered=True)
+    front.heading("Contents", 2)
+    entries = [_toc_entry(*meeting) for meeting in meetings]
+    written = []
+
+    def write_body(stream):
+        _write_minutes_xml(manager, front, template, stream)
+        stream.write(toc_xml(entries).encode('utf-8'))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            rendered = _rendered_in_order(executor, meetings, assembly_info, jobs * AHEAD_PER_JOB)
+            for entry, (meeting, xml, error) in zip(entries, rendered):
+                if error is not None:
+                    # left out with its table of contents entry, Word lists the others when it updates the table
+                    failures.append((meeting[2], error))
+                    continue
+                stream.write(meeting_start_xml(entry).encode('utf-8'))
+                stream.write(xml)
+                written.append(meeting)
+
+    if meetings:
+        temp_file = f"{book_file}.{os.getpid()}.tmp"
+        try:
+            ooxml_stream.write_package(temp_file, template, write_body)
+            if written:
+                os.replace(temp_file, book_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    return len(written), failures
@@ -0,0 +1,234 @@
+"""
+    Streaming Word writer for very large minutes.
+    python-docx keeps the whole document tree in memory. This writer
+    writes word/document.xml straight into the .docx zip while the
+    sections are printed, so memory use stays flat no matter how long
+    the attendee lists or reports are. It supports the part of the
+    python-docx API used by the FileManager section printers.
+"""
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+import templates
+
+DOCUMENT_PART = 'word/document.xml'
+
+# python-docx measures lengths in EMU, Word tables use twips.
+EMU_PER_TWIP = 635
+
+_BREAKS = re.compile(r'([\t\n\r])')
+
+# The w:jc value of each WD_ALIGN_PARAGRAPH, by its number. python-docx before
+# 1.0 has no xml_value on the alignments, and the numbers are the same in every version.
+_JUSTIFICATION = {0: 'left', 1: 'center', 2: 'right', 3: 'both', 4: 'distribute', 5: 'mediumKashida',
+                  7: 'highKashida', 8: 'lowKashida', 9: 'thaiDistribute'}
+
+
+class _Paragraph:
+    """ A paragraph waiting to be written."""
+
+    def __init__(self, text=''):
+        self.text = text
+        self.style_id = None
+        self.alignment = None
+
+    def to_xml(self):
+        properties = ''
+        if self.style_id:
+            properties += f'<w:pStyle w:val="{self.style_id}"/>'
+        if self.alignment is not None:
+            properties += f'<w:jc w:val="{_JUSTIFICATION[int(self.alignment)]}"/>'
+        if properties:
+            properties = f'<w:pPr>{properties}</w:pPr>'
+        if not properties and not self.text:
+            return '<w:p/>'
+        return f'<w:p>{properties}{run_xml(self.text)}</w:p>'
+
+
+class _Cell:
+    """ A table cell, only its text is used."""
+
+    def __init__(self):
+        self.text = None    # python-docx writes an empty run once text is set
+
+
+class _Row:
+    """ A table row, only its cells are used."""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+
+class _Table:
+    """ A table waiting to be written."""
+
+    def __init__(self, rows, cols, col_width):
+        self.col_width = col_width
+        self.cells = [[_Cell() for col in range(cols)] for row in range(rows)]
+
+    def cell(self, row_idx, col_idx):
+        return self.cells[row_idx][col_idx]
+
+    @property
+    def rows(self):
+        return [_Row(cells) for cells in self.cells]
+
+    def to_xml(self):
+        cols = len(self.cells[0]) if self.cells else 0
+        parts = ['<w:tbl><w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+                 '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+                 'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>']
+        parts.append(f'<w:gridCol w:w="{self.col_width}"/>' * cols)
+        parts.append('</w:tblGrid>')
+        for row in self.cells:
+            parts.append('<w:tr>')
+            for cell in row:
+                text = '<w:p/>' if cell.text is None else f"<w:p>{run_xml(cell.text) or '<w:r/>'}</w:p>"
+                parts.append(f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{self.col_width}"/></w:tcPr>{text}</w:tc>')
+            parts.append('</w:tr>')
+        parts.append('</w:tbl>')
+        return ''.join(parts)
+
+
+class _PageBreak:
+    """ A page break waiting to be written."""
+
+    def to_xml(self):
+        return '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+def run_xml(text):
+    """
+    Convert text to a Word run the way python-docx does.
+    Tabs and line feeds become Word tabs and breaks.
+    """
+    if not text:
+        return ''
+    parts = []
+    for piece in _BREAKS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        else:
+            parts.append(_text_xml(piece))
+    return f"<w:r>{''.join(parts)}</w:r>"
+
+
+def _text_xml(text):
+    if not text:
+        return ''
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+
+class StreamingDocument:
+    """
+    Writes the blocks of a document to a stream as they are added.
+    Each block is held until the next one is added, so the printers can
+    still set its alignment or fill in table cells.
+    """
+
+    def __init__(self, stream, block_width):
+        self.stream = stream
+        self.block_width = block_width
+        self._pending = None
+
+    def add_paragraph(self, text=''):
+        return self._add(_Paragraph(text))
+
+    def add_table(self, rows, cols):
+        col_width = (self.block_width // cols) // EMU_PER_TWIP if cols > 0 else 0
+        return self._add(_Table(rows, cols, col_width))
+
+    def add_page_break(self):
+        return self._add(_PageBreak())
+
+    def _add(self, block):
+        self.flush()
+        self._pending = block
+        return block
+
+    def flush(self):
+        """Write the pending block to the stream."""
+        if self._pending is not None:
+            self.stream.write(self._pending.to_xml().encode('utf-8'))
+            self._pending = None
+
+
+class StreamingStyleRegistry:
+    """ The template style ids, applied to streamed paragraphs."""
+
+    def __init__(self, style_registry):
+        self.style_ids = style_registry.style_ids
+
+    def add_paragraph(self, doc, text, style_name):
+        paragraph = doc.add_paragraph(text)
+        paragraph.style_id = self.style_ids.get(style_name)
+        return paragraph
+
+
+def split_document_xml(document_xml):
+    """
+    Split the template document.xml around the point where the minutes go.
+    Input: the template document.xml
+    Output: (text before the minutes, text after the minutes)
+    """
+    body_start = document_xml.index('<w:body')
+    if document_xml.startswith('<w:body/>', body_start):
+        head = document_xml[:body_start] + '<w:body>'
+        tail = '</w:body>' + document_xml[body_start + len('<w:body/>'):]
+        return head, tail
+    content_start = document_xml.index('>', body_start) + 1
+    body_end = document_xml.rindex('</w:body>')
+    # the minutes go after any template content, before the section properties.
+    section_start = document_xml.rfind('<w:sectPr', content_start, body_end)
+    if section_start == -1:
+        section_start = body_end
+    return document_xml[:section_start], document_xml[section_start:]
+
+
+def block_width(template):
+    """Return the width between the margins of the template, in EMU."""
+    section = template.document.sections[-1]
+    page_width = section.page_width or 7772400      # 8.5 inches
+    left_margin = section.left_margin or 914400     # 1 inch
+    right_margin = section.right_margin or 914400
+    return page_width - left_margin - right_margin
+
+
+def write_docx(word_file, template, sections):
+    """
+    Stream the sections into a .docx file built on the template.
+    Input: the output path or file object, the ExportTemplate,
+    the (section name, printer) pairs from FileManager.word_sections
+    """
+    def write_body(stream):
+        doc = StreamingDocument(stream, block_width(template))
+        for section_name, render_section in sections:
+            render_section(doc)
+        doc.flush()
+
+    write_package(word_file, template, write_body)
+
+
+def write_package(word_file, template, write_body):
+    """
+    Write a .docx file built on the template, with a body written by a function.
+    Input: the output path or file object, the ExportTemplate,
+    a function that writes the body XML to the binary stream it is given
+    """
+    source = zipfile.ZipFile(io.BytesIO(template.data))
+    head, tail = split_document_xml(source.read(DOCUMENT_PART).decode('utf-8'))
+
+    with zipfile.ZipFile(word_file, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            if item.filename != DOCUMENT_PART:
+                target.writestr(templates.fixed_zip_info(item.filename), source.read(item.filename))
+                continue
+            with target.open(templates.fixed_zip_info(DOCUMENT_PART), 'w', force_zip64=True) as stream:
+                stream.write(head.encode('utf-8'))
+                write_body(stream)
+                stream.write(tail.encode('utf-8'))
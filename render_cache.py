@@ -0,0 +1,83 @@
+"""
+    A cache of the Word XML of the sections of the minutes.
+    A section is keyed by a hash of its blocks in the MinutesDocument,
+    which are made from exactly the fields the section prints, and of the
+    template. When the secretary fixes a typo in New Business and exports
+    again, only the Business section is rendered by python-docx; the
+    other sections are copied from the cache.
+
+    The cache keeps the most recently used sections, up to a fixed count.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+import document_ir
+
+# The number of rendered sections kept.
+SECTION_CACHE_SIZE = 256
+
+
+def section_digest(template_key, section_name, blocks):
+    """
+    Return the cache key of a section.
+    Input: the template file and its modification time, the section name, its blocks
+    """
+    return hashlib.blake2b(repr((template_key, section_name, blocks)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SectionCache:
+    """ Least recently used cache of rendered sections. Safe to share between threads."""
+
+    def __init__(self, max_entries=SECTION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()       # digest -> list of XML fragments
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        with self._lock:
+            fragments = self._entries.get(digest)
+            if fragments is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return fragments
+
+    def put(self, digest, fragments):
+        with self._lock:
+            self._entries[digest] = fragments
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def write_section(doc, blocks, styles, cache, digest):
+    """
+    Add a section to a python-docx Document, from the cache if it has been rendered before.
+    Input: the Document, the section blocks, the style registry of the template,
+    the SectionCache, the section_digest of the section
+    """
+    from docx.oxml import parse_xml
+    from lxml import etree
+    body = doc.element.body
+    fragments = cache.get(digest)
+    if fragments is not None:
+        for fragment in fragments:
+            body.insert_element_before(parse_xml(fragment), 'w:sectPr')
+        return
+
+    # python-docx adds the new blocks just before the section properties
+    tail = 1 if body.sectPr is not None else 0
+    start = len(body) - tail
+    document_ir.write_word_blocks(blocks, doc, styles)
+    end = len(body) - tail
+    cache.put(digest, [etree.tostring(element) for element in body[start:end]])
@@ -0,0 +1,222 @@
+"""
+    A resident render service for scripts that export one meeting at a time.
+    Each standalone export starts Python, imports python-docx and reads the
+    Word template before it renders anything. The daemon does that once:
+    its worker processes keep python-docx, the template, the section cache
+    and the assembly info (see config.py) loaded, and the exports are asked
+    for over a Unix socket in the working folder.
+
+        python -m minutes serve --jobs 4
+        python render_daemon.py meeting.json --out minutes.docx minutes.html
+
+    A request is one line of JSON and so is its reply. At most jobs + queue
+    exports are accepted at a time; a request beyond that is answered at
+    once with "busy" and the client tries again a little later, so a burst
+    of requests cannot pile up in the daemon's memory.
+
+    The client below only needs the standard library, so it starts quickly.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+# The socket, in the working folder.
+SOCKET_FILE = 'minutes-render.sock'
+
+# Requests accepted beyond the ones being rendered.
+QUEUE_SIZE = 16
+
+# How long a client keeps trying while the daemon is busy.
+RETRY_SECONDS = 30.0
+
+
+# Client
+def request(message, socket_path=SOCKET_FILE, retry_seconds=RETRY_SECONDS):
+    """
+    Send a request to the daemon and return its reply, trying again while it is busy.
+    Input: the request dictionary, the socket file, how long to keep trying
+    Output: the reply dictionary; raises OSError if the daemon is not running
+    """
+    deadline = time.monotonic() + retry_seconds
+    delay = 0.005
+    while True:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            connection.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            with connection.makefile('rb') as replies:
+                line = replies.readline()
+        if not line:
+            raise OSError("The render daemon closed the connection.")
+        reply = json.loads(line)
+        if not reply.get('busy') or time.monotonic() >= deadline:
+            return reply
+        time.sleep(delay)
+        delay = min(delay * 2, 0.25)
+
+
+def render(source, targets, socket_path=SOCKET_FILE, streaming=False):
+    """
+    Ask the daemon to export a meeting.
+    Input: the meeting file, the output paths (.docx, .html, .md or .txt), the socket file,
+    streaming selects the streaming Word writer
+    Output: the reply, {'ok': True, 'ms': ...} or {'ok': False, 'error': ...}
+    """
+    return request({'op': 'render', 'source': os.path.abspath(source),
+                    'targets': [os.path.abspath(target) for target in targets], 'streaming': streaming},
+                   socket_path)
+
+
+# Worker processes
+_manager = None
+
+
+def _start_worker():
+    """Load python-docx and the template when a worker process starts."""
+    global _manager
+    import file_mgr
+    import templates
+    _manager = file_mgr.FileManager()
+    templates.warm_up()
+
+
+def _render(source, targets, streaming):
+    """
+    Export one meeting in a worker process. The formats are written one after
+    another on this thread, which has the template loaded.
+    Output: the time taken in seconds
+    """
+    import config
+    import serializer
+    start = time.perf_counter()
+    minutes = _manager.build_minutes(serializer.load_file(source), config.assembly_info())
+    for target in targets:
+        _manager.write_minutes(minutes, target, streaming)
+    return time.perf_counter() - start
+
+
+def _ready():
+    return os.getpid()
+
+
+# Server
+class RenderDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ Accepts render requests on a Unix socket and passes them to a pool of worker processes."""
+    daemon_threads = True
+
+    def __init__(self, socket_path=SOCKET_FILE, jobs=None, queue_size=QUEUE_SIZE):
+        from concurrent.futures import ProcessPoolExecutor
+        self.jobs = jobs or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_start_worker)
+        # start every worker now, so the first requests do not wait for them
+        for future in [self.executor.submit(_ready) for _ in range(self.jobs)]:
+            future.result()
+        self._slots = threading.BoundedSemaphore(self.jobs + queue_size)
+        self._stats_lock = threading.Lock()
+        self.stats = {'rendered': 0, 'failed': 0, 'busy': 0}
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, RenderRequestHandler)
+
+    def handle_message(self, message):
+        """Answer one request. Runs on the thread of its connection."""
+        op = message.get('op')
+        if op == 'stats':
+            with self._stats_lock:
+                return dict(self.stats, ok=True, jobs=self.jobs)
+        if op == 'stop':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'ok': True}
+        if op != 'render':
+            return {'ok': False, 'error': f"Unknown request: {op}"}
+
+        if not self._slots.acquire(blocking=False):
+            self._count('busy')
+            return {'ok': False, 'busy': True, 'error': "The render queue is full."}
+        try:
+            seconds = self.executor.submit(_render, message['source'], message['targets'],
+                                           message.get('streaming', False)).result()
+        except Exception as e:
+            self._count('failed')
+            return {'ok': False, 'error': str(e)}
+        finally:
+            self._slots.release()
+        self._count('rendered')
+        return {'ok': True, 'ms': seconds * 1000}
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    """ One connection: read a request line, write the reply line."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            reply = self.server.handle_message(json.loads(line))
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {'ok': False, 'error': f"Bad request: {e}"}
+        self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+def _remove_stale_socket(socket_path):
+    """Remove the socket left by a daemon that did not stop cleanly. Raises OSError if one is running."""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.remove(socket_path)
+            return
+    raise OSError(f"A render daemon is already running on {socket_path}")
+
+
+def serve(socket_path=SOCKET_FILE, jobs=None, queue_size=QUEUE_SIZE):
+    """Run the daemon until it is sent a stop request or interrupted."""
+    daemon = RenderDaemon(socket_path, jobs, queue_size)
+    print(f"Rendering on {socket_path} with {daemon.jobs} workers")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+    print(f"Render daemon stopped: {daemon.stats['rendered']} rendered, {daemon.stats['failed']} failed, "
+          f"{daemon.stats['busy']} turned away while busy")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='render_daemon', description="Export a meeting through the render daemon.")
+    parser.add_argument('meeting', help="The meeting file.")
+    parser.add_argument('--out', nargs='+', required=True, help="The .docx, .html, .md or .txt files to write.")
+    parser.add_argument('--socket', default=SOCKET_FILE, help="The socket of the daemon.")
+    parser.add_argument('--streaming', action='store_true', help="Use the streaming writer for very large meetings.")
+    args = parser.parse_args(argv)
+    try:
+        reply = render(args.meeting, args.out, args.socket, args.streaming)
+    except OSError as e:
+        print(f"The render daemon is not running ({e}). Start it with: python -m minutes serve")
+        return 1
+    if not reply['ok']:
+        print(f"Failed {args.meeting}: {reply['error']}")
+        return 1
+    print(f"Exported {args.meeting} in {reply['ms']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
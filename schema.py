@@ -0,0 +1,353 @@
+"""
+    The fields of a meeting.
+    Every field is described once here: where it is stored in
+    editor_data, how it is edited, where it sits on its tab and how it
+    is printed in the minutes. The editor builds, fills and saves its
+    tabs from this list, FileManager builds a new meeting and prints
+    the minutes from it, and the officer dialog lists OFFICES.
+
+    This module does not use tkinter. The widget options are plain
+    values that editor.py hands to tkinter.
+"""
+import journal
+
+OFFICES = (
+    'Faithful Navigator',
+    'Faithful Friar',
+    'Faithful Admiral',
+    'Faithful Captain',
+    'Faithful Pilot',
+    'Faithful Comptroller',
+    'Faithful Scribe',
+    'Faithful Purser',
+    'Faithful Inner Sentinel',
+    'Faithful Outer Sentinel',
+    'Faithful Trustee (1 Yr)',
+    'Faithful Trustee (2 Yr)',
+    'Faithful Trustee (3 Yr)',
+)
+
+FUNDS = ('General', 'Chalice', 'Flag')
+
+# The amounts of each fund, see ledger.py.
+MONEY_KEYS = ('Start Balance', 'Receipts', 'Deposits', 'Disbursements', 'End Balance')
+
+ATTENDANCE_CHOICES = ('Present', 'Absent', 'Excused')
+
+APPROVAL_CHOICES = ('Approved', 'Corrected', 'Tabled')
+
+# The kinds of field that are typed into. They are stored when their tab is left;
+# the lists and attendance buttons are stored as soon as the user picks a value.
+TYPED_KINDS = ('entry', 'text')
+
+
+class Field:
+    """
+    One field of the meeting.
+    kind is 'entry', 'text' (a scrolled text box), 'choice' (a read only
+    combobox) or 'roll call' (a row of radio buttons for every officer).
+    options are passed to the widget; large selects the display font.
+    """
+    __slots__ = ('id', 'path', 'kind', 'label', 'tab', 'row', 'column', 'sticky',
+                 'label_sticky', 'columnspan', 'large', 'options')
+
+    def __init__(self, id, path, kind, label, tab, row, column=1, sticky='w', label_sticky='w',
+                 columnspan=1, large=False, **options):
+        self.id = id
+        self.path = path
+        self.kind = kind
+        self.label = label
+        self.tab = tab
+        self.row = row
+        self.column = column
+        self.sticky = sticky
+        self.label_sticky = label_sticky
+        self.columnspan = columnspan
+        self.large = large
+        self.options = options
+
+    def __repr__(self):
+        return f"Field({self.id!r}, {self.path!r})"
+
+
+class Tab:
+    """
+    One tab of the editor: its grid weights, the labels that are not
+    tied to a field, and its fields in the order they are created.
+    """
+    __slots__ = ('name', 'rows', 'columns', 'labels', 'save_button', 'ledger_row', 'fields')
+
+    def __init__(self, name, rows=None, columns=None, labels=(), save_button=None, ledger_row=None):
+        self.name = name
+        self.rows = rows or {}          # row -> weight
+        self.columns = columns or {}    # column -> weight
+        self.labels = labels            # (text, row, column, sticky, columnspan)
+        self.save_button = save_button  # the text of a button that saves the tab
+        self.ledger_row = ledger_row    # the row showing the End Balances worked out by ledger.py
+        self.fields = []
+
+
+class Section:
+    """
+    A part of the minutes printed from fields. The steps are
+    ('heading', text, level), ('paragraph', text),
+    ('line', text with {} for the value, field id) and
+    ('bullets', field id), which prints one bullet per line.
+    """
+    __slots__ = ('name', 'steps')
+
+    def __init__(self, name, steps):
+        self.name = name
+        self.steps = steps
+
+
+def _text(id, path, label, tab, row, **layout):
+    return Field(id, path, 'text', label, tab, row, sticky='nsew', wrap='word', **layout)
+
+
+def money_field_id(fund, key):
+    """The id of an amount of a fund, e.g. ('General', 'End Balance') -> 'general_end_balance'."""
+    return f'{fund.lower()}_{key.lower().replace(" ", "_")}'
+
+
+def _money(fund, key, row, column):
+    return Field(money_field_id(fund, key), ('Financials', fund, key), 'entry', None,
+                 'Financial Statement', row, column, sticky='ew', large=True, width=25)
+
+
+# The fields in the order they are stored in a meeting file.
+FIELDS = [
+    # Meeting Info
+    Field('meeting_date', ('Meeting Info', 'Meeting Date'), 'entry', 'Meeting Date:', 'Meeting Info', 0,
+          label_sticky='e', width=30),
+    Field('start_time', ('Meeting Info', 'Start Time'), 'entry', 'Starting Time:', 'Meeting Info', 1,
+          label_sticky='e', width=30),
+
+    # Opening Ceremony
+    Field('opening_intentions', ('Opening Ceremony', 'Intentions'), 'text', 'Intentions:', 'Opening Ceremony', 0,
+          sticky='we', width=80, height=5),
+    Field('opening_prayer', ('Opening Ceremony', 'Prayer'), 'entry', 'Opening Prayer:', 'Opening Ceremony', 1,
+          sticky='we', large=True, width=50),
+    Field('opening_leader', ('Opening Ceremony', 'Leader'), 'entry', 'Led by:', 'Opening Ceremony', 2,
+          sticky='we', large=True, width=50),
+    Field('pledge_leader', ('Opening Ceremony', 'Pledge'), 'entry', 'Pledge led by', 'Opening Ceremony', 3,
+          sticky='we', large=True, width=50),
+
+    # Roll Call
+    Field('attendance', ('officers',), 'roll call', None, 'Roll Call', 1),
+    Field('attendees', ('attendees',), 'text', 'Other Attendees:', 'Roll Call', 14,
+          sticky='nsew', label_sticky='ew', columnspan=4, width=80, height=5),
+
+    # Minutes
+    Field('corrections', ('Minutes', 'Corrections'), 'text', 'Corrections:', 'Minutes', 1, column=2,
+          sticky='we', label_sticky='ew', width=80, height=5),
+    Field('motion_by', ('Minutes', 'Motion to Approve'), 'entry', 'Motion to Approve:', 'Minutes', 2, column=2,
+          label_sticky='ew', large=True, width=50),
+    Field('seconded_by', ('Minutes', 'Seconded by'), 'entry', 'Seconded by:', 'Minutes', 3, column=2,
+          label_sticky='ew', large=True, width=50),
+    Field('approval', ('Minutes', 'Approval'), 'choice', 'Approval:', 'Minutes', 4, column=2,
+          label_sticky='ew', width=20, values=APPROVAL_CHOICES),
+
+    # Reports
+    _text('friar_report', ('Reports', 'Friar'), 'Faithful Friars Report:', 'Reports', 0, label_sticky='nw'),
+    _text('bills', ('Reports', 'Bills'), 'Bills and Communications:', 'Reports', 1),
+    _text('comptroller_report', ('Reports', 'Comptroller'), 'Faithful Comptroller Report:', 'Reports', 2),
+    _text('purser_report', ('Reports', 'Purser'), "Faithful Purser's Report:", 'Reports', 3),
+    _text('committees_report', ('Reports', 'Standing Committees'), 'Standing Committees Report:', 'Reports', 4),
+    _text('applications', ('Reports', 'Applications'), 'Reading of Applications:', 'Reports', 5),
+    _text('trustees_report', ('Reports', 'Trustees'), 'Trustees Report:', 'Reports', 6),
+
+    # Business
+    _text('unfinished_business', ('Business', 'Unfinished Business'), 'Unfinished Business:', 'Business', 0,
+          label_sticky='nw'),
+    _text('new_business', ('Business', 'New Business'), 'New Business:', 'Business', 1, label_sticky='nw'),
+
+    # Council Reports
+    _text('riverside', ('Council Reports', 'Riverside'), 'Riverside:', 'Council Reports', 0, label_sticky='nw'),
+    _text('st_thomas', ('Council Reports', 'St Thomas'), 'St. Thomas:', 'Council Reports', 1, label_sticky='nw'),
+    _text('sacred_heart', ('Council Reports', 'Sacred Heart'), 'Sacred Heart:', 'Council Reports', 2,
+          label_sticky='nw'),
+    _text('olph', ('Council Reports', 'OLPH'), 'Our Lady of Perpetual Help:', 'Council Reports', 3,
+          label_sticky='nw'),
+
+    # Closing Ceremony
+    Field('closing_prayer', ('Closing Ceremony', 'Closing Prayer'), 'entry', 'Closing Prayer:', 'Closing Ceremony', 0,
+          large=True, width=50),
+    _text('closing_intentions', ('Closing Ceremony', 'Intentions'), 'Intentions:', 'Closing Ceremony', 1,
+          label_sticky='nsew', height=5),
+    Field('closing_leader', ('Closing Ceremony', 'Leader'), 'entry', 'Led by:', 'Closing Ceremony', 2,
+          large=True, width=50),
+    Field('adjourned_at', ('Closing Ceremony', 'Adjurned At'), 'entry', 'Meeting Adjourned at:', 'Closing Ceremony', 3,
+          width=30),
+    Field('next_officers_meeting', ('Closing Ceremony', 'Next Officers Meeting'), 'entry', 'Next Officers Meeting:',
+          'Closing Ceremony', 4, width=30),
+    Field('next_business_meeting', ('Closing Ceremony', 'Next Business Meeting'), 'entry', 'Next Business Meeting:',
+          'Closing Ceremony', 5, width=30),
+
+    # Financial Statement, one column per fund
+    *[_money(fund, key, row, column)
+      for column, fund in enumerate(FUNDS, start=1)
+      for row, key in enumerate(MONEY_KEYS, start=1)],
+    _text('withdrawals', ('Financials', 'Withdrawals'), 'Withdrawals', 'Financial Statement', 7,
+          columnspan=3, height=5),
+    _text('deposits', ('Financials', 'Deposits'), 'Deposits', 'Financial Statement', 8, columnspan=3, height=5),
+]
+
+FIELDS_BY_ID = {field.id: field for field in FIELDS}
+
+# The tabs in the order they appear in the notebook.
+TABS = [
+    Tab('Meeting Info'),
+    Tab('Opening Ceremony'),
+    Tab('Roll Call', rows={row: 1 for row in range(15)}, columns={column: 1 for column in range(5)},
+        labels=(('Office', 0, 0, 'w', 1), ('Name', 0, 1, 'w', 1), ('Attendance', 0, 2, 'w', 3))),
+    Tab('Minutes', columns={0: 1, 1: 4}, labels=(('Reading of Minutes:', 0, 0, 'n', 5),)),
+    Tab('Reports', rows={row: 1 for row in range(7)}, columns={0: 1, 1: 3}),
+    Tab('Business', rows={0: 1, 1: 1}, columns={0: 1, 1: 3}),
+    Tab('Council Reports', rows={row: 1 for row in range(4)}, columns={0: 1, 1: 3}),
+    Tab('Financial Statement', rows={7: 1, 8: 1}, columns={column: 1 for column in range(5)},
+        labels=(('General Fund Account', 0, 1, 'n', 1), ('Chalice Special Fund', 0, 2, 'n', 1),
+                ('Flag Special Fund', 0, 3, 'n', 1), ('Starting Balance', 1, 0, 'w', 1),
+                ('Total Receipts', 2, 0, 'w', 1), ('Funds Deposited', 3, 0, 'w', 1),
+                ('Total Disbusements', 4, 0, 'w', 1), ('Ending Balance', 5, 0, 'w', 1),
+                ('Computed Balance', 6, 0, 'w', 1)),
+        # This tab is not used during meetings.
+        save_button='Save Page', ledger_row=6),
+    Tab('Closing Ceremony', rows={1: 1}, columns={0: 1, 1: 3}),
+]
+
+TABS_BY_NAME = {tab.name: tab for tab in TABS}
+for _field in FIELDS:
+    TABS_BY_NAME[_field.tab].fields.append(_field)
+
+# The parts of the minutes printed straight from fields, see FileManager.export_sections.
+SECTIONS = {
+    'Opening Ceremony': Section('Opening Ceremony', (
+        ('heading', "Opening Ceremony", 2),
+        ('paragraph', "Prayer Intentions:"),
+        ('bullets', 'opening_intentions'),
+        ('line', "Prayer: {}", 'opening_prayer'),
+        ('line', "Prayer leg by: {}", 'opening_leader'),
+        ('line', "Pledge of Alligence led by: {}", 'pledge_leader'),
+    )),
+    'Reports': Section('Reports', (
+        ('heading', "Faithful Friar's Report", 2),
+        ('bullets', 'friar_report'),
+        ('heading', "Reading of Minutes", 2),
+        ('bullets', 'corrections'),
+        ('line', "Motion to approve by: {}", 'motion_by'),
+        ('line', "Seconded by: {}", 'seconded_by'),
+        ('line', "Minutes approved: {}", 'approval'),
+        ('heading', "Bills and Communications", 2),
+        ('bullets', 'bills'),
+        ('heading', "Faithful Comptroller's Report", 2),
+        ('bullets', 'comptroller_report'),
+        ('heading', "Purser's Report", 2),
+        ('bullets', 'purser_report'),
+        ('heading', "Standing Committees", 2),
+        ('heading', "Color Corps Commander", 3),
+        ('bullets', 'committees_report'),
+        ('heading', "Reading of Applications", 2),
+        ('bullets', 'applications'),
+        ('heading', "Trustees Report", 2),
+        ('bullets', 'trustees_report'),
+    )),
+    'Business': Section('Business', (
+        ('heading', "Unfinished Business", 2),
+        ('bullets', 'unfinished_business'),
+        ('heading', "New Business", 2),
+        ('bullets', 'new_business'),
+    )),
+    'Council Reports': Section('Council Reports', (
+        ('heading', "Report of the Councils", 2),
+        ('heading', "Riverside", 3),
+        ('bullets', 'riverside'),
+        ('heading', "Saint Thomas", 3),
+        ('bullets', 'st_thomas'),
+        ('heading', "Sacred Heart", 3),
+        ('bullets', 'sacred_heart'),
+        ('heading', "Our Lady of Perpetual Health", 3),
+        ('bullets', 'olph'),
+    )),
+    'Closing Ceremony': Section('Closing Ceremony', (
+        ('heading', "Closing Ceremony", 2),
+        ('line', "Closing prayer led by: {}", 'closing_leader'),
+        ('line', "Closing Prayer: {}", 'closing_prayer'),
+        ('paragraph', "Prayer Intentions:"),
+        ('bullets', 'closing_intentions'),
+        ('line', "Next Officers meeting: {}", 'next_officers_meeting'),
+        ('line', "Next Business Meeting: {}", 'next_business_meeting'),
+    )),
+}
+
+# The fields a new meeting takes from the meeting before it: (field of the new meeting, field of the last one).
+# The officer roster is carried forward too, see carry_forward().
+CARRY_FORWARD = (
+    ('meeting_date', 'next_business_meeting'),
+    ('unfinished_business', 'unfinished_business'),
+    *[(money_field_id(fund, 'Start Balance'), money_field_id(fund, 'End Balance')) for fund in FUNDS],
+)
+
+
+def default_editor_data():
+    """Return the editor data dictionary of a new meeting."""
+    editor_data = {}
+    for field in FIELDS:
+        if field.kind == 'roll call':
+            editor_data['officers'] = {office: {'name': '', 'attendance': ''} for office in OFFICES}
+        else:
+            journal.set_field(editor_data, field.path, '')
+    return editor_data
+
+
+def carry_forward(previous):
+    """
+    Start the next meeting from the last one: its End Balances become the Start Balances,
+    its Unfinished Business and officers stay, and its Next Business Meeting becomes the Meeting Date.
+    Input: the editor data dictionary of the last meeting
+    Output: the editor data dictionary of the new meeting
+    """
+    editor_data = default_editor_data()
+    values = read_values(previous, [FIELDS_BY_ID[source] for target, source in CARRY_FORWARD])
+    for target, source in CARRY_FORWARD:
+        journal.set_field(editor_data, FIELDS_BY_ID[target].path, values[source])
+    for office, officer in editor_data['officers'].items():
+        officer['name'] = previous.get('officers', {}).get(office, {}).get('name', '')
+    return editor_data
+
+
+def read_values(editor_data, fields=FIELDS):
+    """
+    Read the fields of a meeting in one pass.
+    Input: the editor data dictionary, the fields to read
+    Output: dictionary of field id -> value; the roll call is office -> attendance
+    """
+    values = {}
+    for field in fields:
+        if field.kind == 'roll call':
+            officers = editor_data.get('officers', {})
+            values[field.id] = {office: info.get('attendance', '') for office, info in officers.items()}
+        else:
+            values[field.id] = journal.get_field(editor_data, field.path, '')
+    return values
+
+
+def changes(editor_data, values, fields=FIELDS):
+    """
+    Compare values read from the widgets with the meeting.
+    Input: the editor data dictionary, dictionary of field id -> value, the fields compared
+    Output: list of (path, value) for the fields that differ
+    """
+    changed = []
+    for field in fields:
+        if field.id not in values:
+            continue
+        value = values[field.id]
+        if field.kind == 'roll call':
+            for office, attendance in value.items():
+                path = ('officers', office, 'attendance')
+                if journal.get_field(editor_data, path, '') != attendance:
+                    changed.append((path, attendance))
+        elif journal.get_field(editor_data, field.path) != value:
+            changed.append((field.path, value))
+    return changed
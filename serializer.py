@@ -0,0 +1,119 @@
+"""
+    Reading and writing meeting files.
+    The format is chosen by the file name when a meeting is saved:
+
+        meeting.json        JSON that can be read and edited by hand
+        meeting.json.gz     compact JSON compressed with gzip
+        meeting.json.zst    compact JSON compressed with zstd (needs zstandard)
+
+    When a meeting is opened the format is detected from the first
+    bytes of the file, so a renamed file still opens. orjson is used
+    for JSON when it is installed, otherwise the json module.
+"""
+import gzip
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# File name endings of the meeting files, longest first.
+EXTENSIONS = ('.json.zst', '.json.gz', '.json')
+
+# The first bytes of the compressed formats.
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Compression levels: gzip 6 and zstd 3 are the usual speed/size balance.
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def format_for(file_path):
+    """Return 'json', 'gzip' or 'zstd' for a meeting file name."""
+    name = file_path.lower()
+    if name.endswith('.zst'):
+        return 'zstd'
+    if name.endswith('.gz'):
+        return 'gzip'
+    return 'json'
+
+
+def meeting_name(file_path):
+    """Return the file name without its meeting file ending, e.g. 2025-01.json.gz -> 2025-01."""
+    name = os.path.basename(file_path)
+    for extension in EXTENSIONS:
+        if name.lower().endswith(extension):
+            return name[:-len(extension)]
+    return os.path.splitext(name)[0]
+
+
+def is_meeting_file(file_path):
+    return file_path.lower().endswith(EXTENSIONS)
+
+
+def encode_json(editor_data, indent=True):
+    """
+    Convert a meeting to JSON bytes. orjson and the json module give the same bytes,
+    so a file does not change with the packages installed.
+    Input: the editor data dictionary, indent for a file meant to be read by people
+    """
+    if orjson is not None:
+        return orjson.dumps(editor_data, option=orjson.OPT_INDENT_2 if indent else 0)
+    # orjson can only indent by 2 and writes UTF-8 rather than \u escapes
+    if indent:
+        return json.dumps(editor_data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(editor_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def decode_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(editor_data, file_format='json'):
+    """
+    Convert a meeting to the bytes of a meeting file.
+    Input: the editor data dictionary, 'json', 'gzip' or 'zstd'
+    Output: the file contents
+    """
+    if file_format == 'json':
+        return encode_json(editor_data)
+    data = encode_json(editor_data, indent=False)
+    if file_format == 'gzip':
+        # mtime=0 so the same meeting always gives the same file
+        return gzip.compress(data, GZIP_LEVEL, mtime=0)
+    if file_format == 'zstd':
+        if zstandard is None:
+            raise ValueError("Saving .zst meeting files needs the zstandard package.")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unknown meeting file format: {file_format}")
+
+
+def loads(data):
+    """
+    Read the bytes of a meeting file in any of the formats.
+    Input: the file contents
+    Output: the editor data dictionary
+    """
+    if data.startswith(GZIP_MAGIC):
+        data = gzip.decompress(data)
+    elif data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ValueError("Opening .zst meeting files needs the zstandard package.")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return decode_json(data)
+
+
+def load_file(file_path):
+    """Read a meeting file. The format is detected from its contents."""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
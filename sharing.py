@@ -0,0 +1,146 @@
+"""
+    Editing one meeting file from more than one computer.
+    The scribe and the purser may have the same meeting open from a shared
+    folder. A save takes a lock on the meeting file, so two saves cannot
+    interleave, and checks whether the file changed since it was opened or
+    last saved. If it did, the changes from the other computer are merged
+    into this one field by field. Only a field changed on both sides to
+    different values is a conflict, for the user to decide.
+
+    The lock is advisory: it is a lock on meeting.json.lock next to the
+    meeting, held only for the few milliseconds of a save. The empty lock
+    file stays in the folder after the save. It is not removed, because a
+    save waiting on it would then hold a lock on a file that is gone while
+    a third save locks a new one. It can be deleted when nobody is saving,
+    and it is not listed as a meeting.
+"""
+import collections
+import time
+import journal
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# The lock file is the meeting file with this added.
+LOCK_SUFFIX = '.lock'
+
+# How long a save waits for the other computer to finish saving.
+LOCK_TIMEOUT = 10.0
+
+# Stands for a field missing from one side.
+MISSING = object()
+
+# A field both sides changed to different values.
+Conflict = collections.namedtuple('Conflict', 'path base mine theirs')
+
+
+class MeetingLocked(Exception):
+    """ The meeting file stayed locked by another save for longer than LOCK_TIMEOUT."""
+
+
+class MergeConflict(Exception):
+    """ A save found fields changed on both sides and nobody chose which to keep."""
+
+    def __init__(self, conflicts):
+        super().__init__(f"{len(conflicts)} fields were changed on both sides")
+        self.conflicts = conflicts
+
+
+class ChangedOnDisk(Exception):
+    """ The meeting file was changed by someone else; it has to be merged by a Save."""
+
+
+class MeetingLock:
+    """ Holds the lock of a meeting file for a with block."""
+
+    def __init__(self, file_path, timeout=LOCK_TIMEOUT):
+        self.lock_path = file_path + LOCK_SUFFIX
+        self.timeout = timeout
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.lock_path, 'a+b')
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                _lock(self._file)
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self._file.close()
+                    raise MeetingLocked(f"{self.lock_path} is held by another save")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+
+
+def _lock(lock_file):
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(lock_file):
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def changed_paths(base, other, path=()):
+    """
+    List the fields that differ between two versions of a meeting.
+    Only the sections that differ are looked into.
+    Output: list of field paths as tuples
+    """
+    if not isinstance(base, dict) and not isinstance(other, dict):
+        return [path]
+    base = base if isinstance(base, dict) else {}
+    other = other if isinstance(other, dict) else {}
+    paths = []
+    for key in list(base) + [key for key in other if key not in base]:
+        old, new = base.get(key, MISSING), other.get(key, MISSING)
+        if old != new:
+            paths.extend(changed_paths(old, new, path + (key,)))
+    return paths
+
+
+def merge(base, theirs, mine, my_paths=None):
+    """
+    Merge the changes saved by someone else into this meeting.
+    Their changes to fields this side did not change are copied into mine.
+    Input: the meeting as it was when this side last read or wrote the file, the file as it is now,
+    this side's editor data dictionary (changed in place), the paths of the fields this side
+    changed since base (worked out if left out)
+    Output: (the paths copied from theirs, list of Conflict)
+    """
+    if my_paths is None:
+        my_paths = changed_paths(base, mine)
+    mine_changed = {tuple(path) for path in my_paths
+                    if journal.get_field(mine, path, MISSING) != journal.get_field(base, path, MISSING)}
+    taken, conflicts = [], []
+    for path in changed_paths(base, theirs):
+        value = journal.get_field(theirs, path, MISSING)
+        if path not in mine_changed:
+            if value is not MISSING:
+                journal.set_field(mine, path, value)
+                taken.append(path)
+        elif journal.get_field(mine, path, MISSING) != value:
+            conflicts.append(Conflict(path, journal.get_field(base, path, ''), journal.get_field(mine, path, ''),
+                                      '' if value is MISSING else value))
+    return taken, conflicts
+
+
+def field_label(path):
+    """The name of a field for the conflict dialog, e.g. Financials / General / Receipts."""
+    return ' / '.join(path)
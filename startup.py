@@ -0,0 +1,120 @@
+"""
+    Startup profiler for the Minutes Editor.
+    Started with `python main.py --profile-startup`, it times the
+    modules imported while the editor starts and the startup phases,
+    and prints a report once the startup thread has finished.
+
+    When profiling is off every call does nothing.
+"""
+import builtins
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# The number of modules listed in the report.
+REPORT_IMPORTS = 15
+
+
+def memory_mb():
+    """The memory the process is using now in MB, or None where /proc is missing."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_memory_mb():
+    """The most memory the process has used in MB, or None where the resource module is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+class StartupProfile:
+    """ Records how long each part of the startup takes."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.phases = []            # (name, start, seconds, background)
+        self.marks = []             # (name, seconds since start, MB of memory in use or None)
+        self.imports = {}           # module name -> seconds, including the modules it imported
+        self._depth = 0
+        self._import = None
+        self._reported = False
+
+    # Import timing
+    def start_import_timer(self):
+        """Time every import made by the main thread until stop_import_timer()."""
+        if not self.enabled or self._import is not None:
+            return
+        self._import = builtins.__import__
+        main_thread = threading.main_thread()
+
+        def timed_import(name, *args, **kwargs):
+            if name in sys.modules or threading.current_thread() is not main_thread:
+                return self._import(name, *args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return self._import(name, *args, **kwargs)
+            finally:
+                self._depth -= 1
+                self.imports[name] = (time.perf_counter() - start, self._depth)
+
+        builtins.__import__ = timed_import
+
+    def stop_import_timer(self):
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    # Phases
+    @contextmanager
+    def phase(self, name, background=False):
+        """Time a block of the startup. background marks work done off the main thread."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.start, time.perf_counter() - start, background))
+
+    def mark(self, name):
+        """Record the time since the start of the program."""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.start, memory_mb()))
+
+    def report(self):
+        """Print the phases and the slowest imports."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        self.stop_import_timer()
+
+        print("\nStartup profile")
+        print(f"{'phase':<24}{'start ms':>10}{'ms':>10}{'MB':>10}")
+        for name, start, seconds, background in sorted(self.phases, key=lambda phase: phase[1]):
+            label = f"{name} (background)" if background else name
+            print(f"{label:<24}{start * 1000:>10.1f}{seconds * 1000:>10.1f}")
+        for name, seconds, megabytes in self.marks:
+            memory = f"{megabytes:>10.1f}" if megabytes is not None else ''
+            print(f"{name:<24}{seconds * 1000:>10.1f}{'':>10}{memory}")
+        peak = peak_memory_mb()
+        if peak is not None:
+            print(f"{'peak memory':<44}{peak:>10.1f}")
+
+        print("\nSlowest imports (ms, including the modules they import)")
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (seconds, depth) in slowest[:REPORT_IMPORTS]:
+            print(f"{seconds * 1000:>10.1f}  {'  ' * depth}{name}")
+        print(f"{len(self.imports)} modules imported")
@@ -0,0 +1,188 @@
+"""
+    Word templates for the minutes export.
+    The template is read and parsed once per process and shared by every
+    thread. Each thread renders into its own copy of the parsed document,
+    and each export starts from a fresh copy of the template body instead
+    of building a new Document().
+
+    python-docx is imported when the first template is loaded, not when
+    this module is imported, so the editor window opens without it.
+
+    Every export gets the same dates in its properties and zip entries,
+    so the same minutes always give a byte-identical Word file.
+"""
+import datetime
+import io
+import os
+import threading
+import zipfile
+from copy import deepcopy
+
+# A template in the working folder replaces the python-docx default.
+TEMPLATE_FILES = ('template.dotx', 'template.docx')
+
+# The styles used by the minutes.
+STYLE_NAMES = ('Normal', 'Heading 1', 'Heading 2', 'Heading 3', 'List Bullet')
+
+TEMPLATE_CONTENT_TYPE = b'application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml'
+DOCUMENT_CONTENT_TYPE = b'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml'
+
+# The created and modified dates of every export, and the date of its zip entries.
+DOCX_TIMESTAMP = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+ZIP_DATE_TIME = (2000, 1, 1, 0, 0, 0)
+
+# The template of this process, see get_template().
+_template = None
+_template_lock = threading.Lock()
+
+
+def find_template_file():
+    """Return the user supplied template in the working folder, or None."""
+    for template_file in TEMPLATE_FILES:
+        if os.path.exists(template_file):
+            return template_file
+    return None
+
+
+def read_template(template_file):
+    """
+    Read a .docx or .dotx file into the bytes of a .docx package.
+    python-docx only opens documents, so a .dotx is relabelled as one.
+    Input: the template path, or None for the python-docx default
+    Output: the .docx file contents
+    """
+    if template_file is None:
+        from docx import Document
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        return buffer.getvalue()
+
+    with open(template_file, 'rb') as f:
+        data = f.read()
+    if not template_file.lower().endswith('.dotx'):
+        return data
+
+    source = zipfile.ZipFile(io.BytesIO(data))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            contents = source.read(item.filename)
+            if item.filename == '[Content_Types].xml':
+                contents = contents.replace(TEMPLATE_CONTENT_TYPE, DOCUMENT_CONTENT_TYPE)
+            target.writestr(item, contents)
+    return buffer.getvalue()
+
+
+class StyleRegistry:
+    """ The style ids of the template, looked up once by name."""
+
+    def __init__(self, document):
+        from docx.enum.style import WD_STYLE_TYPE
+        self.style_ids = {}
+        default_style = document.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        for name in STYLE_NAMES:
+            try:
+                style = document.styles[name]
+            except KeyError:
+                print(f"The template has no '{name}' style.")
+                continue
+            # the default style is implied, python-docx leaves it out too.
+            self.style_ids[name] = None if style == default_style else style.style_id
+
+    def add_paragraph(self, doc, text, style_name):
+        """
+        Add a paragraph in one of the registered styles.
+        Input: the Word document, the text, the style name
+        Output: the new paragraph
+        """
+        paragraph = doc.add_paragraph(text)
+        style_id = self.style_ids.get(style_name)
+        if style_id:
+            paragraph._p.style = style_id
+        return paragraph
+
+
+class ExportTemplate:
+    """
+    A parsed template that is reused for every export, by every thread.
+    Its document is never changed; the exports are written into copies of it.
+    """
+
+    def __init__(self, template_file=None):
+        from docx import Document
+        self.template_file = template_file
+        self.mtime = os.path.getmtime(template_file) if template_file else None
+        self.data = read_template(template_file)
+        self.document = Document(io.BytesIO(self.data))
+        self.document.core_properties.created = DOCX_TIMESTAMP
+        self.document.core_properties.modified = DOCX_TIMESTAMP
+        # the streaming writer copies the parts of data, give it the fixed dates too
+        self.data = docx_bytes(self.document)
+        self.styles = StyleRegistry(self.document)
+        self._pristine_body = deepcopy(self.document.element.body)
+        self._local = threading.local()     # the copy of document each thread writes into
+
+    def is_current(self, template_file):
+        """Return True if this template still matches the file on disk."""
+        if template_file != self.template_file:
+            return False
+        return template_file is None or os.path.getmtime(template_file) == self.mtime
+
+    def new_document(self):
+        """
+        Reset this thread's copy of the document to the template body.
+        The returned Document is reused by the next call in the same thread, so save it first.
+        Output: the python-docx Document
+        """
+        document = getattr(self._local, 'document', None)
+        if document is None:
+            # copying the parsed document is much cheaper than parsing the template again
+            document = self._local.document = deepcopy(self.document)
+        body = document.element.body
+        for child in list(body):
+            body.remove(child)
+        for child in self._pristine_body:
+            body.append(deepcopy(child))
+        return document
+
+
+def fixed_zip_info(name):
+    """A compressed zip entry dated ZIP_DATE_TIME."""
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def docx_bytes(doc):
+    """
+    Save a python-docx Document with the zip entries dated ZIP_DATE_TIME.
+    python-docx dates them with the current time.
+    Output: the .docx file contents
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    source = zipfile.ZipFile(buffer)
+    fixed = io.BytesIO()
+    with zipfile.ZipFile(fixed, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            target.writestr(fixed_zip_info(item.filename), source.read(item.filename))
+    return fixed.getvalue()
+
+
+def get_template():
+    """Return the export template of this process, loading it if needed or if the template file changed."""
+    global _template
+    template_file = find_template_file()
+    with _template_lock:
+        # a thread that finds the template being loaded waits for it instead of loading its own
+        if _template is None or not _template.is_current(template_file):
+            _template = ExportTemplate(template_file)
+        return _template
+
+
+def warm_up():
+    """
+    Import python-docx and load the template in the background, so the
+    first export does not wait for them.
+    """
+    get_template()
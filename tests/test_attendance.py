@@ -0,0 +1,55 @@
+"""
+    The attendance report skips the meeting files it cannot read and lists
+    them, in the worker processes as well as in one process.
+
+        python -m pytest tests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import attendance
+import schema
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class AttendanceFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write_file(self, name, text):
+        path = os.path.join(self.folder, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_bad_files_are_listed(self):
+        editor_data = schema.default_editor_data()
+        editor_data['Meeting Info']['Meeting Date'] = '01/04/2025'
+        editor_data['attendees'] = 'Sir Knight Member'
+        good = self.write_file('good.json', json.dumps(editor_data))
+        no_date = self.write_file('no_date.json', json.dumps({'attendees': 'Sir Knight Member'}))
+        bad = [self.write_file('list.json', '[1]'),
+               self.write_file('garbage.json', 'not json'),
+               os.path.join(self.folder, 'missing.json')]
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                store, undated = attendance.AttendanceStore.from_files([good, no_date] + bad, jobs)
+                self.assertEqual(store.meeting_days, ['2025-01-04'])
+                self.assertEqual(store.names, ['Sir Knight Member'])
+                self.assertEqual(undated, 1)
+                self.assertEqual([path for path, error in store.failures], bad)
+
+
+if __name__ == '__main__':
+    unittest.main()
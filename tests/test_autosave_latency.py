@@ -0,0 +1,101 @@
+"""
+    The autosave writes in the background, so the window keeps handling
+    events while a large meeting is written to a slow disk.
+
+        python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import autosave
+import file_mgr
+import journal
+import minutes
+import schema
+
+# How long the slow disk takes for every write.
+SLOW_WRITE_S = 0.5
+
+# How often the window is asked to do something while the meeting is saved.
+TICK_MS = 10
+
+# The longest the window may take to get to it.
+MAX_LATENCY_S = 0.1
+
+
+class SlowDiskFileManager(file_mgr.FileManager):
+    """ A FileManager whose writes take as long as on a slow network folder."""
+
+    def write_meeting(self, editor_data, file_path):
+        time.sleep(SLOW_WRITE_S)
+        super().write_meeting(editor_data, file_path)
+
+
+def large_meeting():
+    """A meeting with a thousand lines in every text box."""
+    editor_data = minutes.sample_meeting()
+    for field in schema.FIELDS:
+        if field.kind == 'text':
+            journal.set_field(editor_data, field.path, '\n'.join(f"{field.id} line {number} " * 4 for number in range(1000)))
+    return editor_data
+
+
+class AutosaveLatencyTest(unittest.TestCase):
+
+    def setUp(self):
+        import tkinter as tk
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("no display")
+        self.root.withdraw()
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.root.destroy()
+        shutil.rmtree(self.folder)
+
+    def test_window_responds_while_autosaving(self):
+        import catalog
+        meeting = large_meeting()
+        manager = SlowDiskFileManager()
+        manager.catalog = catalog.MeetingCatalog(os.path.join(self.folder, catalog.CATALOG_FILE))
+        manager.current_file = os.path.join(self.folder, 'meeting.json')
+        saved = []
+        saver = autosave.AutoSaver(self.root, manager, lambda: (meeting, len(saved)),
+                                   lambda file_path, marker: saved.append(time.perf_counter()),
+                                   lambda message: None, idle_ms=50)
+        latencies = []
+
+        def tick(due):
+            latencies.append(time.perf_counter() - due)
+            if saved:
+                self.root.quit()
+            else:
+                self.root.after(TICK_MS, tick, time.perf_counter() + TICK_MS / 1000)
+
+        def edit(number):
+            # a burst of typing, saved once when it stops
+            journal.set_field(meeting, ('Minutes', 'Corrections'), f"correction {number}")
+            saver.touch()
+            if number < 9:
+                self.root.after(20, edit, number + 1)
+
+        started = time.perf_counter()
+        self.root.after(0, edit, 0)
+        self.root.after(TICK_MS, tick, time.perf_counter() + TICK_MS / 1000)
+        self.root.after(int(SLOW_WRITE_S * 1000) * 20, self.root.quit)
+        self.root.mainloop()
+        manager.catalog.close()
+
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(manager.stats['saves'], 1)
+        self.assertGreater(saved[0] - started, SLOW_WRITE_S)
+        self.assertLess(max(latencies), MAX_LATENCY_S)
+        self.assertEqual(manager.load_meeting(manager.current_file), meeting)
+
+
+if __name__ == '__main__':
+    unittest.main()
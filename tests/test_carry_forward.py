@@ -0,0 +1,62 @@
+"""
+    The next meeting starts from the last one: its balances, officers,
+    unfinished business and date are carried forward, and nothing else.
+
+        python -m pytest tests
+"""
+import copy
+import unittest
+import journal
+import schema
+
+
+class CarryForwardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = schema.default_editor_data()
+        journal.set_field(self.previous, ['Meeting Info', 'Meeting Date'], '01/04/2025')
+        journal.set_field(self.previous, ['Closing Ceremony', 'Next Business Meeting'], '02/01/2025')
+        journal.set_field(self.previous, ['Business', 'Unfinished Business'], 'Parish picnic grills')
+        journal.set_field(self.previous, ['Minutes', 'Corrections'], 'None')
+        for number, fund in enumerate(schema.FUNDS):
+            journal.set_field(self.previous, ['Financials', fund, 'Start Balance'], f"{number}00.00")
+            journal.set_field(self.previous, ['Financials', fund, 'Receipts'], '25.00')
+            journal.set_field(self.previous, ['Financials', fund, 'End Balance'], f"{number}25.00")
+        for office in schema.OFFICES:
+            self.previous['officers'][office] = {'name': f"Sir Knight {office}", 'attendance': 'Present'}
+        self.before = copy.deepcopy(self.previous)
+
+    def test_balances_roll_over(self):
+        meeting = schema.carry_forward(self.previous)
+        for number, fund in enumerate(schema.FUNDS):
+            self.assertEqual(meeting['Financials'][fund]['Start Balance'], f"{number}25.00")
+            self.assertEqual(meeting['Financials'][fund]['Receipts'], '')
+            self.assertEqual(meeting['Financials'][fund]['End Balance'], '')
+
+    def test_date_business_and_officers(self):
+        meeting = schema.carry_forward(self.previous)
+        self.assertEqual(meeting['Meeting Info']['Meeting Date'], '02/01/2025')
+        self.assertEqual(meeting['Closing Ceremony']['Next Business Meeting'], '')
+        self.assertEqual(meeting['Business']['Unfinished Business'], 'Parish picnic grills')
+        self.assertEqual(meeting['Minutes']['Corrections'], '')
+        for office in schema.OFFICES:
+            # the officers stay, the roll call is taken again
+            self.assertEqual(meeting['officers'][office], {'name': f"Sir Knight {office}", 'attendance': ''})
+
+    def test_previous_meeting_unchanged(self):
+        meeting = schema.carry_forward(self.previous)
+        self.assertEqual(self.previous, self.before)
+        meeting['Business']['Unfinished Business'] = 'changed'
+        self.assertEqual(self.previous, self.before)
+
+    def test_meeting_with_missing_sections(self):
+        # an older meeting file without the Financials or the officers
+        meeting = schema.carry_forward({'Meeting Info': {'Meeting Date': '01/04/2025'}})
+        self.assertEqual(meeting['Meeting Info']['Meeting Date'], '')
+        for fund in schema.FUNDS:
+            self.assertEqual(meeting['Financials'][fund]['Start Balance'], '')
+        self.assertEqual(meeting['officers'], schema.default_editor_data()['officers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
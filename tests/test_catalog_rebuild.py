@@ -0,0 +1,50 @@
+"""
+    Rebuilding the catalog for one folder keeps the meetings of every other
+    folder, its subfolders and folders whose names only look alike.
+
+        python -m pytest tests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import catalog
+import schema
+
+
+class RebuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.catalog = catalog.MeetingCatalog(os.path.join(self.root, catalog.CATALOG_FILE))
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.root)
+
+    def write_meeting(self, folder, name):
+        folder = os.path.join(self.root, folder)
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, name), 'w') as f:
+            json.dump(schema.default_editor_data(), f)
+
+    def indexed(self):
+        return sorted(os.path.relpath(row['path'], self.root)
+                      for row in self.catalog.query("SELECT path FROM meetings"))
+
+    def test_rebuild_keeps_other_folders(self):
+        # '_' and '%' were wildcards when the old meetings were found with LIKE
+        for folder in ('a_b', 'axb', 'a%', os.path.join('a_b', 'sub')):
+            self.write_meeting(folder, 'm.json')
+            self.catalog.rebuild(os.path.join(self.root, folder))
+        os.remove(os.path.join(self.root, 'a_b', 'm.json'))
+        self.write_meeting('a_b', 'n.json')
+        self.catalog.rebuild(os.path.join(self.root, 'a_b'))
+        self.catalog.rebuild(os.path.join(self.root, 'a%'))
+        self.assertEqual(self.indexed(), sorted(['a_b/n.json', 'axb/m.json', 'a%/m.json',
+                                                 os.path.join('a_b', 'sub', 'm.json')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
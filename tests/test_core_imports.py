@@ -0,0 +1,20 @@
+"""
+    The command line tools and the render daemon run where there is no
+    display, so the modules they use must not import tkinter.
+
+        python -m pytest tests
+"""
+import unittest
+import minutes
+
+
+class CoreImportTest(unittest.TestCase):
+
+    def test_core_modules_do_not_import_tkinter(self):
+        for module in minutes.CORE_MODULES:
+            with self.subTest(module=module):
+                self.assertFalse(minutes.measure_import(module)['tkinter'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+    Undo and redo across the whole meeting. A step shares every part of
+    the meeting it did not change with the step before it.
+
+        python -m pytest tests
+"""
+import unittest
+import history
+import journal
+import schema
+
+DATE = ('Meeting Info', 'Meeting Date')
+CORRECTIONS = ('Minutes', 'Corrections')
+
+
+class HistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.meeting = schema.default_editor_data()
+        self.history = history.History(self.meeting, 'meeting.json')
+
+    def test_undo_redo(self):
+        self.history.record([(DATE, '01/04/2025')])
+        self.history.record([(CORRECTIONS, 'None')])
+        step, changes = self.history.undo()
+        self.assertEqual(step.label, 'Minutes / Corrections')
+        self.assertEqual(changes, [(CORRECTIONS, '')])
+        step, changes = self.history.undo()
+        self.assertEqual(changes, [(DATE, '')])
+        self.assertIsNone(self.history.undo())
+
+        step, changes = self.history.redo()
+        self.assertEqual(changes, [(DATE, '01/04/2025')])
+        self.assertEqual(journal.get_field(self.history.current.meeting, CORRECTIONS), '')
+        # a new edit forgets the step that could be redone
+        self.history.record([(CORRECTIONS, 'typed again')])
+        self.assertFalse(self.history.can_redo())
+        self.assertEqual(journal.get_field(self.history.current.meeting, DATE), '01/04/2025')
+
+    def test_steps_share_unchanged_parts(self):
+        first = self.history.current.meeting
+        self.history.record([(DATE, '01/04/2025')])
+        second = self.history.current.meeting
+        self.assertIsNot(second, first)
+        self.assertIsNot(second['Meeting Info'], first['Meeting Info'])
+        for section in first:
+            if section != 'Meeting Info':
+                self.assertIs(second[section], first[section])
+        # the earlier state is not changed by the step
+        self.assertEqual(first['Meeting Info']['Meeting Date'], '')
+        self.assertLess(self.history.current.size, self.history.steps[0].size)
+
+    def test_states_are_not_the_editor_data(self):
+        self.meeting['Minutes']['Corrections'] = 'changed outside the history'
+        self.assertEqual(journal.get_field(self.history.current.meeting, CORRECTIONS), '')
+
+    def test_oldest_steps_are_forgotten(self):
+        size = self.history.nbytes
+        self.history.limit_bytes = size + 2000
+        for number in range(100):
+            self.history.record([(CORRECTIONS, f"correction {number}")])
+        self.assertLessEqual(self.history.nbytes, self.history.limit_bytes)
+        self.assertGreater(self.history.stats['forgotten'], 0)
+        self.assertEqual(len(self.history.steps) + self.history.stats['forgotten'], 101)
+        self.assertEqual(self.history.nbytes, sum(step.size for step in self.history.steps))
+        while self.history.can_undo():
+            self.history.undo()
+        self.assertNotEqual(journal.get_field(self.history.current.meeting, CORRECTIONS), '')
+
+    def test_replace_is_undone_whole(self):
+        self.history.record([(CORRECTIONS, 'None')])
+        opened = schema.default_editor_data()
+        journal.set_field(opened, DATE, '02/01/2025')
+        self.history.replace(opened, 'other.json', 'open other.json')
+        step = self.history.current
+        self.assertTrue(step.whole)
+        self.assertEqual(step.file, 'other.json')
+        self.assertEqual(step.meeting, opened)
+        self.assertIs(step.meeting['Business'], self.history.steps[0].meeting['Business'])
+
+        step, changes = self.history.undo()
+        self.assertEqual(self.history.current.file, 'meeting.json')
+        self.assertEqual(journal.get_field(self.history.current.meeting, CORRECTIONS), 'None')
+        self.assertEqual(journal.get_field(self.history.current.meeting, DATE), '')
+
+    def test_absorb_adds_no_step(self):
+        self.history.record([(CORRECTIONS, 'None')])
+        self.history.absorb([(DATE, '01/04/2025')])
+        self.assertEqual(len(self.history.steps), 2)
+        self.history.undo()
+        self.assertEqual(journal.get_field(self.history.current.meeting, DATE), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
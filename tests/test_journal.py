@@ -0,0 +1,97 @@
+"""
+    Edits that were not saved are recovered after a crash, and the edits
+    a save has written are dropped from the journal.
+
+        python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import journal
+import schema
+
+
+class JournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.journal_file = os.path.join(self.folder, journal.JOURNAL_FILE)
+        self.meeting_file = os.path.join(self.folder, 'meeting.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def crash(self, edits):
+        """Leave the journal as a session that stopped without saving would."""
+        edits.close()
+        return journal.EditJournal(self.journal_file)
+
+    def test_recover_after_crash(self):
+        edits = journal.EditJournal(self.journal_file)
+        edits.reset(self.meeting_file)
+        meeting = schema.default_editor_data()
+        typed = [(['Meeting Info', 'Meeting Date'], '01/04/2025'),
+                 (['Minutes', 'Corrections'], 'None\nsecond line'),
+                 (['officers', 'Faithful Navigator', 'attendance'], 'Present'),
+                 (['Minutes', 'Corrections'], 'None')]
+        for path, value in typed:
+            journal.set_field(meeting, path, value)
+            edits.append(path, value)
+
+        target_file, entries = self.crash(edits).recover()
+        self.assertEqual(target_file, self.meeting_file)
+        self.assertEqual(entries, typed)
+        recovered = schema.default_editor_data()
+        for path, value in entries:
+            journal.set_field(recovered, path, value)
+        self.assertEqual(recovered, meeting)
+
+    def test_line_cut_short_by_crash(self):
+        edits = journal.EditJournal(self.journal_file)
+        edits.reset(None)
+        edits.append(['Minutes', 'Corrections'], 'kept')
+        edits.close()
+        with open(self.journal_file, 'a') as f:
+            f.write('[["Minutes", "Approv')
+        self.assertEqual(journal.EditJournal(self.journal_file).recover(), (None, [(['Minutes', 'Corrections'], 'kept')]))
+
+    def test_nothing_to_recover(self):
+        self.assertIsNone(journal.EditJournal(self.journal_file).recover())
+        edits = journal.EditJournal(self.journal_file)
+        edits.reset(self.meeting_file)
+        self.assertIsNone(self.crash(edits).recover())
+
+    def test_truncate_after_save(self):
+        edits = journal.EditJournal(self.journal_file)
+        edits.reset(self.meeting_file)
+        edits.append(['Minutes', 'Corrections'], 'saved')
+        edits.append(['Minutes', 'Approval'], 'saved')
+        marker = edits.marker
+        # typed while the save was being written
+        edits.append(['Minutes', 'Corrections'], 'not saved')
+        edits.truncate(marker)
+        self.assertEqual(edits.count, 1)
+        self.assertEqual(edits.dirty_fields(), {('Minutes', 'Corrections')})
+        self.assertEqual(self.crash(edits).recover(), (self.meeting_file, [(['Minutes', 'Corrections'], 'not saved')]))
+
+    def test_marker_from_before_reset_is_ignored(self):
+        edits = journal.EditJournal(self.journal_file)
+        edits.reset(self.meeting_file)
+        edits.append(['Minutes', 'Corrections'], 'old meeting')
+        marker = edits.marker
+        edits.reset(self.meeting_file)
+        edits.append(['Minutes', 'Corrections'], 'new meeting')
+        edits.truncate(marker)
+        self.assertEqual(self.crash(edits).recover(), (self.meeting_file, [(['Minutes', 'Corrections'], 'new meeting')]))
+
+    def test_discard(self):
+        edits = journal.EditJournal(self.journal_file)
+        edits.append(['Minutes', 'Corrections'], 'x')
+        edits.discard()
+        self.assertFalse(os.path.exists(self.journal_file))
+        self.assertIsNone(journal.EditJournal(self.journal_file).recover())
+
+
+if __name__ == '__main__':
+    unittest.main()
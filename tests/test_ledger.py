@@ -0,0 +1,52 @@
+"""
+    The ledger lists the meeting files it cannot read instead of stopping.
+
+        python -m pytest tests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import ledger
+import schema
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class LedgerFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write_file(self, name, text):
+        path = os.path.join(self.folder, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_bad_files_are_listed(self):
+        editor_data = schema.default_editor_data()
+        editor_data['Meeting Info']['Meeting Date'] = '01/04/2025'
+        good = self.write_file('good.json', json.dumps(editor_data))
+        no_date = self.write_file('no_date.json', json.dumps({'Minutes': {}}))
+        bad = [self.write_file('list.json', '[1]'),
+               self.write_file('financials.json', json.dumps({'Meeting Info': {'Meeting Date': '02/04/2025'},
+                                                               'Financials': 'none'})),
+               self.write_file('garbage.json', 'not json'),
+               os.path.join(self.folder, 'missing.json')]
+        meeting_ledger = ledger.Ledger.from_files([good, no_date] + bad)
+        self.assertEqual(meeting_ledger.labels, [f"2025-01-04 {good}"])
+        self.assertEqual([path for path, error in meeting_ledger.failures], bad)
+        self.assertEqual(meeting_ledger.reconcile(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
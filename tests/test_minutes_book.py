@@ -0,0 +1,70 @@
+"""
+    A meeting that cannot be read or rendered is left out of the book and
+    reported; it never leaves a half written book behind.
+
+        python -m pytest tests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import minutes
+import minutes_book
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+ASSEMBLY_INFO = {'Assembly Name': 'Test', 'Assembly Number': '0'}
+
+
+@unittest.skipIf(docx is None, "python-docx is not installed")
+class BookFailureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.book_file = os.path.join(self.folder, 'book.docx')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write_meeting(self, name, editor_data):
+        path = os.path.join(self.folder, name)
+        with open(path, 'w') as f:
+            json.dump(editor_data, f)
+        return path
+
+    def unrenderable_meeting(self):
+        # dated, so it is ordered into the book, but the officers cannot be printed
+        return self.write_meeting('broken.json', {'Meeting Info': {'Meeting Date': '03/04/2025'}, 'officers': 5})
+
+    def test_render_failure_is_reported(self):
+        good = []
+        for month in (1, 2):
+            editor_data = minutes.sample_meeting()
+            editor_data['Meeting Info']['Meeting Date'] = f"{month:02d}/04/2025"
+            good.append(self.write_meeting(f"meeting{month}.json", editor_data))
+        broken = self.unrenderable_meeting()
+        unreadable = self.write_meeting('unreadable.json', {'no meeting': True})
+
+        count, failures = minutes_book.write_book(good + [broken, unreadable], self.book_file, ASSEMBLY_INFO, jobs=1)
+        self.assertEqual(count, 2)
+        self.assertEqual(sorted(path for path, error in failures), sorted([broken, unreadable]))
+        docx.Document(self.book_file)
+        self.assertEqual(sorted(os.listdir(self.folder)), sorted(['book.docx', 'broken.json', 'meeting1.json',
+                                                                  'meeting2.json', 'unreadable.json']))
+
+    def test_failed_book_keeps_old_file(self):
+        with open(self.book_file, 'wb') as f:
+            f.write(b'old book')
+        count, failures = minutes_book.write_book([self.unrenderable_meeting()], self.book_file, ASSEMBLY_INFO, jobs=1)
+        self.assertEqual((count, len(failures)), (0, 1))
+        with open(self.book_file, 'rb') as f:
+            self.assertEqual(f.read(), b'old book')
+        self.assertEqual(sorted(os.listdir(self.folder)), ['book.docx', 'broken.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+    Exporting the same meeting gives the same Word file, and after one
+    field is edited only its section is rendered again.
+
+        python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import file_mgr
+import minutes
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+ASSEMBLY_INFO = {'Assembly Name': 'Test', 'Assembly Number': '0'}
+
+
+@unittest.skipIf(docx is None, "python-docx is not installed")
+class RenderCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.editor_data = minutes.sample_meeting()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_export_twice_gives_same_bytes(self):
+        first = file_mgr.FileManager().render_to_bytes(self.editor_data, ASSEMBLY_INFO)
+        manager = file_mgr.FileManager()
+        self.assertEqual(manager.render_to_bytes(self.editor_data, ASSEMBLY_INFO), first)
+        # the second time every section comes from the cache
+        self.assertEqual(manager.render_to_bytes(self.editor_data, ASSEMBLY_INFO), first)
+        self.assertEqual(manager.section_cache.misses, len(manager.section_cache))
+
+    def test_written_files_are_identical(self):
+        files = [os.path.join(self.folder, name) for name in ('first.docx', 'second.docx')]
+        for word_file in files:
+            file_mgr.FileManager().write_word(self.editor_data, word_file, ASSEMBLY_INFO)
+        contents = []
+        for word_file in files:
+            with open(word_file, 'rb') as f:
+                contents.append(f.read())
+        self.assertEqual(contents[0], contents[1])
+
+    def test_one_field_edit_renders_one_section(self):
+        manager = file_mgr.FileManager()
+        manager.render_to_bytes(self.editor_data, ASSEMBLY_INFO)
+        sections = len(manager.build_minutes(self.editor_data, ASSEMBLY_INFO).sections)
+        manager.section_cache.hits = manager.section_cache.misses = 0
+
+        self.editor_data['Minutes']['Corrections'] = "The date of the last meeting was corrected."
+        edited = manager.render_to_bytes(self.editor_data, ASSEMBLY_INFO)
+        self.assertEqual(manager.section_cache.misses, 1)
+        self.assertEqual(manager.section_cache.hits, sections - 1)
+        # the sections copied from the cache give the same file as rendering them all
+        self.assertEqual(edited, file_mgr.FileManager().render_to_bytes(self.editor_data, ASSEMBLY_INFO))
+
+
+if __name__ == '__main__':
+    unittest.main()
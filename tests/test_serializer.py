@@ -0,0 +1,77 @@
+"""
+    Meetings survive a save and load in every format, the format is found
+    from the file contents, and the bytes do not depend on orjson.
+
+        python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import minutes
+import serializer
+
+
+def unicode_meeting():
+    """A filled in meeting with text the json module would escape."""
+    editor_data = minutes.sample_meeting()
+    editor_data['Minutes']['Corrections'] = "Café – “quoted” élève\nsecond line\ttab  "
+    return editor_data
+
+
+class SerializerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.formats = [('json', '.json'), ('gzip', '.json.gz')]
+        if serializer.zstandard is not None:
+            self.formats.append(('zstd', '.json.zst'))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def save(self, editor_data, name, file_format):
+        path = os.path.join(self.folder, name)
+        with open(path, 'wb') as f:
+            f.write(serializer.dumps(editor_data, file_format))
+        return path
+
+    def test_round_trip(self):
+        editor_data = unicode_meeting()
+        for file_format, extension in self.formats:
+            with self.subTest(format=file_format):
+                path = self.save(editor_data, 'meeting' + extension, serializer.format_for('meeting' + extension))
+                self.assertEqual(serializer.load_file(path), editor_data)
+
+    def test_format_found_from_contents(self):
+        editor_data = unicode_meeting()
+        for file_format, extension in self.formats:
+            with self.subTest(format=file_format):
+                # saved in one format under the name of another
+                path = self.save(editor_data, f"renamed-{file_format}.json", file_format)
+                self.assertEqual(serializer.load_file(path), editor_data)
+
+    def test_same_meeting_same_bytes(self):
+        editor_data = unicode_meeting()
+        for file_format, extension in self.formats:
+            with self.subTest(format=file_format):
+                self.assertEqual(serializer.dumps(editor_data, file_format), serializer.dumps(editor_data, file_format))
+
+    @unittest.skipIf(serializer.orjson is None, "orjson is not installed")
+    def test_bytes_do_not_depend_on_orjson(self):
+        editor_data = unicode_meeting()
+        with_orjson = [serializer.encode_json(editor_data, indent) for indent in (True, False)]
+        orjson, serializer.orjson = serializer.orjson, None
+        try:
+            without_orjson = [serializer.encode_json(editor_data, indent) for indent in (True, False)]
+        finally:
+            serializer.orjson = orjson
+        self.assertEqual(with_orjson, without_orjson)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            serializer.dumps(unicode_meeting(), 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+    Merging the changes saved from another computer into the open meeting.
+
+        python -m pytest tests
+"""
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+import journal
+import schema
+import serializer
+import sharing
+
+
+class MergeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.base = schema.default_editor_data()
+        journal.set_field(self.base, ['Minutes', 'Corrections'], 'None')
+        self.mine = copy.deepcopy(self.base)
+        self.theirs = copy.deepcopy(self.base)
+
+    def test_disjoint_edits(self):
+        journal.set_field(self.mine, ['Minutes', 'Corrections'], 'typed by the scribe')
+        journal.set_field(self.theirs, ['Financials', 'General', 'Receipts'], '125.00')
+        taken, conflicts = sharing.merge(self.base, self.theirs, self.mine)
+        self.assertEqual(taken, [('Financials', 'General', 'Receipts')])
+        self.assertEqual(conflicts, [])
+        self.assertEqual(journal.get_field(self.mine, ['Minutes', 'Corrections']), 'typed by the scribe')
+        self.assertEqual(journal.get_field(self.mine, ['Financials', 'General', 'Receipts']), '125.00')
+
+    def test_same_field_changed_on_both_sides(self):
+        journal.set_field(self.mine, ['Minutes', 'Corrections'], 'mine')
+        journal.set_field(self.theirs, ['Minutes', 'Corrections'], 'theirs')
+        taken, conflicts = sharing.merge(self.base, self.theirs, self.mine)
+        self.assertEqual(taken, [])
+        self.assertEqual(conflicts, [sharing.Conflict(('Minutes', 'Corrections'), 'None', 'mine', 'theirs')])
+        # a conflict is left for the user, mine is not overwritten
+        self.assertEqual(journal.get_field(self.mine, ['Minutes', 'Corrections']), 'mine')
+
+    def test_same_change_on_both_sides(self):
+        journal.set_field(self.mine, ['Minutes', 'Corrections'], 'agreed')
+        journal.set_field(self.theirs, ['Minutes', 'Corrections'], 'agreed')
+        self.assertEqual(sharing.merge(self.base, self.theirs, self.mine), ([], []))
+
+    def test_unchanged_file(self):
+        journal.set_field(self.mine, ['Minutes', 'Corrections'], 'mine')
+        expected = copy.deepcopy(self.mine)
+        self.assertEqual(sharing.merge(self.base, self.theirs, self.mine), ([], []))
+        self.assertEqual(self.mine, expected)
+
+    def test_my_paths_from_journal(self):
+        journal.set_field(self.mine, ['Minutes', 'Corrections'], 'mine')
+        journal.set_field(self.theirs, ['Minutes', 'Corrections'], 'theirs')
+        # only the fields listed are looked at on this side, the edit of Corrections was already saved
+        taken, conflicts = sharing.merge(self.base, self.theirs, self.mine, my_paths=[])
+        self.assertEqual(taken, [('Minutes', 'Corrections')])
+        self.assertEqual(conflicts, [])
+        self.assertEqual(journal.get_field(self.mine, ['Minutes', 'Corrections']), 'theirs')
+
+
+class MeetingLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.meeting_file = os.path.join(self.folder, 'meeting.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_second_save_waits(self):
+        with sharing.MeetingLock(self.meeting_file):
+            with self.assertRaises(sharing.MeetingLocked):
+                with sharing.MeetingLock(self.meeting_file, timeout=0.1):
+                    pass
+        with sharing.MeetingLock(self.meeting_file, timeout=0.1):
+            pass
+
+    def test_lock_file_is_not_a_meeting(self):
+        with sharing.MeetingLock(self.meeting_file):
+            pass
+        self.assertTrue(os.path.exists(self.meeting_file + sharing.LOCK_SUFFIX))
+        self.assertFalse(os.path.exists(self.meeting_file))
+        self.assertFalse(serializer.is_meeting_file(self.meeting_file + sharing.LOCK_SUFFIX))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+    The Word template is parsed once per process, whichever thread
+    exports, and every export starts from the same template body.
+
+        python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import file_mgr
+import minutes
+import templates
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+ASSEMBLY_INFO = {'Assembly Name': 'Test', 'Assembly Number': '0'}
+
+
+@unittest.skipIf(docx is None, "python-docx is not installed")
+class TemplateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.loaded = []
+        export_template = templates.ExportTemplate
+
+        def counted(template_file=None):
+            self.loaded.append(template_file)
+            return export_template(template_file)
+
+        templates._template = None
+        templates.ExportTemplate = counted
+        self.addCleanup(setattr, templates, 'ExportTemplate', export_template)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_publish_parses_template_once(self):
+        editor_data = minutes.sample_meeting()
+        for number in range(5):
+            paths = [os.path.join(self.folder, f"meeting{number}.{extension}") for extension in ('docx', 'html')]
+            file_mgr.FileManager().publish(editor_data, ASSEMBLY_INFO, paths)
+            file_mgr.FileManager().publish(editor_data, ASSEMBLY_INFO, paths[:1])
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_export_threads_parse_template_once(self):
+        # Export to Word writes every export on a new thread, see export_job.py
+        manager = file_mgr.FileManager()
+        editor_data = minutes.sample_meeting()
+        for number in range(5):
+            editor_data['Minutes']['Corrections'] = f"correction {number}"
+            thread = threading.Thread(target=manager.write_word,
+                                      args=(editor_data, os.path.join(self.folder, f"export{number}.docx"), ASSEMBLY_INFO))
+            thread.start()
+            thread.join()
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(len(os.listdir(self.folder)), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
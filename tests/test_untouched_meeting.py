@@ -0,0 +1,83 @@
+"""
+    Looking at a meeting must not change it: showing a tab and leaving it
+    again stores nothing unless the user typed or clicked something.
+
+        python -m pytest tests
+"""
+import types
+import unittest
+import journal
+import schema
+
+
+def sample_meetings():
+    """A new meeting, a carried forward one and one with every typed field filled in."""
+    new = schema.default_editor_data()
+    for office in schema.OFFICES:
+        new['officers'][office]['name'] = f"Sir Knight {office}"
+    new['officers'][schema.OFFICES[-1]]['name'] = 'Vacant'
+    filled = schema.carry_forward(new)
+    for field in schema.FIELDS:
+        if field.kind in schema.TYPED_KINDS:
+            journal.set_field(filled, field.path, f"{field.id} text")
+    return {'new': new, 'carried forward': schema.carry_forward(new), 'filled': filled}
+
+
+class SchemaRoundTripTest(unittest.TestCase):
+    """The values shown for a meeting compare equal to the meeting."""
+
+    def test_read_values_are_no_change(self):
+        for name, meeting in sample_meetings().items():
+            with self.subTest(meeting=name):
+                self.assertEqual(schema.changes(meeting, schema.read_values(meeting)), [])
+
+    def test_attendance_not_taken_is_no_change(self):
+        meeting = schema.default_editor_data()
+        del meeting['officers'][schema.OFFICES[0]]
+        values = {'attendance': {office: '' for office in schema.OFFICES}}
+        self.assertEqual(schema.changes(meeting, values), [])
+
+
+class SwitchTabsTest(unittest.TestCase):
+    """Show every tab of an untouched meeting in turn, as the user would by clicking through them."""
+
+    def setUp(self):
+        import tkinter as tk
+        try:
+            tk.Tk().destroy()
+        except tk.TclError:
+            self.skipTest("no display")
+
+    def make_editor(self, meeting):
+        """An EditorGui without its main loop, the csv files or the journal. Output: (editor, stored changes)"""
+        import tkinter as tk
+        import editor
+        gui = editor.EditorGui.__new__(editor.EditorGui)
+        gui.root = tk.Tk()
+        gui.root.withdraw()
+        gui.low_memory = False
+        gui.session = None
+        gui._config_applied = True
+        gui.officer_data = types.SimpleNamespace(officers={office: {'name': info['name']}
+                                                          for office, info in meeting['officers'].items()})
+        gui.editor_data = meeting
+        stored = []
+        gui._set_fields = lambda changes, **kinds: stored.extend(changes)
+        gui.create_editor_gui()
+        return gui, stored
+
+    def test_switching_tabs_changes_nothing(self):
+        for name, meeting in sample_meetings().items():
+            with self.subTest(meeting=name):
+                gui, stored = self.make_editor(meeting)
+                tabs = gui.notebook.tabs()
+                for tab in tabs[1:] + tabs[:1]:
+                    gui.notebook.select(tab)
+                    gui._on_tab_changed()
+                gui._sync_built_tabs()
+                gui.root.destroy()
+                self.assertEqual(stored, [])
+
+
+if __name__ == '__main__':
+    unittest.main()